@@ -22,7 +22,7 @@ from typing import Any
 
 from pydantic import JsonValue, RootModel
 
-from airflow.api_fastapi.core_api.base import BaseModel
+from airflow.api_fastapi.core_api.base import BaseModel, StrictBaseModel
 
 if sys.version_info < (3, 12):
     # zmievsa/cadwyn#262
@@ -48,3 +48,27 @@ class XComSequenceSliceResponse(RootModel):
     """XCom schema with minimal structure for slice-based access."""
 
     root: list[JsonValue]
+
+
+class XComBulkRequest(StrictBaseModel):
+    """Schema for fetching the XCom values of several tasks and map indexes in one request."""
+
+    key: str
+    task_ids: list[str]
+    map_indexes: list[int] | None = None
+    """Map indexes to fetch. If *None*, the values of all map indexes are returned."""
+    include_prior_dates: bool = False
+
+
+class XComBulkItem(BaseModel):
+    """A single XCom value returned by a bulk request."""
+
+    task_id: str
+    map_index: int
+    value: JsonValue
+
+
+class XComBulkResponse(BaseModel):
+    """XCom values found for a bulk request, ordered by requested task and then by map index."""
+
+    xcoms: list[XComBulkItem]
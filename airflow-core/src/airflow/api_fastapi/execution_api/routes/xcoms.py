@@ -23,16 +23,20 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, Request, Response, status
 from pydantic import BaseModel, JsonValue, StringConstraints
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 from sqlalchemy.sql.selectable import Select
 
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.execution_api.datamodels.xcom import (
+    XComBulkItem,
+    XComBulkRequest,
+    XComBulkResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
 )
 from airflow.api_fastapi.execution_api.deps import JWTBearerDep
+from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
 from airflow.utils.db import get_query_count
@@ -69,6 +73,45 @@ router = APIRouter(
     dependencies=[Depends(has_xcom_access)],
 )
 
+
+def has_xcom_bulk_access(
+    dag_id: str,
+    run_id: str,
+    session: SessionDep,
+    token=JWTBearerDep,
+) -> bool:
+    """Check if the task has access to the XComs of the given DAG run."""
+    log.debug(
+        "Checking read XCom access for xcoms from TaskInstance %s to DAG run %s of %s",
+        token.id,
+        run_id,
+        dag_id,
+    )
+    # The bulk endpoint reads the XComs of any task in the run, so only tasks of that run may use it
+    ti_run = session.execute(
+        select(TaskInstance.dag_id, TaskInstance.run_id).where(TaskInstance.id == str(token.id))
+    ).one_or_none()
+    if ti_run is None or tuple(ti_run) != (dag_id, run_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "reason": "access_denied",
+                "message": f"Task instance {token.id} is not part of DAG run {run_id!r} of {dag_id!r}",
+            },
+        )
+    return True
+
+
+# The bulk endpoint is not scoped to a single task or key, so it can't share the per-XCom
+# access check of ``router`` above.
+bulk_router = APIRouter(
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        status.HTTP_403_FORBIDDEN: {"description": "Task does not have access to the XComs"},
+    },
+    dependencies=[Depends(has_xcom_bulk_access)],
+)
+
 log = logging.getLogger(__name__)
 
 
@@ -316,6 +359,54 @@ def get_mapped_xcom_by_slice(
     return XComSequenceSliceResponse(values)
 
 
+@bulk_router.post(
+    "/{dag_id}/{run_id}/bulk",
+    description="Get XCom values for several tasks and map indexes at once",
+)
+def get_xcoms_bulk(
+    dag_id: str,
+    run_id: str,
+    body: XComBulkRequest,
+    session: SessionDep,
+) -> XComBulkResponse:
+    """
+    Get many Airflow XComs from database - not other XCom Backends.
+
+    When ``map_indexes`` is given, at most one value (the latest one) is returned per task and map
+    index, mirroring single XCom retrieval. Otherwise all values of each task are returned, mirroring
+    the slice endpoint. Entries that don't exist are simply absent from the response.
+    """
+    if not body.task_ids or body.map_indexes == []:
+        return XComBulkResponse(xcoms=[])
+
+    query = XComModel.get_many(
+        run_id=run_id,
+        key=body.key,
+        task_ids=body.task_ids,
+        dag_ids=dag_id,
+        map_indexes=body.map_indexes,
+        include_prior_dates=body.include_prior_dates,
+        session=session,
+    )
+    rows = query.with_entities(XComModel.task_id, XComModel.map_index, XComModel.value)
+
+    if body.map_indexes is not None:
+        # Rows come newest first, so the first one seen for each (task_id, map_index) wins.
+        latest: dict[tuple[str, int], Any] = {}
+        for row in rows:
+            latest.setdefault((row.task_id, row.map_index), row.value)
+        items = [
+            XComBulkItem(task_id=task_id, map_index=map_index, value=value)
+            for (task_id, map_index), value in latest.items()
+        ]
+    else:
+        items = [XComBulkItem(task_id=row.task_id, map_index=row.map_index, value=row.value) for row in rows]
+
+    task_order = {task_id: i for i, task_id in enumerate(body.task_ids)}
+    items.sort(key=lambda item: (task_order[item.task_id], item.map_index))
+    return XComBulkResponse(xcoms=items)
+
+
 if sys.version_info < (3, 12):
     # zmievsa/cadwyn#262
     # Setting this to "Any" doesn't have any impact on the API as it has to be parsed as valid JSON regardless
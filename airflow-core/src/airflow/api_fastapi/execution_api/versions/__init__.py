@@ -26,9 +26,11 @@ from airflow.api_fastapi.execution_api.versions.v2025_08_10 import (
     AddIncludePriorDatesToGetXComSlice,
 )
 from airflow.api_fastapi.execution_api.versions.v2025_09_23 import AddDagVersionIdField
+from airflow.api_fastapi.execution_api.versions.v2025_10_10 import AddXComBulkEndpoint
 
 bundle = VersionBundle(
     HeadVersion(),
+    Version("2025-10-10", AddXComBulkEndpoint),
     Version("2025-09-23", AddDagVersionIdField),
     Version(
         "2025-08-10",
@@ -18,9 +18,10 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 from collections import defaultdict, deque
-from collections.abc import Sequence
+from collections.abc import Iterator, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
@@ -64,6 +65,83 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+class QueuedTasks(MutableMapping["TaskInstanceKey", workloads.ExecuteTask]):
+    """
+    Workloads queued in an executor by task instance key, which can be taken in order of priority.
+
+    Besides the mapping, the workloads are kept in a heap on their ``priority_weight`` (then in the order
+    they were queued), so taking the ``n`` most important of ``N`` workloads costs ``O(n log N)`` rather
+    than sorting them all. Removed workloads are only marked as such in the heap, and dropped from it when
+    they reach its top, or once they make up half of it.
+    """
+
+    # An entry of the heap is [-priority_weight, sequence, key, workload, removed]
+    _KEY, _WORKLOAD, _REMOVED = 2, 3, 4
+
+    def __init__(self, queued: Mapping[TaskInstanceKey, workloads.ExecuteTask] | None = None):
+        self._entries: dict[TaskInstanceKey, list] = {}
+        self._heap: list[list] = []
+        self._removed = 0
+        self._sequence = 0
+        if queued:
+            self.update(queued)
+
+    def __getitem__(self, key: TaskInstanceKey) -> workloads.ExecuteTask:
+        return self._entries[key][self._WORKLOAD]
+
+    def __setitem__(self, key: TaskInstanceKey, workload: workloads.ExecuteTask) -> None:
+        priority = -workload.ti.priority_weight
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == priority:
+            entry[self._WORKLOAD] = workload
+            return
+        if entry is not None:
+            self._remove(entry)
+        entry = [priority, self._sequence, key, workload, False]
+        self._sequence += 1
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def __delitem__(self, key: TaskInstanceKey) -> None:
+        self._remove(self._entries.pop(key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[TaskInstanceKey]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def copy(self) -> QueuedTasks:
+        return QueuedTasks(self)
+
+    def _remove(self, entry: list) -> None:
+        entry[self._REMOVED] = True
+        self._removed += 1
+        if self._removed > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not entry[self._REMOVED]]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def highest_priority(self, count: int) -> list[tuple[TaskInstanceKey, workloads.ExecuteTask]]:
+        """Return up to ``count`` of the workloads with the highest priority, without removing them."""
+        taken: list[list] = []
+        while self._heap and len(taken) < count:
+            entry = heapq.heappop(self._heap)
+            if entry[self._REMOVED]:
+                self._removed -= 1
+            else:
+                taken.append(entry)
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return [(entry[self._KEY], entry[self._WORKLOAD]) for entry in taken]
+
+
 @dataclass
 class RunningRetryAttemptType:
     """
@@ -146,7 +224,7 @@ class BaseExecutor(LoggingMixin):
 
         self.parallelism: int = parallelism
         self.team_id: str | None = team_id
-        self.queued_tasks: dict[TaskInstanceKey, workloads.ExecuteTask] = {}
+        self.queued_tasks: QueuedTasks = QueuedTasks()
         self.running: set[TaskInstanceKey] = set()
         self.event_buffer: dict[TaskInstanceKey, EventBufferValueType] = {}
         self._task_event_logs: deque[Log] = deque()
@@ -301,15 +379,7 @@ class BaseExecutor(LoggingMixin):
 
         :return: List of workloads from the queued_tasks according to the priority.
         """
-        if not self.queued_tasks:
-            return []
-
-        # V3 + new executor that supports workloads
-        return sorted(
-            self.queued_tasks.items(),
-            key=lambda x: x[1].ti.priority_weight,
-            reverse=True,
-        )
+        return self.queued_tasks.highest_priority(len(self.queued_tasks))
 
     @add_debug_span
     def trigger_tasks(self, open_slots: int) -> None:
@@ -318,12 +388,9 @@ class BaseExecutor(LoggingMixin):
 
         :param open_slots: Number of open slots
         """
-        sorted_queue = self.order_queued_tasks_by_priority()
         workload_list = []
 
-        for _ in range(min((open_slots, len(self.queued_tasks)))):
-            key, item = sorted_queue.pop(0)
-
+        for key, item in self.queued_tasks.highest_priority(open_slots):
             # If a task makes it here but is still understood by the executor
             # to be running, it generally means that the task has been killed
             # externally and not yet been marked as failed.
@@ -536,6 +603,18 @@ class BaseExecutor(LoggingMixin):
         """Number of tasks this executor instance is currently managing."""
         return len(self.running) + len(self.queued_tasks)
 
+    def capacity_hint(self) -> int | None:
+        """
+        Estimate how many new tasks the infrastructure behind the executor can start right now.
+
+        The scheduler queues no more tasks for the executor than both this and :attr:`slots_available`
+        allow, so that it does not queue tasks that would only wait for workers to free up. ``None`` means
+        the executor has no such estimate, and only its slots limit how many tasks it gets.
+
+        It is called in each scheduler loop, so executors finding the estimate out remotely should cache it.
+        """
+        return None
+
     def debug_dump(self):
         """Get called in response to SIGUSR2 by the scheduler."""
         self.log.info(
@@ -25,17 +25,23 @@ LocalExecutor.
 
 from __future__ import annotations
 
-import ctypes
 import logging
 import multiprocessing
-import multiprocessing.sharedctypes
+import multiprocessing.connection
 import os
+import socket
 import sys
-from multiprocessing import Queue, SimpleQueue
-from typing import TYPE_CHECKING
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import msgspec
 
 from airflow.executors import workloads
 from airflow.executors.base_executor import PARALLELISM, BaseExecutor
+from airflow.executors.workload_codec import pack_workloads, unpack_workloads
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.state import TaskInstanceState
 
@@ -50,15 +56,69 @@ else:
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
-    TaskInstanceStateType = tuple[workloads.TaskInstance, TaskInstanceState, Exception | None]
+    from airflow.models.dagbag import DagBag
+
 
+class _Channel:
+    """
+    One end of the socket pair between the executor and one of its workers.
 
-def _run_worker(
-    logger_name: str,
-    input: SimpleQueue[workloads.All | None],
-    output: Queue[TaskInstanceStateType],
-    unread_messages: multiprocessing.sharedctypes.Synchronized[int],
-):
+    Messages are sent as msgpack, each prefixed with its length, like between task processes and their
+    supervisor.
+    """
+
+    encoder = msgspec.msgpack.Encoder()
+    decoder = msgspec.msgpack.Decoder()
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self._buffer = bytearray()
+
+    def send(self, message: Any) -> None:
+        frame = bytearray(4)
+        self.encoder.encode_into(message, frame, 4)
+        frame[:4] = (len(frame) - 4).to_bytes(4, byteorder="big")
+        self.sock.sendall(frame)
+
+    def receive(self) -> Any:
+        """Wait for the next message."""
+        length = int.from_bytes(self._receive_exactly(4), byteorder="big")
+        return self.decoder.decode(self._receive_exactly(length))
+
+    def _receive_exactly(self, length: int) -> memoryview:
+        buffer = memoryview(bytearray(length))
+        pos = 0
+        while pos < length:
+            nread = self.sock.recv_into(buffer[pos:])
+            if nread == 0:
+                raise EOFError("The other end closed the connection")
+            pos += nread
+        return buffer
+
+    def receive_available(self) -> list[Any]:
+        """Return the messages that have been received in full so far, without waiting for more."""
+        try:
+            while chunk := self.sock.recv(65536, socket.MSG_DONTWAIT):
+                self._buffer += chunk
+        except BlockingIOError:
+            pass
+
+        messages = []
+        pos = 0
+        while len(self._buffer) - pos >= 4:
+            end = pos + 4 + int.from_bytes(self._buffer[pos : pos + 4], byteorder="big")
+            if len(self._buffer) < end:
+                break
+            messages.append(self.decoder.decode(memoryview(self._buffer)[pos + 4 : end]))
+            pos = end
+        del self._buffer[:pos]
+        return messages
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+def _run_worker(logger_name: str, sock: socket.socket):
     import signal
 
     # Ignore ctrl-c in this process -- we don't want to kill _this_ one. we let tasks run to completion
@@ -67,55 +127,211 @@ def _run_worker(
     log = logging.getLogger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
 
+    channel = _Channel(sock)
+    warm_dag_files = _start_warm(log)
+
     while True:
         setproctitle("airflow worker -- LocalExecutor: <idle>", log)
         try:
-            workload = input.get()
+            message = channel.receive()
         except EOFError:
             log.info(
-                "Failed to read tasks from the task queue because the other "
+                "Failed to read tasks from the executor because the other "
                 "end has closed the connection. Terminating worker %s.",
                 multiprocessing.current_process().name,
             )
             break
 
-        if workload is None:
+        if message is None:
             # Received poison pill, no more tasks to run
             return
 
-        if not isinstance(workload, workloads.ExecuteTask):
-            raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
-
-        # Decrement this as soon as we pick up a message off the queue
-        with unread_messages:
-            unread_messages.value -= 1
-        key = None
-        if ti := getattr(workload, "ti", None):
-            key = ti.key
-        else:
-            raise TypeError(f"Don't know how to get ti key from {type(workload).__name__}")
+        (workload,) = unpack_workloads(message)
 
+        key = workload.ti.key
         try:
-            _execute_work(log, workload)
+            _execute_work(log, workload, warm_dag_files)
 
-            output.put((key, TaskInstanceState.SUCCESS, None))
+            channel.send((key, TaskInstanceState.SUCCESS, None))
         except Exception as e:
             log.exception("uhoh")
-            output.put((key, TaskInstanceState.FAILED, e))
+            # The exception itself can't be sent over, so the executor gets its description
+            channel.send((key, TaskInstanceState.FAILED, repr(e)))
+
+
+def _start_warm(log: logging.Logger) -> _WarmDagFiles | None:
+    """
+    Import what task processes need up front if this worker is to stay warm.
+
+    Task processes are forked from the worker, so everything imported here is already imported in them.
+    """
+    from airflow.configuration import conf
+
+    if not conf.getboolean("core", "local_executor_warm_workers", fallback=False):
+        return None
+
+    from airflow.providers_manager import ProvidersManager
+    from airflow.sdk.execution_time import supervisor, task_runner  # noqa: F401
+
+    ProvidersManager().initialize_providers_hooks()
+    return _WarmDagFiles(
+        max_size=conf.getint("core", "local_executor_warm_dag_files", fallback=32),
+        parse_timeout=conf.getfloat("core", "dagbag_import_timeout"),
+    )
+
+
+@dataclass
+class _WarmDagFile:
+    bundle_version: str | None
+    bundle_path: str
+    dag_bag: DagBag
+    mtimes: dict[str, float]
+
+    def is_modified(self) -> bool:
+        """Whether any of the bundle files that were imported has changed since."""
+        try:
+            return any(os.stat(path).st_mtime != mtime for path, mtime in self.mtimes.items())
+        except OSError:
+            return True
+
+
+class _WarmDagFiles:
+    """
+    DAG files a warm worker keeps parsed for the task processes it forks.
 
+    A DAG file is parsed in the worker the first time one of its tasks runs there, and the DagBag is passed on
+    to the task processes of later tasks of that file through ``task_runner.PREPARSED_DAG_BAGS``. Only one
+    version of a bundle is kept: when a task of another bundle version comes in, or, for bundles without
+    versions, when a bundle file that was imported changes, everything imported from the bundle is dropped.
 
-def _execute_work(log: logging.Logger, workload: workloads.ExecuteTask) -> None:
+    :param max_size: How many DAG files to keep parsed, the least recently used are dropped first
+    :param parse_timeout: How many seconds parsing a DAG file, bundle initialization included, may take before
+        it is left to the task process. 0 means no limit
+    """
+
+    def __init__(self, max_size: int, parse_timeout: float = 0):
+        self.max_size = max_size
+        self.parse_timeout = max(parse_timeout, 0)
+        self._files: OrderedDict[tuple[str, str], _WarmDagFile] = OrderedDict()
+
+    def prepare(self, log: logging.Logger, workload: workloads.ExecuteTask) -> None:
+        """Make sure the DAG file of the workload is parsed before its task process is forked."""
+        bundle_name, bundle_version = workload.bundle_info.name, workload.bundle_info.version
+        key = (bundle_name, os.fspath(workload.dag_rel_path))
+
+        if any(
+            warm.bundle_version != bundle_version or (bundle_version is None and warm.is_modified())
+            for (name, _), warm in self._files.items()
+            if name == bundle_name
+        ):
+            self._drop_bundle(bundle_name)
+        elif warm := self._files.get(key):
+            if workload.ti.task_id in getattr(warm.dag_bag.dags.get(workload.ti.dag_id), "task_dict", ()):
+                self._files.move_to_end(key)
+                return
+            # The DAG file was parsed for another task and did not create this one (it might only create
+            # the task it is parsed for), so parse it again for this one.
+            self._drop(key)
+
+        from airflow.exceptions import AirflowTaskTimeout
+        from airflow.models.dagbag import timeout
+
+        # A DAG file that hangs or exits must not take the worker down with it
+        try:
+            with timeout(self.parse_timeout, error_message=f"Parsing {workload.dag_rel_path} timed out"):
+                warm = self._parse(workload)
+        except (Exception, SystemExit, AirflowTaskTimeout):
+            log.warning("Could not parse %s ahead of its task", workload.dag_rel_path, exc_info=True)
+            return
+        if warm is None:
+            return
+
+        from airflow.sdk.execution_time.task_runner import PREPARSED_DAG_BAGS
+
+        self._files[key] = warm
+        PREPARSED_DAG_BAGS[(bundle_name, warm.bundle_version, key[1])] = warm.dag_bag
+        while len(self._files) > self.max_size:
+            self._drop(next(iter(self._files)))
+
+    def _parse(self, workload: workloads.ExecuteTask) -> _WarmDagFile | None:
+        from airflow.dag_processing.bundles.manager import DagBundlesManager
+        from airflow.models.dagbag import DagBag
+        from airflow.sdk.definitions._internal.dag_parsing_context import _airflow_parsing_context_manager
+
+        # Parse the DAG file just like the task process would, see task_runner.parse
+        bundle = DagBundlesManager().get_bundle(
+            name=workload.bundle_info.name, version=workload.bundle_info.version
+        )
+        bundle.initialize()
+        bundle_path = os.fspath(bundle.path)
+        if bundle_path not in sys.path:
+            sys.path.append(bundle_path)
+
+        with _airflow_parsing_context_manager(dag_id=workload.ti.dag_id, task_id=workload.ti.task_id):
+            dag_bag = DagBag(
+                dag_folder=os.fspath(Path(bundle_path, workload.dag_rel_path)),
+                include_examples=False,
+                safe_mode=False,
+                load_op_links=False,
+            )
+        if workload.ti.task_id not in getattr(dag_bag.dags.get(workload.ti.dag_id), "task_dict", ()):
+            # Leave it to the task process to report the DAG file's import errors
+            return None
+
+        mtimes = {}
+        if workload.bundle_info.version is None:
+            mtimes = {path: os.stat(path).st_mtime for path in _bundle_modules(bundle_path).values()}
+        return _WarmDagFile(workload.bundle_info.version, bundle_path, dag_bag, mtimes)
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        from airflow.sdk.execution_time.task_runner import PREPARSED_DAG_BAGS
+        from airflow.utils.file import get_unique_dag_module_name
+
+        warm = self._files.pop(key)
+        PREPARSED_DAG_BAGS.pop((key[0], warm.bundle_version, key[1]), None)
+        sys.modules.pop(get_unique_dag_module_name(os.fspath(Path(warm.bundle_path, key[1]))), None)
+
+    def _drop_bundle(self, bundle_name: str) -> None:
+        bundle_paths = set()
+        for key in [key for key in self._files if key[0] == bundle_name]:
+            bundle_paths.add(self._files[key].bundle_path)
+            self._drop(key)
+
+        for bundle_path in bundle_paths:
+            for name in _bundle_modules(bundle_path):
+                sys.modules.pop(name, None)
+            if bundle_path in sys.path:
+                sys.path.remove(bundle_path)
+
+
+def _bundle_modules(bundle_path: str) -> dict[str, str]:
+    """Return the names and files of the modules that were imported from the bundle at the given path."""
+    prefix = os.path.join(bundle_path, "")
+    return {
+        name: file
+        for name, module in list(sys.modules.items())
+        if isinstance(file := getattr(module, "__file__", None), str) and file.startswith(prefix)
+    }
+
+
+def _execute_work(
+    log: logging.Logger, workload: workloads.ExecuteTask, warm_dag_files: _WarmDagFiles | None = None
+) -> None:
     """
     Execute command received and stores result state in queue.
 
     :param key: the key to identify the task instance
     :param command: the command to execute
+    :param warm_dag_files: The DAG files kept parsed by the worker, if it is a warm one
     """
     from airflow.configuration import conf
     from airflow.sdk.execution_time.supervisor import supervise
 
     setproctitle(f"airflow worker -- LocalExecutor: {workload.ti.id}", log)
 
+    if warm_dag_files is not None:
+        warm_dag_files.prepare(log, workload)
+
     base_url = conf.get("api", "base_url", fallback="/")
     # If it's a relative URL, use localhost:8080 as the default
     if base_url.startswith("/"):
@@ -139,7 +355,8 @@ class LocalExecutor(BaseExecutor):
     """
     LocalExecutor executes tasks locally in parallel.
 
-    It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
+    It uses the multiprocessing Python library to start worker processes, and hands each idle worker one task
+    at a time over a socket pair of its own.
 
     :param parallelism: how many parallel processes are run in the executor
     """
@@ -148,10 +365,10 @@ class LocalExecutor(BaseExecutor):
 
     serve_logs: bool = True
 
-    activity_queue: SimpleQueue[workloads.All | None]
-    result_queue: SimpleQueue[TaskInstanceStateType]
     workers: dict[int, multiprocessing.Process]
-    _unread_messages: multiprocessing.sharedctypes.Synchronized[int]
+    _channels: dict[int, _Channel]
+    _idle_workers: deque[int]
+    _pending: deque[workloads.ExecuteTask]
 
     def __init__(self, parallelism: int = PARALLELISM):
         super().__init__(parallelism=parallelism)
@@ -160,59 +377,56 @@ class LocalExecutor(BaseExecutor):
 
     def start(self) -> None:
         """Start the executor."""
-        # We delay opening these queues until the start method mostly for unit tests. ExecutorLoader caches
-        # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the queues, then test 2
-        # comes back and gets the same LocalExecutor instance, so we have to open new here.)
-        self.activity_queue = SimpleQueue()
-        self.result_queue = SimpleQueue()
+        # We delay setting these up until the start method mostly for unit tests. ExecutorLoader caches
+        # instances, so each test reusues the same instance! (i.e. test 1 runs, closes the workers, then test
+        # 2 comes back and gets the same LocalExecutor instance, so we have to start afresh here.)
         self.workers = {}
-
-        # Mypy sees this value as `SynchronizedBase[c_uint]`, but that isn't the right runtime type behaviour
-        # (it looks like an int to python)
-        self._unread_messages = multiprocessing.Value(ctypes.c_uint)
+        self._channels = {}
+        self._idle_workers = deque()
+        self._pending = deque()
 
     def _check_workers(self):
         # Reap any dead workers
-        to_remove = set()
-        for pid, proc in self.workers.items():
+        for pid, proc in list(self.workers.items()):
             if not proc.is_alive():
-                to_remove.add(pid)
                 proc.close()
-
-        if to_remove:
-            self.workers = {pid: proc for pid, proc in self.workers.items() if pid not in to_remove}
-
-        with self._unread_messages:
-            num_outstanding = self._unread_messages.value
-
-        if num_outstanding <= 0 or self.activity_queue.empty():
-            # Nothing to do. Future enhancement if someone wants: shut down workers that have been idle for N
-            # seconds
-            return
-
-        # If we're using spawn in multiprocessing (default on macOS now) to start tasks, this can get called a
-        # via `sync()` a few times before the spawned process actually starts picking up messages. Try not to
-        # create too much
-        need_more_workers = len(self.workers) < num_outstanding
-        if need_more_workers and (self.parallelism == 0 or len(self.workers) < self.parallelism):
-            # This only creates one worker, which is fine as we call this directly after putting a message on
-            # activity_queue in execute_async
-            self._spawn_worker()
-
-    def _spawn_worker(self):
+                del self.workers[pid]
+                self._channels.pop(pid).close()
+                if pid in self._idle_workers:
+                    self._idle_workers.remove(pid)
+
+        self._dispatch()
+
+    def _dispatch(self):
+        # Future enhancement if someone wants: shut down workers that have been idle for N seconds
+        while self._pending:
+            if self._idle_workers:
+                pid = self._idle_workers.popleft()
+            elif self.parallelism == 0 or len(self.workers) < self.parallelism:
+                pid = self._spawn_worker()
+            else:
+                return
+            workload = self._pending.popleft()
+            try:
+                self._channels[pid].send(pack_workloads([workload]))
+            except OSError:
+                # The worker died since it was last checked, it gets reaped in the next sync
+                self.log.warning("LocalExecutor worker %d has gone away", pid)
+                self._pending.appendleft(workload)
+
+    def _spawn_worker(self) -> int:
+        executor_end, worker_end = socket.socketpair()
         p = multiprocessing.Process(
             target=_run_worker,
-            kwargs={
-                "logger_name": self.log.name,
-                "input": self.activity_queue,
-                "output": self.result_queue,
-                "unread_messages": self._unread_messages,
-            },
+            kwargs={"logger_name": self.log.name, "sock": worker_end},
         )
         p.start()
+        worker_end.close()
         if TYPE_CHECKING:
             assert p.pid  # Since we've called start
         self.workers[p.pid] = p
+        self._channels[p.pid] = _Channel(executor_end)
+        return p.pid
 
     def sync(self) -> None:
         """Sync will get called periodically by the heartbeat method."""
@@ -220,10 +434,11 @@ class LocalExecutor(BaseExecutor):
         self._check_workers()
 
     def _read_results(self):
-        while not self.result_queue.empty():
-            key, state, exc = self.result_queue.get()
-
-            self.change_state(key, state)
+        for pid, channel in self._channels.items():
+            for key, state, info in channel.receive_available():
+                # Each worker runs one task at a time, so it is idle again once it sent the result
+                self._idle_workers.append(pid)
+                self.change_state(TaskInstanceKey(*key), TaskInstanceState(state), info)
 
     def end(self) -> None:
         """End the executor."""
@@ -232,13 +447,15 @@ class LocalExecutor(BaseExecutor):
             "; waiting for running tasks to finish.  Signal again if you don't want to wait."
         )
 
-        # We can't tell which proc will pick which close message up, so we send all the messages, and then
-        # wait on all the procs
+        # Tasks still waiting for a worker are run before the workers are shut down
+        while self._pending and self.workers:
+            multiprocessing.connection.wait([channel.sock for channel in self._channels.values()], timeout=1)
+            self.sync()
 
-        for proc in self.workers.values():
-            # Send the shutdown message once for each alive worker
+        for pid, proc in self.workers.items():
+            # Send the shutdown message to each alive worker, after the task it is running
             if proc.is_alive():
-                self.activity_queue.put(None)
+                self._channels[pid].send(None)
 
         for proc in self.workers.values():
             if proc.is_alive():
@@ -248,15 +465,15 @@ class LocalExecutor(BaseExecutor):
         # Process any extra results before closing
         self._read_results()
 
-        self.activity_queue.close()
-        self.result_queue.close()
+        for channel in self._channels.values():
+            channel.close()
 
     def terminate(self):
         """Terminate the executor is not doing anything."""
 
     @provide_session
     def queue_workload(self, workload: workloads.All, session: Session = NEW_SESSION):
-        self.activity_queue.put(workload)
-        with self._unread_messages:
-            self._unread_messages.value += 1
-        self._check_workers()
+        if not isinstance(workload, workloads.ExecuteTask):
+            raise ValueError(f"LocalExecutor does not know how to handle {type(workload)}")
+        self._pending.append(workload)
+        self._dispatch()
@@ -0,0 +1,154 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compact encoding of the workloads executors send to their workers.
+
+Workloads are encoded as msgpack, as a list of their values rather than a JSON object, with the fields a batch
+of workloads have in common (bundle info and DAG file path) stored once and referenced by their position::
+
+    [version, [[bundle_name, bundle_version], ...], [dag_rel_path, ...], [task, ...]]
+
+with each task being ``[token, ti, dag_rel_path_id, bundle_info_id, log_path]``, and ``ti`` the values of the
+fields of its TaskInstance. The version changes when the layout does. Readers ignore values appended to the end
+of a task, so that new optional fields can be added without changing the version.
+
+Executors sending workloads as text (Celery task arguments, pod arguments) use :func:`workload_to_str`, which
+encodes them as JSON or in this encoding depending on ``[core] workload_encoding``, and their workers use
+:func:`workload_from_str`, which reads either.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+import msgspec
+from pydantic import TypeAdapter
+
+from airflow.executors.workloads import _COMPACT_TI_FIELDS, All, BundleInfo, ExecuteTask, TaskInstance
+
+__all__ = [
+    "CODEC_VERSION",
+    "decode_workloads",
+    "encode_workloads",
+    "pack_workloads",
+    "unpack_workloads",
+    "workload_from_str",
+    "workload_to_str",
+]
+
+CODEC_VERSION = 1
+
+# Marks workloads encoded by this module in text, which would start with "{" as JSON
+TEXT_PREFIX = "msgpack:"
+
+_UUID_TI_FIELDS = frozenset(("id", "dag_version_id"))
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+_json_decoder: TypeAdapter[All] = TypeAdapter(All)
+
+
+def pack_workloads(workloads: Iterable[ExecuteTask]) -> list:
+    """
+    Turn workloads into the structure of the compact encoding, ready to be encoded as msgpack.
+
+    This is for channels encoding their messages as msgpack themselves, others use :func:`encode_workloads`.
+    """
+    bundles: dict[tuple[str, str | None], int] = {}
+    paths: dict[str, int] = {}
+    tasks = []
+    for workload in workloads:
+        if not isinstance(workload, ExecuteTask):
+            raise TypeError(f"Cannot encode workloads of type {type(workload)}")
+        bundle = (workload.bundle_info.name, workload.bundle_info.version)
+        path = os.fspath(workload.dag_rel_path)
+        ti = [
+            value.bytes if name in _UUID_TI_FIELDS else value
+            for name, value in ((name, getattr(workload.ti, name)) for name in _COMPACT_TI_FIELDS)
+        ]
+        tasks.append(
+            [
+                workload.token,
+                ti,
+                paths.setdefault(path, len(paths)),
+                bundles.setdefault(bundle, len(bundles)),
+                workload.log_path,
+            ]
+        )
+    return [CODEC_VERSION, [list(bundle) for bundle in bundles], list(paths), tasks]
+
+
+def unpack_workloads(data: list) -> list[ExecuteTask]:
+    """Create the workloads from what :func:`pack_workloads` returned."""
+    version, bundles, paths, tasks = data[:4]
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported workload encoding version {version}, expected {CODEC_VERSION}")
+    bundle_infos = [BundleInfo(name=name, version=bundle_version) for name, bundle_version in bundles]
+    workloads = []
+    for task in tasks:
+        token, ti, path_id, bundle_id, log_path = task[:5]
+        ti_fields: dict[str, Any] = dict(zip(_COMPACT_TI_FIELDS, ti))
+        for name in _UUID_TI_FIELDS:
+            ti_fields[name] = uuid.UUID(bytes=ti_fields[name])
+        workloads.append(
+            ExecuteTask(
+                token=token,
+                ti=TaskInstance(**ti_fields),
+                dag_rel_path=paths[path_id],
+                bundle_info=bundle_infos[bundle_id],
+                log_path=log_path,
+            )
+        )
+    return workloads
+
+
+def encode_workloads(workloads: Iterable[ExecuteTask]) -> bytes:
+    """Encode a batch of workloads."""
+    return _encoder.encode(pack_workloads(workloads))
+
+
+def decode_workloads(data: bytes) -> list[ExecuteTask]:
+    """Decode a batch of workloads encoded by :func:`encode_workloads`."""
+    return unpack_workloads(_decoder.decode(data))
+
+
+def workload_to_str(workload: All) -> str:
+    """
+    Encode a workload as text, as JSON or in the compact encoding as per ``[core] workload_encoding``.
+
+    Only ExecuteTask workloads have a compact encoding, others are always encoded as JSON.
+    """
+    from airflow.configuration import conf
+
+    if (
+        isinstance(workload, ExecuteTask)
+        and conf.get("core", "workload_encoding", fallback="json") == "msgpack"
+    ):
+        return TEXT_PREFIX + base64.b64encode(encode_workloads([workload])).decode()
+    return workload.model_dump_json()
+
+
+def workload_from_str(text: str) -> All:
+    """Decode a workload encoded by :func:`workload_to_str`, in either encoding."""
+    if text.startswith(TEXT_PREFIX):
+        (workload,) = decode_workloads(base64.b64decode(text[len(TEXT_PREFIX) :]))
+        return workload
+    return _json_decoder.validate_json(text)
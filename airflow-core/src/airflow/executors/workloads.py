@@ -157,6 +157,32 @@ class RunTrigger(BaseModel):
 
     type: Literal["RunTrigger"] = Field(init=False, default="RunTrigger")
 
+    def to_compact(self) -> list:
+        """
+        Return the workload as a list of its values, without the field names.
+
+        The triggerer sends new triggers to its runner processes in this form, as there can be thousands of
+        them at a time. :meth:`from_compact` turns it back into a workload.
+        """
+        ti = None if self.ti is None else [getattr(self.ti, name) for name in _COMPACT_TI_FIELDS]
+        return [self.id, self.classpath, self.encrypted_kwargs, self.timeout_after, ti]
+
+    @classmethod
+    def from_compact(cls, data: list) -> RunTrigger:
+        """Create a workload from what :meth:`to_compact` returned."""
+        id, classpath, encrypted_kwargs, timeout_after, ti = data
+        return cls(
+            id=id,
+            ti=None if ti is None else TaskInstance(**dict(zip(_COMPACT_TI_FIELDS, ti))),
+            classpath=classpath,
+            encrypted_kwargs=encrypted_kwargs,
+            timeout_after=timeout_after,
+        )
+
+
+# The fields of a TaskInstance in the compact form of RunTrigger, in order
+_COMPACT_TI_FIELDS = tuple(name for name, field in TaskInstance.model_fields.items() if not field.exclude)
+
 
 All = Annotated[
     ExecuteTask | RunTrigger,
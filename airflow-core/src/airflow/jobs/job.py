@@ -22,7 +22,7 @@ from functools import cached_property, lru_cache
 from time import sleep
 from typing import TYPE_CHECKING, NoReturn
 
-from sqlalchemy import Column, Index, Integer, String, case, select
+from sqlalchemy import Column, Float, Index, Integer, String, case, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import backref, foreign, relationship
 from sqlalchemy.orm.session import make_transient
@@ -91,6 +91,12 @@ class Job(Base, LoggingMixin):
     executor_class = Column(String(500))
     hostname = Column(String(500))
     unixname = Column(String(1000))
+    # The load reported by a triggerer, used to balance triggers between triggerers. Only set for
+    # TriggererJob: the worst event loop lag in seconds, the share of its runner processes' CPU in use,
+    # and the cost of the triggers it runs as a share of what it can take.
+    loop_lag = Column(Float)
+    cpu_usage = Column(Float)
+    trigger_cost = Column(Float)
 
     __table_args__ = (
         Index("job_type_heart", job_type, latest_heartbeat),
@@ -419,7 +419,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     # All executors should have a name if they are initted from the executor_loader.
                     # But we need to check for None to make mypy happy.
                     assert executor.name
-                executor_slots_available[executor.name] = executor.slots_available
+                executor_slots_available[executor.name] = self._executor_slots_available(executor)
 
             for task_instance in task_instances_to_examine:
                 pool_name = task_instance.pool
@@ -664,6 +664,18 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             workload = workloads.ExecuteTask.make(ti, generator=executor.jwt_generator)
             executor.queue_workload(workload, session=session)
 
+    def _executor_slots_available(self, executor: BaseExecutor) -> int:
+        """Get how many tasks to queue for an executor, as per its slots and its capacity hint."""
+        slots_available = executor.slots_available
+        try:
+            capacity_hint = executor.capacity_hint()
+        except Exception:
+            self.log.exception("Failed to get the capacity hint of executor %s, ignoring it", executor)
+            return slots_available
+        if capacity_hint is None:
+            return slots_available
+        return min(slots_available, capacity_hint)
+
     def _critical_section_enqueue_task_instances(self, session: Session) -> int:
         """
         Enqueues TaskInstances for execution.
@@ -697,6 +709,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             max_tis = parallelism - num_occupied_slots
         else:
             max_tis = min(self.job.max_tis_per_query, parallelism - num_occupied_slots)
+        # Executors knowing how many tasks their workers can start right away lower that
+        max_tis = min(max_tis, sum(map(self._executor_slots_available, self.job.executors)))
         if max_tis <= 0:
             self.log.debug("max_tis query size is less than or equal to zero. No query will be performed!")
             return 0
@@ -1393,7 +1407,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             # END: schedule TIs
 
             # Attempt to schedule even if some executors are full but not all.
-            total_free_executor_slots = sum([executor.slots_available for executor in self.job.executors])
+            total_free_executor_slots = sum(map(self._executor_slots_available, self.job.executors))
             if total_free_executor_slots <= 0:
                 # We know we can't do anything here, so don't even try!
                 self.log.debug("All executors are full, skipping critical section")
@@ -18,6 +18,9 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import heapq
+import itertools
+import json
 import logging
 import os
 import selectors
@@ -25,21 +28,22 @@ import signal
 import sys
 import time
 from collections import deque
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Coroutine, Generator, Iterable
 from contextlib import suppress
-from datetime import datetime
-from socket import socket
+from datetime import datetime, timedelta
+from socket import socket, socketpair
 from traceback import format_exception
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, TypedDict
 
 import attrs
 import structlog
-from pydantic import BaseModel, Field, TypeAdapter
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer, field_validator
 from sqlalchemy import func, select
 from structlog.contextvars import bind_contextvars as bind_log_contextvars
 
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
 from airflow.executors import workloads
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import perform_heartbeat
@@ -75,7 +79,8 @@ from airflow.sdk.execution_time.supervisor import WatchedSubprocess, make_buffer
 from airflow.stats import Stats
 from airflow.traces.tracer import DebugTrace, Trace, add_debug_span
 from airflow.triggers import base as events
-from airflow.utils.helpers import log_filename_template_renderer
+from airflow.triggers.clients import get_shared_client_registry
+from airflow.utils.helpers import chunks, log_filename_template_renderer
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.module_loading import import_string
 from airflow.utils.session import provide_session
@@ -122,6 +127,11 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             self.capacity = capacity
         else:
             raise ValueError(f"Capacity number {capacity!r} is invalid")
+        self.runner_processes = conf.getint("triggerer", "runner_processes")
+        if self.runner_processes < 1:
+            raise ValueError(f"Number of trigger runner processes {self.runner_processes!r} is invalid")
+        # Fail early if the event loop is misconfigured, rather than in the runner processes
+        self.event_loop_factory = get_event_loop_factory()
 
     def register_signals(self) -> None:
         """Register signals that stop child processes."""
@@ -159,16 +169,23 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             sys.exit(os.EX_SOFTWARE)
 
     def _execute(self) -> int | None:
-        self.log.info("Starting the triggerer")
+        self.log.info(
+            "Starting the triggerer, running triggers on the %s event loop",
+            "uvloop" if self.event_loop_factory else "asyncio",
+        )
         try:
             # Kick off runner sub-process without DB access
             self.trigger_runner = TriggerRunnerSupervisor.start(
-                job=self.job, capacity=self.capacity, logger=log
+                job=self.job, capacity=self.capacity, runners=self.runner_processes, logger=log
             )
 
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
-            return self.trigger_runner._exit_code
+            # If any of the runners died, report its exit code
+            return next(
+                (code for runner in self.trigger_runner.runners if (code := runner._exit_code) is not None),
+                None,
+            )
         except Exception:
             self.log.exception("Exception when executing TriggerRunnerSupervisor.run")
             raise
@@ -191,6 +208,7 @@ class messages:
         """Tell the async trigger runner process to start, and where to send status update messages."""
 
         type: Literal["StartTriggerer"] = "StartTriggerer"
+        runner_index: int = 0
 
     class TriggerStateChanges(BaseModel):
         """
@@ -209,13 +227,32 @@ class messages:
         # Format of list[str] is the exc traceback format
         failures: list[tuple[int, list[str] | None]] | None = None
         finished: list[int] | None = None
+        # The worst lag of the event loop since the last message, and the CPU time the runner process has
+        # used so far, in seconds
+        loop_lag: float = 0
+        cpu_time: float = 0
 
     class TriggerStateSync(BaseModel):
         type: Literal["TriggerStateSync"] = "TriggerStateSync"
 
+        # Sent in the compact form of the workloads, see RunTrigger.to_compact
         to_create: list[workloads.RunTrigger]
         to_cancel: set[int]
 
+        @field_serializer("to_create")
+        def _compact_to_create(self, to_create: list[workloads.RunTrigger]) -> list[list]:
+            return [workload.to_compact() for workload in to_create]
+
+        @field_validator("to_create", mode="before")
+        @classmethod
+        def _expand_to_create(cls, to_create: list) -> list:
+            return [
+                workloads.RunTrigger.from_compact(workload)
+                if isinstance(workload, (list, tuple))
+                else workload
+                for workload in to_create
+            ]
+
 
 class HITLDetailResponseResult(HITLDetailResponse):
     """Response to GetHITLDetailResponse request."""
@@ -331,7 +368,18 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     job: Job
     capacity: int
 
+    # Index of this runner among the runner processes of the triggerer job
+    runner_index: int = 0
+
     health_check_threshold = conf.getint("triggerer", "triggerer_health_check_threshold")
+    listen_for_trigger_changes = conf.getboolean("triggerer", "listen_for_trigger_changes")
+    max_idle_poll_interval = conf.getfloat("triggerer", "max_idle_poll_interval")
+    max_loop_lag = conf.getfloat("triggerer", "max_loop_lag")
+    rebalance_triggers = conf.getboolean("triggerer", "rebalance_triggers")
+    # How often, in seconds, to check if we should hand triggers back to less loaded triggerers
+    rebalance_interval: ClassVar[float] = 60
+    # Most trigger events submitted to the database in one transaction
+    event_batch_size: ClassVar[int] = 1000
 
     runner: TriggerRunner | None = None
     stop: bool = False
@@ -357,9 +405,39 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, list[str] | None]] = attrs.field(factory=deque, init=False)
 
+    # The other runner processes of the same triggerer job. They share our selector, and this (first) runner
+    # drives the DB loop for all of them, spreading the triggers over their event loops.
+    peers: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False)
+
+    # Our end of the socket we use to wake the runner process up when we have new work for it
+    _wakeup: socket | None = attrs.field(default=None, init=False, repr=False)
+
+    # The DB connection listening for notifications of created or deleted triggers, if we have one, and
+    # when to next query the DB for them. Without notifications we poll every second, with them we back off
+    # when nothing changes.
+    _trigger_listener: Any = attrs.field(default=None, init=False, repr=False)
+    _next_listen_attempt: float = attrs.field(default=0, init=False)
+    _triggers_changed: bool = attrs.field(default=True, init=False)
+    _trigger_poll_interval: float = attrs.field(default=1, init=False)
+    _next_trigger_poll: float = attrs.field(default=0, init=False)
+    _assigned_trigger_ids: set[int] = attrs.field(factory=set, init=False)
+
+    # The load of the runner process: the worst lag of its event loop since we last reported our load, and
+    # the CPU time it has used in total and as of our last report
+    _loop_lag: float = attrs.field(default=0, init=False)
+    _cpu_time: float = attrs.field(default=0, init=False)
+    _reported_cpu_time: float | None = attrs.field(default=None, init=False)
+    _load_reported_at: float = attrs.field(factory=time.monotonic, init=False)
+    _next_rebalance: float = attrs.field(default=0, init=False)
+
+    @property
+    def runners(self) -> list[TriggerRunnerSupervisor]:
+        """All the runner processes of this triggerer job, starting with this one."""
+        return [self, *self.peers]
+
     def is_alive(self) -> bool:
-        # Set by `_service_subprocess` in the loop
-        return self._exit_code is None
+        # Set by `_service_subprocess`/`_check_subprocess_exit` in the loop
+        return all(runner._exit_code is None for runner in self.runners)
 
     @classmethod
     def start(  # type: ignore[override]
@@ -367,14 +445,57 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         *,
         job: Job,
         logger=None,
+        runners: int = 1,
         **kwargs,
     ):
-        proc = super().start(id=job.id, job=job, target=cls.run_in_process, logger=logger, **kwargs)
+        if runners < 1:
+            raise ValueError(f"Number of trigger runner processes {runners!r} is invalid")
+
+        selector = selectors.DefaultSelector()
+        proc = cls._start_runner(job=job, logger=logger, runner_index=0, selector=selector, **kwargs)
+        for runner_index in range(1, runners):
+            proc.peers.append(
+                cls._start_runner(
+                    job=job, logger=logger, runner_index=runner_index, selector=selector, **kwargs
+                )
+            )
+        return proc
+
+    @classmethod
+    def _start_runner(cls, *, job: Job, runner_index: int, **kwargs):
+        wakeup, child_wakeup = socketpair()
+        proc = super().start(
+            id=job.id,
+            job=job,
+            target=functools.partial(cls.run_in_process, wakeup=child_wakeup),
+            runner_index=runner_index,
+            **kwargs,
+        )
+        child_wakeup.close()
+        wakeup.setblocking(False)
+        proc._wakeup = wakeup
 
-        msg = messages.StartTriggerer()
+        msg = messages.StartTriggerer(runner_index=runner_index)
         proc.send_msg(msg, request_id=0)
         return proc
 
+    def wake(self) -> None:
+        """Wake the runner process up, so it picks up the triggers to create or cancel right away."""
+        if self._wakeup:
+            # If the buffer is full the runner has plenty of wake-ups waiting already
+            with suppress(OSError):
+                self._wakeup.send(b"\0")
+
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ):
+        for peer in self.peers:
+            peer.kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+        super().kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+
     @functools.cached_property
     def client(self) -> Client:
         from airflow.sdk.api.client import Client
@@ -400,6 +521,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 self.events.extend(msg.events)
             if msg.failures:
                 self.failed_triggers.extend(msg.failures)
+            self._loop_lag = max(self._loop_lag, msg.loop_lag)
+            self._cpu_time = msg.cpu_time
+            if self._reported_cpu_time is None:
+                # Don't count what the process used to start up
+                self._reported_cpu_time = msg.cpu_time
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
@@ -512,15 +638,26 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         reset_secrets_masker()
 
+        try:
+            self._run_loop()
+        finally:
+            self._stop_listening_for_trigger_changes()
+
+    def _run_loop(self) -> None:
         while not self.stop:
             if not self.is_alive():
                 log.error("Trigger runner process has died! Exiting.")
                 break
             with DebugTrace.start_span(span_name="triggerer_job_loop", component="TriggererJobRunner"):
-                self.load_triggers()
+                self._listen_for_trigger_changes()
+                if self._triggers_changed or time.monotonic() >= self._next_trigger_poll:
+                    self.load_triggers()
 
-                # Wait for up to 1 second for activity
+                # Wait for up to 1 second for activity. The selector is shared by all the runners, so this
+                # services the peers too, but only checks if this process has exited
                 self._service_subprocess(1)
+                for peer in self.peers:
+                    peer._check_subprocess_exit()
 
                 self.handle_events()
                 self.handle_failed_triggers()
@@ -534,24 +671,138 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def heartbeat_callback(self, session: Session | None = None) -> None:
         Stats.incr("triggerer_heartbeat", 1, 1)
+        self.report_load(session)
+
+    def report_load(self, session: Session | None = None) -> None:
+        """
+        Record the load of the runner processes since the last report on the job.
+
+        The other triggerers use it to balance the triggers between them. The trigger cost is the larger
+        of the share of our capacity in use and the share of the runner processes' CPU in use.
+        """
+        runners = self.runners
+        now = time.monotonic()
+        elapsed, self._load_reported_at = now - self._load_reported_at, now
+
+        cpu_time = 0.0
+        for runner in runners:
+            if runner._reported_cpu_time is not None:
+                cpu_time += runner._cpu_time - runner._reported_cpu_time
+                runner._reported_cpu_time = runner._cpu_time
+        running = sum(len(runner.running_triggers) for runner in runners)
+
+        loop_lag = max(runner._loop_lag for runner in runners)
+        cpu_usage = min(1.0, cpu_time / elapsed / len(runners)) if elapsed > 0 else 0.0
+        trigger_cost = max(running / self.capacity, cpu_usage) if self.capacity > 0 else cpu_usage
+        for runner in runners:
+            runner._loop_lag = 0
+
+        self.job.loop_lag = loop_lag
+        self.job.cpu_usage = cpu_usage
+        self.job.trigger_cost = trigger_cost
+        if session is not None:
+            session.merge(self.job)
+
+        tags = {"hostname": self.job.hostname}
+        Stats.gauge("triggerer.loop_lag", loop_lag, tags=tags)
+        Stats.gauge("triggerer.cpu_usage", cpu_usage, tags=tags)
+        Stats.gauge("triggerer.trigger_cost", trigger_cost, tags=tags)
 
     @add_debug_span
     def load_triggers(self):
         """Query the database for the triggers we're supposed to be running and update the runner."""
-        Trigger.assign_unassigned(self.job.id, self.capacity, self.health_check_threshold)
-        ids = Trigger.ids_for_triggerer(self.job.id)
-        self.update_triggers(set(ids))
+        self._triggers_changed = False
+        if self.rebalance_triggers and time.monotonic() >= self._next_rebalance:
+            self._next_rebalance = time.monotonic() + self.rebalance_interval
+            Trigger.release_excess(self.job.id, self.health_check_threshold)
+        Trigger.assign_unassigned(
+            self.job.id, self.capacity, self.health_check_threshold, max_loop_lag=self.max_loop_lag
+        )
+        ids = set(Trigger.ids_for_triggerer(self.job.id))
+        self._schedule_trigger_poll(changed=ids != self._assigned_trigger_ids)
+        self._assigned_trigger_ids = ids
+        self.update_triggers(ids)
+
+    def _schedule_trigger_poll(self, changed: bool) -> None:
+        if changed or self._trigger_listener is None:
+            self._trigger_poll_interval = 1
+        else:
+            # We'll be notified of new triggers, so only poll for the rest (such as triggers of dead
+            # triggerers) ever less often while nothing changes
+            self._trigger_poll_interval = min(self._trigger_poll_interval * 2, self.max_idle_poll_interval)
+        self._next_trigger_poll = time.monotonic() + self._trigger_poll_interval
+
+    def _listen_for_trigger_changes(self) -> None:
+        """Listen for notifications of created and deleted triggers, if the DB supports it."""
+        if (
+            not self.listen_for_trigger_changes
+            or self._trigger_listener is not None
+            or time.monotonic() < self._next_listen_attempt
+        ):
+            return
+        # If this fails, try again in a minute
+        self._next_listen_attempt = time.monotonic() + 60
+
+        from airflow.models.trigger import TRIGGERS_CHANGED_CHANNEL
+        from airflow.settings import engine
+
+        if engine is None or engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg2":
+            # Only psycopg2 lets us wait on the connection's socket for notifications
+            self._next_listen_attempt = float("inf")
+            return
+        try:
+            connection = engine.raw_connection()
+            # This connection is ours for as long as we listen on it
+            connection.detach()
+            listener = connection.driver_connection
+            listener.autocommit = True
+            with listener.cursor() as cursor:
+                cursor.execute(f"LISTEN {TRIGGERS_CHANGED_CHANNEL}")
+        except Exception:
+            log.warning("Could not listen for trigger changes, polling for them instead", exc_info=True)
+            return
+        self.selector.register(
+            listener,
+            selectors.EVENT_READ,
+            (self._on_trigger_notification, self._on_trigger_listener_closed),
+        )
+        self._trigger_listener = listener
+        log.debug("Listening for trigger changes", channel=TRIGGERS_CHANGED_CHANNEL)
+
+    def _on_trigger_notification(self, listener) -> bool:
+        try:
+            listener.poll()
+        except Exception:
+            log.warning("Lost the connection listening for trigger changes", exc_info=True)
+            return False
+        if listener.notifies:
+            listener.notifies.clear()
+            self._triggers_changed = True
+        return True
+
+    def _on_trigger_listener_closed(self, listener) -> None:
+        with suppress(KeyError, ValueError):
+            self.selector.unregister(listener)
+        self._trigger_listener = None
+
+    def _stop_listening_for_trigger_changes(self) -> None:
+        if (listener := self._trigger_listener) is not None:
+            self._on_trigger_listener_closed(listener)
+            with suppress(Exception):
+                listener.close()
 
     @add_debug_span
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
-        while self.events:
-            # Get the event and its trigger ID
-            trigger_id, event = self.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
+        submitted: list[tuple[int, events.TriggerEvent]] = []
+        for runner in self.runners:
+            while runner.events:
+                submitted.append(runner.events.popleft())
+        # Tell the model to wake up the tasks, a batch of events per transaction
+        for batch in chunks(submitted, self.event_batch_size):
+            Trigger.submit_events(batch)
             # Emit stat event
-            Stats.incr("triggers.succeeded")
+            Stats.incr("triggers.succeeded", len(batch))
 
     @add_debug_span
     def clean_unused(self):
@@ -565,53 +816,85 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         Task Instances that depend on them need failing.
         """
-        while self.failed_triggers:
-            # Tell the model to fail this trigger's deps
-            trigger_id, saved_exc = self.failed_triggers.popleft()
-            Trigger.submit_failure(trigger_id=trigger_id, exc=saved_exc)
-            # Emit stat event
-            Stats.incr("triggers.failed")
+        for runner in self.runners:
+            while runner.failed_triggers:
+                # Tell the model to fail this trigger's deps
+                trigger_id, saved_exc = runner.failed_triggers.popleft()
+                Trigger.submit_failure(trigger_id=trigger_id, exc=saved_exc)
+                # Emit stat event
+                Stats.incr("triggers.failed")
 
     def emit_metrics(self):
-        Stats.gauge(f"triggers.running.{self.job.hostname}", len(self.running_triggers))
-        Stats.gauge("triggers.running", len(self.running_triggers), tags={"hostname": self.job.hostname})
+        runners = self.runners
+        running = sum(len(runner.running_triggers) for runner in runners)
+        Stats.gauge(f"triggers.running.{self.job.hostname}", running)
+        Stats.gauge("triggers.running", running, tags={"hostname": self.job.hostname})
 
-        capacity_left = self.capacity - len(self.running_triggers)
+        capacity_left = self.capacity - running
         Stats.gauge(f"triggerer.capacity_left.{self.job.hostname}", capacity_left)
         Stats.gauge("triggerer.capacity_left", capacity_left, tags={"hostname": self.job.hostname})
 
+        # The capacity is spread evenly over the runners
+        runner_capacity = self.capacity // len(runners)
+        for runner in runners:
+            tags = {"hostname": self.job.hostname, "runner": str(runner.runner_index)}
+            Stats.gauge("triggerer.runner.triggers_running", len(runner.running_triggers), tags=tags)
+            Stats.gauge(
+                "triggerer.runner.capacity_left", runner_capacity - len(runner.running_triggers), tags=tags
+            )
+
         span = Trace.get_current_span()
         span.set_attributes(
             {
                 "trigger host": self.job.hostname,
-                "triggers running": len(self.running_triggers),
+                "triggers running": running,
                 "capacity left": capacity_left,
+                "trigger runners": len(runners),
             }
         )
 
+    def _known_trigger_ids(self) -> set[int]:
+        """Return the IDs of triggers this runner is running, or has not finished reporting on."""
+        return (
+            self.running_triggers.union(x[0] for x in self.events)
+            .union(self.cancelling_triggers)
+            .union(trigger[0] for trigger in self.failed_triggers)
+            .union(trigger.id for trigger in self.creating_triggers)
+        )
+
+    def _least_loaded_runner(self) -> TriggerRunnerSupervisor:
+        return min(
+            self.runners, key=lambda runner: len(runner.running_triggers) + len(runner.creating_triggers)
+        )
+
     def update_triggers(self, requested_trigger_ids: set[int]):
         """
         Request that we update what triggers we're running.
 
         Works out the differences - ones to add, and ones to remove - then
         adds them to the deques so the subprocess can actually mutate the running
-        trigger set.
+        trigger set. Triggers stay on the runner process they were started on, and new ones go to the runner
+        with the fewest triggers.
         """
         render_log_fname = log_filename_template_renderer()
 
-        known_trigger_ids = (
-            self.running_triggers.union(x[0] for x in self.events)
-            .union(self.cancelling_triggers)
-            .union(trigger[0] for trigger in self.failed_triggers)
-            .union(trigger.id for trigger in self.creating_triggers)
-        )
-        # Work out the two difference sets
+        # The runners we have new work for, by id()
+        to_wake: dict[int, TriggerRunnerSupervisor] = {}
+        known_trigger_ids: set[int] = set()
+        for runner in self.runners:
+            known_trigger_ids.update(runner._known_trigger_ids())
+            # Enqueue orphaned triggers for cancellation
+            if (
+                cancel_trigger_ids := runner.running_triggers
+                - requested_trigger_ids
+                - runner.cancelling_triggers
+            ):
+                runner.cancelling_triggers.update(cancel_trigger_ids)
+                to_wake[id(runner)] = runner
         new_trigger_ids = requested_trigger_ids - known_trigger_ids
-        cancel_trigger_ids = self.running_triggers - requested_trigger_ids
         # Bulk-fetch new trigger records
         new_triggers = Trigger.bulk_fetch(new_trigger_ids)
         trigger_ids_with_non_task_associations = Trigger.fetch_trigger_ids_with_non_task_associations()
-        to_create: list[workloads.RunTrigger] = []
         # Add in new triggers
         for new_id in new_trigger_ids:
             # Check it didn't vanish in the meantime
@@ -641,6 +924,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 encrypted_kwargs=new_trigger_orm.encrypted_kwargs,
                 ti=None,
             )
+            runner = self._least_loaded_runner()
             if new_trigger_orm.task_instance:
                 log_path = render_log_fname(ti=new_trigger_orm.task_instance)
 
@@ -648,7 +932,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                     new_trigger_orm.task_instance, from_attributes=True
                 )
                 # When producing logs from TIs, include the job id producing the logs to disambiguate it.
-                self.logger_cache[new_id] = TriggerLoggingFactory(
+                runner.logger_cache[new_id] = TriggerLoggingFactory(
                     log_path=f"{log_path}.trigger.{self.job.id}.log",
                     ti=ser_ti,  # type: ignore
                 )
@@ -656,13 +940,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 workload.ti = ser_ti
                 workload.timeout_after = new_trigger_orm.task_instance.trigger_timeout
 
-            to_create.append(workload)
+            runner.creating_triggers.append(workload)
+            to_wake[id(runner)] = runner
 
-        self.creating_triggers.extend(to_create)
-
-        if cancel_trigger_ids:
-            # Enqueue orphaned triggers for cancellation
-            self.cancelling_triggers.update(cancel_trigger_ids)
+        for runner in to_wake.values():
+            runner.wake()
 
     def _register_pipe_readers(self, stdout: socket, stderr: socket, requests: socket, logs: socket):
         super()._register_pipe_readers(stdout, stderr, requests, logs)
@@ -729,18 +1011,250 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 log.log(lvl_name, event.pop("event", None), **event)
 
     @classmethod
-    def run_in_process(cls):
-        TriggerRunner().run()
+    def run_in_process(cls, wakeup: socket | None = None):
+        TriggerRunner(wakeup=wakeup).run()
 
 
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
-    task: asyncio.Task
+    task: asyncio.Future
     name: str
     events: int
 
 
+_SHARED_TRIGGER_END = object()
+
+
+class SharedTrigger:
+    """
+    One running instance of a trigger, shared by all the triggers with the same classpath and kwargs.
+
+    Each trigger ID subscribed to it gets its own queue, and every event the instance fires is put on all of
+    them. A shared trigger stops taking new subscribers once it has fired (so triggers created after that
+    start their own instance rather than miss the event), and is cancelled when its last subscriber goes.
+    """
+
+    def __init__(
+        self,
+        trigger: BaseTrigger,
+        on_closed: Callable[[SharedTrigger], None],
+        on_step: Callable[[float], None] | None = None,
+    ):
+        self.trigger = trigger
+        self.subscribers: dict[int, asyncio.Queue] = {}
+        self.task: asyncio.Task | None = None
+        self.closed = False
+        self._on_closed = on_closed
+        self._on_step = on_step
+
+    def subscribe(self, trigger_id: int) -> SharedTriggerSubscription:
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers[trigger_id] = queue
+        return SharedTriggerSubscription(self, queue)
+
+    def unsubscribe(self, trigger_id: int) -> None:
+        self.subscribers.pop(trigger_id, None)
+        if not self.subscribers:
+            self._close()
+            if self.task:
+                self.task.cancel()
+
+    def start(self) -> None:
+        """Start running the trigger, if no subscriber has done so yet."""
+        if self.task is None:
+            coro = self._run()
+            self.task = asyncio.create_task(
+                TimedCoroutine(coro, self._on_step) if self._on_step else coro,
+                name=f"shared {self.trigger!r}",
+            )
+
+    def _close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._on_closed(self)
+
+    def _publish(self, item: Any) -> None:
+        for queue in self.subscribers.values():
+            queue.put_nowait(item)
+
+    async def _run(self) -> None:
+        try:
+            async for event in self.trigger.run():
+                self._close()
+                self._publish(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._publish(e)
+        else:
+            self._publish(_SHARED_TRIGGER_END)
+        finally:
+            self._close()
+            with suppress(Exception):
+                await self.trigger.cleanup()
+
+
+class SharedTriggerSubscription:
+    """
+    Stand-in for a trigger whose events come from a :class:`SharedTrigger`.
+
+    The shared instance cleans up after itself once its last subscriber is gone, so ``cleanup`` does nothing.
+    """
+
+    trigger_id: int | None = None
+    triggerer_job_id: int | None = None
+    task_instance: workloads.TaskInstance | None = None
+    timeout_after: datetime | None = None
+
+    def __init__(self, shared: SharedTrigger, queue: asyncio.Queue):
+        self.shared = shared
+        self.queue = queue
+
+    async def run(self):
+        self.shared.start()
+        while (item := await self.queue.get()) is not _SHARED_TRIGGER_END:
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    async def cleanup(self) -> None:
+        pass
+
+
+class TimerService:
+    """
+    Fire the events of timer triggers (see ``BaseTrigger.timer``) from a single heap of deadlines.
+
+    Each timer is a plain future rather than a task sleeping in ``run``, so the event loop only has to wake up
+    for the earliest deadline, and fires all the timers that are due at once. Cancelled timers are left in
+    the heap and skipped, until they make up half of it and it is rebuilt.
+    """
+
+    # Cap on how long we sleep, so we notice if the system clock changes
+    max_sleep: float = 60
+
+    # How many timers to fire before letting the rest of the event loop run
+    max_batch: int = 1000
+
+    def __init__(self, on_fire: Callable[[int, events.TriggerEvent], None]):
+        self._on_fire = on_fire
+        self._heap: list[tuple[float, int, int, asyncio.Future, events.TriggerEvent]] = []
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def add(self, trigger_id: int, moment: datetime, event: events.TriggerEvent) -> asyncio.Future:
+        """Fire ``event`` for ``trigger_id`` at ``moment``; cancel the returned future to cancel the timer."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="trigger timers")
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(self._on_done)
+        heapq.heappush(self._heap, (moment.timestamp(), next(self._counter), trigger_id, future, event))
+        if self._heap[0][3] is future and self._wakeup:
+            self._wakeup.set()
+        return future
+
+    def _on_done(self, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            return
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [timer for timer in self._heap if not timer[3].done()]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def fire_due(self) -> float | None:
+        """Fire the timers that are due, up to ``max_batch``, and return how long until the next one is."""
+        heap = self._heap
+        now = time.time()
+        fired = 0
+        while heap and (heap[0][0] <= now or heap[0][3].done()):
+            if fired == self.max_batch:
+                return 0
+            _, _, trigger_id, future, event = heapq.heappop(heap)
+            if future.done():
+                self._cancelled -= 1
+                continue
+            self._on_fire(trigger_id, event)
+            future.set_result(None)
+            fired += 1
+        return heap[0][0] - now if heap else None
+
+    async def _run(self) -> None:
+        if TYPE_CHECKING:
+            assert self._wakeup
+        while True:
+            delay = self.fire_due()
+            if delay == 0:
+                await asyncio.sleep(0)
+                continue
+            self._wakeup.clear()
+            timeout = self.max_sleep if delay is None else min(delay, self.max_sleep)
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+
+class TimedCoroutine(Coroutine):
+    """
+    Wraps a coroutine to measure how long each of its steps takes, i.e. how long it runs between yields.
+
+    It is meant to be run as a task: awaiting it directly runs the wrapped coroutine without measuring it.
+    """
+
+    __slots__ = ("_coro", "_on_step")
+
+    def __init__(self, coro: Coroutine, on_step: Callable[[float], None]):
+        self._coro = coro
+        self._on_step = on_step
+
+    def send(self, value):
+        start = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._on_step(time.perf_counter() - start)
+
+    def throw(self, typ, val=None, tb=None):
+        start = time.perf_counter()
+        try:
+            if val is None and tb is None:
+                return self._coro.throw(typ)
+            return self._coro.throw(typ, val, tb)
+        finally:
+            self._on_step(time.perf_counter() - start)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+
+def get_event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Return the factory of the event loop the trigger runners use, as set by ``[triggerer] event_loop``.
+
+    ``None`` means the standard library's event loop.
+    """
+    event_loop = conf.get("triggerer", "event_loop").lower()
+    if event_loop == "asyncio":
+        return None
+    if event_loop not in ("auto", "uvloop"):
+        raise AirflowConfigException(
+            f"Invalid [triggerer] event_loop {event_loop!r}: expected 'auto', 'asyncio' or 'uvloop'"
+        )
+    try:
+        import uvloop
+    except ImportError:
+        if event_loop == "uvloop":
+            raise AirflowConfigException("[triggerer] event_loop is 'uvloop', but uvloop is not installed")
+        return None
+    return uvloop.new_event_loop
+
+
 @attrs.define(kw_only=True)
 class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _async_writer: asyncio.StreamWriter = attrs.field(alias="async_writer")
@@ -803,6 +1317,19 @@ class TriggerRunner:
     # Cache for looking up triggers by classpath
     trigger_cache: dict[str, type[BaseTrigger]]
 
+    # Running instances of shareable triggers, by classpath and canonical kwargs
+    shared_triggers: dict[tuple[str, str], SharedTrigger]
+
+    # Fires the events of timer triggers
+    timers: TimerService
+
+    # IDs of triggers whose task is done, in the order they finished
+    done_trigger_ids: dict[int, None]
+
+    # Set when there is something for the main loop to do: a trigger fired or finished, or the supervisor
+    # woke us up through the ``wakeup`` socket because it has triggers for us to create or cancel
+    activity: asyncio.Event
+
     # Inbound queue of new triggers
     to_create: deque[workloads.RunTrigger]
 
@@ -815,6 +1342,14 @@ class TriggerRunner:
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException | None]]
 
+    # The worst event loop lag the watchdog saw since we last synced state with the supervisor
+    loop_lag: float
+
+    # The event loop time the triggers of each class took since we last emitted metrics, and the longest one
+    # of them ran without yielding, in seconds
+    loop_time: dict[str, float]
+    max_step_time: dict[str, float]
+
     # Should-we-stop flag
     # TODO: set this in a sig-int handler
     stop: bool = False
@@ -824,19 +1359,38 @@ class TriggerRunner:
 
     comms_decoder: TriggerCommsDecoder
 
-    def __init__(self):
+    def __init__(self, wakeup: socket | None = None):
         super().__init__()
+        self.wakeup = wakeup
+        self.activity = asyncio.Event()
+        self.done_trigger_ids = {}
         self.triggers = {}
         self.trigger_cache = {}
+        self.shared_triggers = {}
+        self.timers = TimerService(self._fire_timer)
         self.to_create = deque()
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
         self.job_id = None
+        self.runner_index = 0
+        self.loop_lag = 0.0
+        self.loop_time = {}
+        self.max_step_time = {}
 
     def run(self):
         """Sync entrypoint - just run a run in an async loop."""
-        asyncio.run(self.arun())
+        loop_factory = get_event_loop_factory()
+        if sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self.arun())
+        else:
+            # There is no loop_factory before Python 3.11, where event loop policies aren't deprecated yet
+            if loop_factory:
+                import uvloop
+
+                uvloop.install()
+            asyncio.run(self.arun())
 
     async def arun(self):
         """
@@ -846,6 +1400,9 @@ class TriggerRunner:
         """
         # Make sure comms are initialized before allowing any Triggers to run
         await self.init_comms()
+        if self.wakeup:
+            self.wakeup.setblocking(False)
+            asyncio.get_running_loop().add_reader(self.wakeup.fileno(), self._on_wakeup)
 
         watchdog = asyncio.create_task(self.block_watchdog())
 
@@ -863,12 +1420,13 @@ class TriggerRunner:
                 await self.sync_state_to_supervisor(finished_ids)
                 await self.create_triggers()
                 await self.cancel_triggers()
-                # Sleep for a bit
-                await asyncio.sleep(1)
+                # Sleep for a bit, unless there is something to do
+                await self.wait_for_activity(1)
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     count = len(self.triggers)
                     self.log.info("%i triggers currently running", count)
+                    self.emit_metrics(now - last_status)
                     last_status = now
 
         except Exception:
@@ -878,6 +1436,53 @@ class TriggerRunner:
             raise
         # Wait for supporting tasks to complete
         await watchdog
+        await get_shared_client_registry().aclose()
+
+    async def wait_for_activity(self, timeout: float) -> None:
+        """Wait until there is something to do for the main loop, for at most ``timeout`` seconds."""
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.activity.wait(), timeout)
+        self.activity.clear()
+
+    def _on_wakeup(self) -> None:
+        if TYPE_CHECKING:
+            assert self.wakeup
+        try:
+            data = self.wakeup.recv(4096)
+        except BlockingIOError:
+            return
+        if not data:
+            # The supervisor has gone away, we'll find out when we next talk to it
+            asyncio.get_running_loop().remove_reader(self.wakeup.fileno())
+        self.activity.set()
+
+    def _on_trigger_done(self, trigger_id: int, task: asyncio.Future) -> None:
+        self.done_trigger_ids[trigger_id] = None
+        self.activity.set()
+
+    def _on_trigger_step(self, classpath: str, name: str, duration: float) -> None:
+        self.loop_time[classpath] = self.loop_time.get(classpath, 0.0) + duration
+        if duration > self.max_step_time.get(classpath, 0.0):
+            self.max_step_time[classpath] = duration
+        if duration > 0.2:
+            self.log.warning(
+                "Trigger %s ran for %.2f seconds without yielding, blocking the event loop",
+                name,
+                duration,
+                classpath=classpath,
+                runner=self.runner_index,
+            )
+
+    def emit_metrics(self, elapsed: float) -> None:
+        """Emit how much of the event loop's time the triggers of each class took, since last called."""
+        for classpath, loop_time in self.loop_time.items():
+            tags = {"runner": str(self.runner_index), "trigger_class": classpath}
+            Stats.gauge("triggers.loop_usage", loop_time / elapsed, tags=tags)
+            Stats.timing(
+                "triggers.max_step_time", timedelta(seconds=self.max_step_time[classpath]), tags=tags
+            )
+        self.loop_time.clear()
+        self.max_step_time.clear()
 
     async def init_comms(self):
         """
@@ -902,12 +1507,19 @@ class TriggerRunner:
 
         if not isinstance(msg, messages.StartTriggerer):
             raise RuntimeError(f"Required first message to be a messages.StartTriggerer, it was {msg}")
+        self.runner_index = msg.runner_index
 
     async def create_triggers(self):
         """Drain the to_create queue and create all new triggers that have been requested in the DB."""
-        while self.to_create:
+        if not self.to_create:
+            return
+        to_create = list(self.to_create)
+        self.to_create.clear()
+        # Decrypting is CPU bound: do it for the whole batch in a thread, so triggers keep running meanwhile
+        all_kwargs = await asyncio.to_thread(self.decrypt_kwargs, [w.encrypted_kwargs for w in to_create])
+
+        for workload, kw in zip(to_create, all_kwargs):
             await asyncio.sleep(0)
-            workload = self.to_create.popleft()
             trigger_id = workload.id
             if trigger_id in self.triggers:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
@@ -932,9 +1544,15 @@ class TriggerRunner:
                 # not in `_decrypt_kwargs` because it is used during hash comparison in
                 # add_asset_trigger_references and could lead to adverse effects like hash mismatches
                 # that could cause None values in collections.
-                kw = Trigger._decrypt_kwargs(workload.encrypted_kwargs)
-                deserialised_kwargs = {k: smart_decode_trigger_kwargs(v) for k, v in kw.items()}
-                trigger_instance = trigger_class(**deserialised_kwargs)
+                if isinstance(kw, BaseException):
+                    raise kw
+                shared_trigger = None
+                if getattr(trigger_class, "shareable", False):
+                    shared_trigger = self.get_shared_trigger(workload.classpath, trigger_class, kw)
+                    trigger_instance = shared_trigger.subscribe(trigger_id)
+                else:
+                    deserialised_kwargs = {k: smart_decode_trigger_kwargs(v) for k, v in kw.items()}
+                    trigger_instance = trigger_class(**deserialised_kwargs)
             except TypeError as err:
                 self.log.error("Trigger failed to inflate", error=err)
                 self.failed_triggers.append((trigger_id, err))
@@ -949,14 +1567,69 @@ class TriggerRunner:
                 if ti
                 else f"ID {trigger_id}"
             )
+            timer = None if shared_trigger else trigger_instance.timer()
+            task: asyncio.Future
+            if timer:
+                # Timer triggers don't need a coroutine of their own, the timer service fires their event
+                moment, event = timer
+                task = self.timers.add(trigger_id, moment, event)
+            else:
+                task = asyncio.create_task(
+                    TimedCoroutine(
+                        self.run_trigger(trigger_id, trigger_instance),
+                        functools.partial(self._on_trigger_step, workload.classpath, trigger_name),
+                    ),
+                    name=trigger_name,
+                )
+            task.add_done_callback(functools.partial(self._on_trigger_done, trigger_id))
+            if shared_trigger:
+                # Also unsubscribe if the task is cancelled before it starts
+                task.add_done_callback(functools.partial(self._unsubscribe, shared_trigger, trigger_id))
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
-                    self.run_trigger(trigger_id, trigger_instance), name=trigger_name
-                ),
+                "task": task,
                 "name": trigger_name,
                 "events": 0,
             }
 
+    def get_shared_trigger(
+        self, classpath: str, trigger_class: type[BaseTrigger], kwargs: dict[str, Any]
+    ) -> SharedTrigger:
+        """
+        Get the running instance of a shareable trigger, creating it if there is none yet.
+
+        Instances are shared by triggers with the same classpath and kwargs, compared in their serialized
+        form as ``BaseEventTrigger.hash`` does.
+        """
+        from airflow.serialization.serialized_objects import BaseSerialization, smart_decode_trigger_kwargs
+
+        key = (classpath, json.dumps(BaseSerialization.serialize(kwargs), sort_keys=True))
+        if shared := self.shared_triggers.get(key):
+            Stats.incr("triggers.deduplicated")
+            return shared
+
+        def on_closed(closed: SharedTrigger) -> None:
+            if self.shared_triggers.get(key) is closed:
+                del self.shared_triggers[key]
+
+        deserialised_kwargs = {k: smart_decode_trigger_kwargs(v) for k, v in kwargs.items()}
+        shared = self.shared_triggers[key] = SharedTrigger(
+            trigger_class(**deserialised_kwargs),
+            on_closed,
+            on_step=functools.partial(self._on_trigger_step, classpath, f"shared {classpath}"),
+        )
+        return shared
+
+    def _fire_timer(self, trigger_id: int, event: events.TriggerEvent) -> None:
+        details = self.triggers[trigger_id]
+        self.log.info("Trigger fired event", name=details["name"], result=event, trigger_id=trigger_id)
+        details["events"] += 1
+        self.events.append((trigger_id, event))
+        self.activity.set()
+
+    @staticmethod
+    def _unsubscribe(shared_trigger: SharedTrigger, trigger_id: int, task: asyncio.Task) -> None:
+        shared_trigger.unsubscribe(trigger_id)
+
     async def cancel_triggers(self):
         """
         Drain the to_cancel queue and ensure all triggers that are not in the DB are cancelled.
@@ -972,13 +1645,15 @@ class TriggerRunner:
 
     async def cleanup_finished_triggers(self) -> list[int]:
         """
-        Go through all trigger tasks (coroutines) and clean up entries for ones that have exited.
+        Go through the trigger tasks (coroutines) that are done and clean up their entries.
 
         Optionally warn users if the exit was not normal.
         """
         finished_ids: list[int] = []
-        for trigger_id, details in list(self.triggers.items()):
-            if details["task"].done():
+        done_trigger_ids, self.done_trigger_ids = self.done_trigger_ids, {}
+        for trigger_id in done_trigger_ids:
+            details = self.triggers.get(trigger_id)
+            if details and details["task"].done():
                 finished_ids.append(trigger_id)
                 # Check to see if it exited for good reasons
                 saved_exc = None
@@ -1032,8 +1707,13 @@ class TriggerRunner:
             failures_to_send.append((id, tb))
 
         msg = messages.TriggerStateChanges(
-            events=events_to_send, finished=finished_ids, failures=failures_to_send
+            events=events_to_send,
+            finished=finished_ids,
+            failures=failures_to_send,
+            loop_lag=self.loop_lag,
+            cpu_time=time.process_time(),
         )
+        self.loop_lag = 0.0
 
         if not events_to_send:
             msg.events = None
@@ -1067,8 +1747,8 @@ class TriggerRunner:
         there are badly-written triggers taking longer than that and blocking
         the event loop.
 
-        Unfortunately, we can't tell what trigger is blocking things, but
-        we can at least detect the top-level problem.
+        It also reports the lag of every run as a histogram. The trigger
+        that blocks is reported as it returns control to the event loop.
         """
         while not self.stop:
             last_run = time.monotonic()
@@ -1076,14 +1756,21 @@ class TriggerRunner:
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            self.loop_lag = max(self.loop_lag, time_elapsed - 0.1)
+            Stats.timing(
+                "triggerer.runner.loop_lag",
+                timedelta(seconds=max(0.0, time_elapsed - 0.1)),
+                tags={"runner": str(self.runner_index)},
+            )
             if time_elapsed > 0.2:
                 await self.log.ainfo(
                     "Triggerer's async thread was blocked for %.2f seconds, "
                     "likely by a badly-written trigger. Set PYTHONASYNCIODEBUG=1 "
                     "to get more information on overrunning coroutines.",
                     time_elapsed,
+                    runner=self.runner_index,
                 )
-                Stats.incr("triggers.blocked_main_thread")
+                Stats.incr("triggers.blocked_main_thread", tags={"runner": str(self.runner_index)})
 
     async def run_trigger(self, trigger_id, trigger):
         """Run a trigger (they are async generators) and push their events into our outbound event deque."""
@@ -1098,6 +1785,7 @@ class TriggerRunner:
                 )
                 self.triggers[trigger_id]["events"] += 1
                 self.events.append((trigger_id, event))
+                self.activity.set()
         except asyncio.CancelledError:
             # We get cancelled by the scheduler changing the task state. But if we do lets give a nice error
             # message about it
@@ -1116,6 +1804,17 @@ class TriggerRunner:
 
             await self.log.ainfo("trigger completed", name=name)
 
+    @staticmethod
+    def decrypt_kwargs(encrypted_kwargs: list[str]) -> list[dict[str, Any] | BaseException]:
+        """Decrypt the kwargs of a batch of triggers, giving the exception instead for those that fail."""
+        results: list[dict[str, Any] | BaseException] = []
+        for encrypted in encrypted_kwargs:
+            try:
+                results.append(Trigger._decrypt_kwargs(encrypted))
+            except Exception as e:
+                results.append(e)
+        return results
+
     def get_trigger_by_classpath(self, classpath: str) -> type[BaseTrigger]:
         """
         Get a trigger class by its classpath ("path.to.module.classname").
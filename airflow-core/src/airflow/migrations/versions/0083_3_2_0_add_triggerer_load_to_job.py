@@ -0,0 +1,54 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add triggerer load to job.
+
+Revision ID: 324674d6e02b
+Revises: 7582ea3f3dd5
+Create Date: 2026-10-19 12:10:41.318270
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "324674d6e02b"
+down_revision = "7582ea3f3dd5"
+branch_labels = None
+depends_on = None
+airflow_version = "3.2.0"
+
+
+def upgrade():
+    """Add loop_lag, cpu_usage and trigger_cost to job."""
+    with op.batch_alter_table("job", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("loop_lag", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("cpu_usage", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("trigger_cost", sa.Float(), nullable=True))
+
+
+def downgrade():
+    """Remove loop_lag, cpu_usage and trigger_cost from job."""
+    with op.batch_alter_table("job", schema=None) as batch_op:
+        batch_op.drop_column("trigger_cost")
+        batch_op.drop_column("cpu_usage")
+        batch_op.drop_column("loop_lag")
@@ -18,13 +18,14 @@ from __future__ import annotations
 
 import datetime
 import logging
+import math
 from collections.abc import Iterable
 from enum import Enum
 from functools import singledispatch
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Column, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import Column, Integer, String, Text, delete, event, func, or_, select, update
 from sqlalchemy.orm import Session, relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
 
@@ -40,7 +41,8 @@ from airflow.utils.sqlalchemy import UtcDateTime, with_row_locks
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Select
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.sql import ColumnElement, Select
 
     from airflow.triggers.base import BaseTrigger, TriggerEvent
 
@@ -52,6 +54,14 @@ Internal use only.
 :meta private:
 """
 
+TRIGGERS_CHANGED_CHANNEL = "airflow_triggers_changed"
+"""Postgres notification channel triggerers listen on to learn that triggers were created or deleted.
+
+Internal use only.
+
+:meta private:
+"""
+
 log = logging.getLogger(__name__)
 
 
@@ -230,9 +240,11 @@ class Trigger(Base):
         if session.bind.dialect.name == "mysql":
             # MySQL doesn't support DELETE with JOIN, so we need to do it in two steps
             ids = session.scalars(ids).all()
-        session.execute(
+        result = session.execute(
             delete(Trigger).where(Trigger.id.in_(ids)).execution_options(synchronize_session=False)
         )
+        if result.rowcount:
+            notify_triggers_changed(session.connection())
 
     @classmethod
     @provide_session
@@ -265,6 +277,74 @@ class Trigger(Base):
         if trigger.deadline:
             trigger.deadline.handle_callback_event(event, session)
 
+    @classmethod
+    @provide_session
+    def submit_events(
+        cls, events: Iterable[tuple[int, TriggerEvent]], session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire many events at once.
+
+        This is equivalent to calling :meth:`submit_event` for each ``(trigger_id, event)`` pair in
+        order, but task instances resumed by a plain ``TriggerEvent`` are updated with set-based
+        statements instead of being loaded and flushed one at a time. Events with a dedicated
+        ``handle_event_submit`` implementation (such as ``BaseTaskEndEvent``, which pushes XComs and
+        sends callbacks) still go through it for each task instance.
+        """
+        events = list(events)
+        if not events:
+            return
+
+        # Only the first event of a trigger can resume its task instances; later ones find them
+        # no longer deferred, exactly as they would when submitted one by one.
+        first_events: dict[int, TriggerEvent] = {}
+        for trigger_id, trigger_event in events:
+            first_events.setdefault(trigger_id, trigger_event)
+
+        default_handler = handle_event_submit.dispatch(object)
+        bulk_events: dict[int, TriggerEvent] = {}
+        dispatched_events: dict[int, TriggerEvent] = {}
+        for trigger_id, trigger_event in first_events.items():
+            if handle_event_submit.dispatch(type(trigger_event)) is default_handler:
+                bulk_events[trigger_id] = trigger_event
+            else:
+                dispatched_events[trigger_id] = trigger_event
+
+        if bulk_events:
+            _resume_task_instances(bulk_events, session=session)
+        if dispatched_events:
+            for task_instance in session.scalars(
+                select(TaskInstance).where(
+                    TaskInstance.trigger_id.in_(dispatched_events),
+                    TaskInstance.state == TaskInstanceState.DEFERRED,
+                )
+            ):
+                handle_event_submit(
+                    dispatched_events[task_instance.trigger_id], task_instance=task_instance, session=session
+                )
+
+        # Send the events to assets and deadlines
+        triggers = {
+            trigger.id: trigger
+            for trigger in session.scalars(
+                select(cls)
+                .where(cls.id.in_(first_events))
+                .options(selectinload(cls.assets), selectinload(cls.deadline))
+            )
+        }
+        for trigger_id, trigger_event in events:
+            if (trigger := triggers.get(trigger_id)) is None:
+                # Already deleted for some reason
+                continue
+            for asset in trigger.assets:
+                AssetManager.register_asset_change(
+                    asset=asset.to_public(),
+                    extra={"from_trigger": True, "payload": trigger_event.payload},
+                    session=session,
+                )
+            if trigger.deadline:
+                trigger.deadline.handle_callback_event(trigger_event, session)
+
     @classmethod
     @provide_session
     def submit_failure(cls, trigger_id, exc=None, session: Session = NEW_SESSION) -> None:
@@ -309,7 +389,12 @@ class Trigger(Base):
     @classmethod
     @provide_session
     def assign_unassigned(
-        cls, triggerer_id, capacity, health_check_threshold, session: Session = NEW_SESSION
+        cls,
+        triggerer_id,
+        capacity,
+        health_check_threshold,
+        max_loop_lag: float | None = None,
+        session: Session = NEW_SESSION,
     ) -> None:
         """
         Assign unassigned triggers based on a number of conditions.
@@ -317,6 +402,11 @@ class Trigger(Base):
         Takes a triggerer_id, the capacity for that triggerer and the Triggerer job heartrate
         health check threshold, and assigns unassigned triggers until that capacity is reached,
         or there are no more unassigned triggers.
+
+        If ``max_loop_lag`` is given, the load the triggerers report on their job is taken into account
+        too: a triggerer whose event loop lags by more than ``max_loop_lag`` seconds takes no triggers,
+        one that already runs expensive triggers takes fewer, and the unassigned triggers are shared out
+        between the live triggerers in proportion to the load they can still take.
         """
         from airflow.jobs.job import Job  # To avoid circular import
 
@@ -326,11 +416,20 @@ class Trigger(Base):
         if capacity <= 0:
             return
 
-        alive_triggerer_ids = select(Job.id).where(
-            Job.end_date.is_(None),
-            Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
-            Job.job_type == "TriggererJob",
-        )
+        alive_triggerer_ids = select(Job.id).where(*_alive_triggerer_filter(health_check_threshold))
+
+        if max_loop_lag is not None:
+            capacity = cls._load_aware_capacity(
+                triggerer_id,
+                capacity=capacity,
+                count=count,
+                health_check_threshold=health_check_threshold,
+                max_loop_lag=max_loop_lag,
+                alive_triggerer_ids=alive_triggerer_ids,
+                session=session,
+            )
+            if capacity <= 0:
+                return
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
@@ -347,6 +446,102 @@ class Trigger(Base):
 
         session.commit()
 
+    @classmethod
+    def _load_aware_capacity(
+        cls,
+        triggerer_id,
+        *,
+        capacity: int,
+        count: int,
+        health_check_threshold,
+        max_loop_lag: float,
+        alive_triggerer_ids: Select,
+        session: Session,
+    ) -> int:
+        """Limit the number of triggers a triggerer takes by its load and that of the other triggerers."""
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        headroom: dict[int, float] = {}
+        for job_id, loop_lag, trigger_cost in session.execute(
+            select(Job.id, Job.loop_lag, Job.trigger_cost).where(
+                *_alive_triggerer_filter(health_check_threshold)
+            )
+        ):
+            if loop_lag is not None and loop_lag > max_loop_lag:
+                headroom[job_id] = 0
+            else:
+                # Triggerers that haven't reported their load yet have just started
+                headroom[job_id] = max(0.0, 1.0 - (trigger_cost or 0.0))
+            if job_id == triggerer_id and trigger_cost and count:
+                # Assume new triggers cost as much as the ones we already run
+                capacity = min(capacity, round(headroom[job_id] * count / trigger_cost))
+
+        own_headroom = headroom.setdefault(triggerer_id, 1.0)
+        if own_headroom <= 0 or capacity <= 0:
+            return 0
+        unassigned = session.scalar(
+            select(func.count(cls.id)).where(
+                or_(cls.triggerer_id.is_(None), cls.triggerer_id.not_in(alive_triggerer_ids))
+            )
+        )
+        return min(capacity, math.ceil(unassigned * own_headroom / sum(headroom.values())))
+
+    @classmethod
+    @provide_session
+    def release_excess(
+        cls, triggerer_id, health_check_threshold, threshold: float = 0.2, session: Session = NEW_SESSION
+    ) -> int:
+        """
+        Hand back triggers of a triggerer that is much more loaded than the live triggerers on average.
+
+        If the trigger cost the triggerer reported is more than ``threshold`` above the average of the
+        live triggerers, enough of its most recently created triggers are unassigned to bring it down to
+        the average, so that less loaded triggerers take them over.
+
+        :return: The number of triggers handed back.
+        """
+        from airflow.jobs.job import Job  # To avoid circular import
+
+        costs = dict(
+            session.execute(
+                select(Job.id, coalesce(Job.trigger_cost, 0)).where(
+                    *_alive_triggerer_filter(health_check_threshold)
+                )
+            ).all()
+        )
+        own_cost = costs.get(triggerer_id)
+        if not own_cost or len(costs) < 2:
+            return 0
+        average = sum(costs.values()) / len(costs)
+        if own_cost - average <= threshold:
+            return 0
+
+        count = session.scalar(select(func.count(cls.id)).where(cls.triggerer_id == triggerer_id))
+        if not (to_release := int(count * (own_cost - average) / own_cost)):
+            return 0
+        ids = session.scalars(
+            select(cls.id)
+            .where(cls.triggerer_id == triggerer_id)
+            .order_by(cls.created_date.desc())
+            .limit(to_release)
+        ).all()
+        session.execute(
+            update(cls)
+            .where(cls.id.in_(ids), cls.triggerer_id == triggerer_id)
+            .values(triggerer_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        notify_triggers_changed(session.connection())
+        session.commit()
+        log.info(
+            "Handed back %d triggers of triggerer %s (trigger cost %.2f, average %.2f)",
+            len(ids),
+            triggerer_id,
+            own_cost,
+            average,
+        )
+        return len(ids)
+
     @classmethod
     def get_sorted_triggers(cls, capacity: int, alive_triggerer_ids: list[int] | Select, session: Session):
         """
@@ -385,6 +580,33 @@ class Trigger(Base):
         return result
 
 
+def _alive_triggerer_filter(health_check_threshold) -> tuple[ColumnElement[bool], ...]:
+    from airflow.jobs.job import Job  # To avoid circular import
+
+    return (
+        Job.end_date.is_(None),
+        Job.latest_heartbeat > timezone.utcnow() - datetime.timedelta(seconds=health_check_threshold),
+        Job.job_type == "TriggererJob",
+    )
+
+
+def notify_triggers_changed(connection: Connection) -> None:
+    """
+    Let the triggerers know that triggers were created or deleted, so they don't wait to poll for it.
+
+    This uses Postgres notifications, which are sent once the transaction commits (only once for all the
+    identical ones in a transaction); on other databases the triggerers only poll.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(select(func.pg_notify(TRIGGERS_CHANGED_CHANNEL, "")))
+
+
+@event.listens_for(Trigger, "after_insert")
+@event.listens_for(Trigger, "after_delete")
+def _notify_triggers_changed(mapper, connection: Connection, target: Trigger) -> None:
+    notify_triggers_changed(connection)
+
+
 @singledispatch
 def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
     """
@@ -417,6 +639,41 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
     session.flush()
 
 
+def _resume_task_instances(events: dict[int, TriggerEvent], *, session: Session) -> None:
+    """
+    Resume the task instances deferred on the given triggers, in bulk.
+
+    Does what the default ``handle_event_submit`` does for each task instance, with one
+    executemany statement for the per-row ``next_kwargs`` and one set-based statement for the
+    columns that are the same for every row.
+
+    :param events: The event to resume with, keyed by trigger id.
+    :param session: The database session.
+    """
+    rows = session.execute(
+        select(TaskInstance.id, TaskInstance.trigger_id, TaskInstance.next_kwargs).where(
+            TaskInstance.trigger_id.in_(events), TaskInstance.state == TaskInstanceState.DEFERRED
+        )
+    ).all()
+    if not rows:
+        return
+    session.bulk_update_mappings(
+        TaskInstance,
+        [
+            {"id": ti_id, "next_kwargs": {**(next_kwargs or {}), "event": events[trigger_id].payload}}
+            for ti_id, trigger_id, next_kwargs in rows
+        ],
+    )
+    session.execute(
+        update(TaskInstance)
+        .where(
+            TaskInstance.id.in_([row.id for row in rows]), TaskInstance.state == TaskInstanceState.DEFERRED
+        )
+        .values(trigger_id=None, state=TaskInstanceState.SCHEDULED, scheduled_dttm=timezone.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
 @handle_event_submit.register
 def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session) -> None:
     """
@@ -18,10 +18,11 @@ from __future__ import annotations
 
 import abc
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Hashable
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from datetime import timedelta
-from typing import Annotated, Any
+from datetime import datetime, timedelta
+from typing import Annotated, Any, ClassVar
 
 import structlog
 from pydantic import (
@@ -63,6 +64,14 @@ class BaseTrigger(abc.ABC, LoggingMixin):
     let them be re-instantiated elsewhere.
     """
 
+    shareable: ClassVar[bool] = False
+    """
+    Whether triggers of this class with the same kwargs can share one running instance in the triggerer.
+
+    The events of the shared instance are sent to every trigger sharing it. Only set this if ``run`` does not
+    depend on ``task_instance`` or ``trigger_id``.
+    """
+
     def __init__(self, **kwargs):
         # these values are set by triggerer when preparing to run the instance
         # when run, they are injected into logger record.
@@ -102,6 +111,44 @@ class BaseTrigger(abc.ABC, LoggingMixin):
         raise NotImplementedError("Triggers must implement run()")
         yield  # To convince Mypy this is an async iterator.
 
+    def timer(self) -> tuple[datetime, TriggerEvent] | None:
+        """
+        Return the moment this trigger fires at and the event it fires, if that is all it does.
+
+        The triggerer then fires the event from its timer service at that moment, rather than running
+        ``run``, which saves a coroutine per trigger. Triggers that wait on anything other than the clock
+        must return None.
+        """
+        return None
+
+    def shared_client(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        *,
+        close: Callable[[Any], Any] | None = None,
+    ) -> AbstractAsyncContextManager[Any]:
+        """
+        Use a client shared by the triggers of the triggerer asking for the same ``key``.
+
+        Rather than each trigger opening its own client, and connections, to a service, the triggers using
+        the same connection can share one by using the hook class and connection id as key. The first
+        trigger to ask for the client creates it with ``factory``, which may be async, and it is closed
+        with ``close`` (by default, with its ``aclose`` or ``close`` method) once no trigger has used it for
+        ``[triggerer] shared_client_idle_timeout`` seconds. The client must be safe to use by several
+        triggers at once, and triggers must not close it themselves.
+
+        .. code-block:: python
+
+            async def run(self):
+                key = (HttpAsyncHook, self.http_conn_id)
+                async with self.shared_client(key, aiohttp.ClientSession) as session:
+                    ...
+        """
+        from airflow.triggers.clients import get_shared_client_registry
+
+        return get_shared_client_registry().client(key, factory, close=close)
+
     async def cleanup(self) -> None:
         """
         Cleanup the trigger.
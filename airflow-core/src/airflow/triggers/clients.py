@@ -0,0 +1,167 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Async clients shared by the triggers running in a triggerer."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Callable, Hashable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import structlog
+
+from airflow.configuration import conf
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+class _SharedClient:
+    """A client of the registry, with the triggers using it."""
+
+    __slots__ = ("close", "created", "evict_handle", "users")
+
+    def __init__(self, created: asyncio.Future, close: Callable[[Any], Any] | None):
+        self.created = created
+        self.close = close
+        self.users = 0
+        self.evict_handle: asyncio.TimerHandle | None = None
+
+    def cancel_eviction(self) -> None:
+        if self.evict_handle:
+            self.evict_handle.cancel()
+            self.evict_handle = None
+
+
+class SharedClientRegistry:
+    """
+    Async clients shared by the triggers of an event loop, by key.
+
+    The first trigger to ask for a key creates its client, which the other triggers asking for the same key
+    then use too. A client is closed once no trigger has used it for ``idle_timeout`` seconds.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, idle_timeout: float):
+        self.loop = loop
+        self.idle_timeout = idle_timeout
+        self._clients: dict[Hashable, _SharedClient] = {}
+        self._closing: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @asynccontextmanager
+    async def client(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        *,
+        close: Callable[[Any], Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Use the client of ``key``, creating it with ``factory`` if there is none.
+
+        :param key: The key of the client, such as the hook class and connection id it is for.
+        :param factory: Creates the client, returning it or an awaitable of it.
+        :param close: Closes the client, by default with its ``aclose`` or ``close`` method.
+        """
+        shared = self._clients.get(key)
+        if shared is None:
+            shared = self._clients[key] = _SharedClient(self.loop.create_task(self._create(factory)), close)
+            shared.created.add_done_callback(lambda created: self._forget_failed(key, shared))
+        shared.users += 1
+        shared.cancel_eviction()
+        try:
+            # Shield the creation, which the other triggers asking for the client also wait for
+            client = await asyncio.shield(shared.created)
+            yield client
+        finally:
+            self._release(key, shared)
+
+    @staticmethod
+    async def _create(factory: Callable[[], Any]) -> Any:
+        client = factory()
+        if inspect.isawaitable(client):
+            client = await client
+        return client
+
+    def _forget_failed(self, key: Hashable, shared: _SharedClient) -> None:
+        """Forget a client that could not be created, for the next trigger asking for it to try again."""
+        if (shared.created.cancelled() or shared.created.exception()) and self._clients.get(key) is shared:
+            del self._clients[key]
+
+    def _release(self, key: Hashable, shared: _SharedClient) -> None:
+        shared.users -= 1
+        if shared.users or self._clients.get(key) is not shared:
+            return
+        if shared.created.done():
+            shared.evict_handle = self.loop.call_later(self.idle_timeout, self._evict, key, shared)
+        else:
+            # Nobody waits for the client any longer
+            shared.created.cancel()
+
+    def _evict(self, key: Hashable, shared: _SharedClient) -> None:
+        shared.evict_handle = None
+        if shared.users or self._clients.get(key) is not shared:
+            return
+        del self._clients[key]
+        log.debug("Closing idle shared client", key=key)
+        task = self.loop.create_task(self._close(shared))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(shared: _SharedClient) -> None:
+        if shared.created.cancelled() or shared.created.exception():
+            return
+        client = shared.created.result()
+        try:
+            if shared.close:
+                result = shared.close(client)
+            elif closer := getattr(client, "aclose", None) or getattr(client, "close", None):
+                result = closer()
+            else:
+                return
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            log.exception("Failed to close shared client", client=client)
+
+    async def aclose(self) -> None:
+        """Close all the clients, whether or not triggers still use them."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for shared in clients:
+            shared.cancel_eviction()
+            if not shared.created.done():
+                shared.created.cancel()
+        await asyncio.gather(*(self._close(shared) for shared in clients if shared.created.done()))
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+
+_registry: SharedClientRegistry | None = None
+
+
+def get_shared_client_registry() -> SharedClientRegistry:
+    """Return the registry of shared clients of the running event loop."""
+    global _registry
+    loop = asyncio.get_running_loop()
+    if _registry is None or _registry.loop is not loop:
+        _registry = SharedClientRegistry(loop, conf.getfloat("triggerer", "shared_client_idle_timeout"))
+    return _registry
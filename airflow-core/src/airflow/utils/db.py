@@ -96,6 +96,7 @@ _REVISION_HEADS_MAP: dict[str, str] = {
     "3.0.0": "29ce7909c52b",
     "3.0.3": "fe199e1abd77",
     "3.1.0": "7582ea3f3dd5",
+    "3.2.0": "324674d6e02b",
 }
 
 
@@ -24,10 +24,12 @@ import urllib.parse
 import httpx
 import pytest
 from fastapi import FastAPI, HTTPException, Path, Request, status
+from sqlalchemy import update
 
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.execution_api.datamodels.xcom import XComResponse
 from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
 from airflow.models.taskmap import TaskMap
 from airflow.models.xcom import XComModel
 from airflow.providers.standard.operators.empty import EmptyOperator
@@ -36,6 +38,9 @@ from airflow.utils.session import create_session
 
 pytestmark = pytest.mark.db_test
 
+# The task instance id in the tokens of the test client
+CALLER_TI_ID = "00000000-0000-0000-0000-000000000000"
+
 
 @pytest.fixture(autouse=True)
 def reset_db():
@@ -323,6 +328,110 @@ class TestXComsGetEndpoint:
         assert set(response.json()) == set(expected_xcoms)
 
 
+class TestXComsBulkGetEndpoint:
+    @staticmethod
+    def _make_caller(dag_run, session):
+        """Make a task of the run the caller, whose token the test client authenticates with."""
+        ti = dag_run.get_task_instances(session=session)[0]
+        session.execute(update(TaskInstance).where(TaskInstance.id == ti.id).values(id=CALLER_TI_ID))
+
+    @pytest.fixture
+    def mapped_xcoms(self, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator.partial(task_id="task_a").expand(doc_md=["x", "y", "z"])
+            EmptyOperator(task_id="task_b")
+        dag_run = dag_maker.create_dagrun(run_id="runid")
+
+        for task_id, map_index, value in [
+            ("task_a", 2, "a2"),
+            ("task_a", 0, "a0"),
+            ("task_b", -1, "b"),
+        ]:
+            session.add(
+                XComModel(
+                    key="xcom_1",
+                    value=value,
+                    dag_run_id=dag_run.id,
+                    run_id=dag_run.run_id,
+                    task_id=task_id,
+                    dag_id=dag_run.dag_id,
+                    map_index=map_index,
+                )
+            )
+        self._make_caller(dag_run, session)
+        session.commit()
+
+    @pytest.mark.usefixtures("mapped_xcoms")
+    def test_xcom_get_bulk_all_map_indexes(self, client):
+        response = client.post(
+            "/execution/xcoms/dag/runid/bulk",
+            json={"key": "xcom_1", "task_ids": ["task_b", "task_a", "missing"]},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "xcoms": [
+                {"task_id": "task_b", "map_index": -1, "value": "b"},
+                {"task_id": "task_a", "map_index": 0, "value": "a0"},
+                {"task_id": "task_a", "map_index": 2, "value": "a2"},
+            ]
+        }
+
+    @pytest.mark.usefixtures("mapped_xcoms")
+    def test_xcom_get_bulk_with_map_indexes(self, client):
+        response = client.post(
+            "/execution/xcoms/dag/runid/bulk",
+            json={"key": "xcom_1", "task_ids": ["task_a", "task_b"], "map_indexes": [1, 2, -1]},
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "xcoms": [
+                {"task_id": "task_a", "map_index": 2, "value": "a2"},
+                {"task_id": "task_b", "map_index": -1, "value": "b"},
+            ]
+        }
+
+    def test_xcom_get_bulk_returns_latest_with_include_prior_dates(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task")
+
+        for run_id, logical_date in [("earlier_run", "2024-01-01"), ("later_run", "2024-01-02")]:
+            dag_run = dag_maker.create_dagrun(run_id=run_id, logical_date=timezone.parse(logical_date))
+            session.add(
+                XComModel(
+                    key="test_key",
+                    value=run_id,
+                    dag_run_id=dag_run.id,
+                    run_id=run_id,
+                    task_id="task",
+                    dag_id="dag",
+                )
+            )
+        self._make_caller(dag_run, session)
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/later_run/bulk",
+            json={"key": "test_key", "task_ids": ["task"], "map_indexes": [-1], "include_prior_dates": True},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"xcoms": [{"task_id": "task", "map_index": -1, "value": "later_run"}]}
+
+    def test_xcom_get_bulk_denied_for_task_of_another_run(self, client, dag_maker, session):
+        with dag_maker(dag_id="dag"):
+            EmptyOperator(task_id="task")
+
+        for run_id, logical_date in [("other_run", "2024-01-01"), ("caller_run", "2024-01-02")]:
+            dag_run = dag_maker.create_dagrun(run_id=run_id, logical_date=timezone.parse(logical_date))
+        self._make_caller(dag_run, session)
+        session.commit()
+
+        response = client.post(
+            "/execution/xcoms/dag/other_run/bulk", json={"key": "test_key", "task_ids": ["task"]}
+        )
+        assert response.status_code == 403
+        assert response.json()["detail"]["reason"] == "access_denied"
+
+
 class TestXComsSetEndpoint:
     @pytest.mark.parametrize(
         ("value", "expected_value"),
@@ -31,7 +31,7 @@ from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.cli.cli_config import DefaultHelpParser, GroupCommand
 from airflow.cli.cli_parser import AirflowHelpFormatter
 from airflow.executors import workloads
-from airflow.executors.base_executor import BaseExecutor, RunningRetryAttemptType
+from airflow.executors.base_executor import BaseExecutor, QueuedTasks, RunningRetryAttemptType
 from airflow.executors.local_executor import LocalExecutor
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
@@ -67,6 +67,10 @@ def test_serve_logs_default_value():
     assert not BaseExecutor.serve_logs
 
 
+def test_no_capacity_hint_by_default():
+    assert BaseExecutor().capacity_hint() is None
+
+
 def test_no_cli_commands_vended():
     assert not BaseExecutor.get_cli_commands()
 
@@ -220,6 +224,71 @@ def test_trigger_queued_tasks(dag_maker):
     assert len(call_args) == 3
 
 
+@pytest.mark.db_test
+def test_trigger_tasks_takes_highest_priority(dag_maker):
+    executor, dagrun = setup_trigger_tasks(dag_maker)
+    for key, priority_weight in zip(list(executor.queued_tasks), [1, 3, 2]):
+        workload = executor.queued_tasks[key]
+        workload.ti.priority_weight = priority_weight
+        executor.queued_tasks[key] = workload
+
+    executor.trigger_tasks(open_slots=2)
+
+    triggered = executor._process_workloads.call_args.args[0]
+    assert [workload.ti.task_id for workload in triggered] == ["task_2", "task_3"]
+    assert [workload.ti.task_id for _, workload in executor.order_queued_tasks_by_priority()] == [
+        "task_2",
+        "task_3",
+        "task_1",
+    ]
+
+
+def _queued_workload(priority_weight):
+    return mock.Mock(ti=mock.Mock(priority_weight=priority_weight))
+
+
+class TestQueuedTasks:
+    def test_is_a_mapping(self):
+        workload_a, workload_b = _queued_workload(1), _queued_workload(2)
+        queued = QueuedTasks({"a": workload_a})
+        queued["b"] = workload_b
+
+        assert queued == {"a": workload_a, "b": workload_b}
+        assert list(queued) == ["a", "b"]
+        assert "a" in queued
+        assert queued.pop("a") is workload_a
+        assert "a" not in queued
+        assert len(queued) == 1
+        assert queued.copy() == {"b": workload_b}
+        with pytest.raises(KeyError):
+            del queued["a"]
+
+    def test_highest_priority(self):
+        workloads_by_key = {key: _queued_workload(weight) for key, weight in zip("abcde", [1, 5, 3, 5, 2])}
+        queued = QueuedTasks(workloads_by_key)
+
+        assert [key for key, _ in queued.highest_priority(3)] == ["b", "d", "c"]
+        # Taking them leaves them queued
+        assert len(queued) == 5
+        assert [key for key, _ in queued.highest_priority(10)] == ["b", "d", "c", "e", "a"]
+
+        del queued["b"]
+        queued["a"] = _queued_workload(4)
+        queued["f"] = _queued_workload(5)
+
+        assert [key for key, _ in queued.highest_priority(3)] == ["d", "f", "a"]
+        assert queued.highest_priority(3)[2] == ("a", queued["a"])
+
+    def test_removed_workloads_are_dropped_from_heap(self):
+        queued = QueuedTasks({key: _queued_workload(key) for key in range(100)})
+
+        for key in range(90):
+            del queued[key]
+
+        assert len(queued._heap) < 20
+        assert [key for key, _ in queued.highest_priority(20)] == list(range(99, 89, -1))
+
+
 @pytest.mark.db_test
 def test_trigger_running_tasks(dag_maker):
     """Test that trigger_tasks() works when tasks are re-queued."""
@@ -19,6 +19,9 @@ from __future__ import annotations
 
 import multiprocessing
 import os
+import socket
+import sys
+import time
 from unittest import mock
 
 import pytest
@@ -27,7 +30,8 @@ from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
 from airflow.executors import workloads
-from airflow.executors.local_executor import LocalExecutor, _execute_work
+from airflow.executors.local_executor import LocalExecutor, _Channel, _execute_work, _WarmDagFiles
+from airflow.sdk.execution_time.task_runner import PREPARSED_DAG_BAGS
 from airflow.utils.state import State
 
 from tests_common.test_utils.config import conf_vars
@@ -86,8 +90,6 @@ class TestLocalExecutor:
         executor = LocalExecutor(parallelism=parallelism)
         executor.start()
 
-        assert executor.result_queue.empty()
-
         with spy_on(executor._spawn_worker) as spawn_worker:
             for ti in success_tis:
                 executor.queue_workload(
@@ -118,11 +120,12 @@ class TestLocalExecutor:
 
         # By that time Queues are already shutdown so we cannot check if they are empty
         assert len(executor.running) == 0
-        assert executor._unread_messages.value == 0
+        assert not executor._pending
 
         for ti in success_tis:
             assert executor.event_buffer[ti.key][0] == State.SUCCESS
         assert executor.event_buffer[fail_ti.key][0] == State.FAILED
+        assert executor.event_buffer[fail_ti.key][1] == "RuntimeError('fake failure')"
 
     @skip_spawn_mp_start
     @pytest.mark.parametrize(
@@ -212,3 +215,159 @@ class TestLocalExecutor:
                 server=expected_server,
                 log_path=mock.ANY,
             )
+
+
+class TestChannel:
+    def test_messages_are_received_whole(self):
+        executor_end, worker_end = map(_Channel, socket.socketpair())
+        try:
+            worker_end.send(["key", "success"])
+            worker_end.send({"big": "x" * 100_000})
+            frame = bytearray(4)
+            _Channel.encoder.encode_into(None, frame, 4)
+            frame[:4] = (len(frame) - 4).to_bytes(4, byteorder="big")
+            # Only part of the last message has arrived yet
+            worker_end.sock.sendall(frame[:2])
+
+            messages = []
+            while len(messages) < 2:
+                messages += executor_end.receive_available()
+            assert messages == [["key", "success"], {"big": "x" * 100_000}]
+            assert executor_end.receive_available() == []
+
+            worker_end.sock.sendall(frame[2:])
+            assert executor_end.receive_available() == [None]
+
+            executor_end.send("workload")
+            assert worker_end.receive() == "workload"
+        finally:
+            executor_end.close()
+            worker_end.close()
+
+
+DAG_FILE = """
+import warm_helpers
+
+from airflow.sdk import DAG, BaseOperator
+
+with DAG("warm"):
+    BaseOperator(task_id=warm_helpers.TASK_ID)
+"""
+
+
+class TestWarmDagFiles:
+    @pytest.fixture
+    def bundle_dir(self, tmp_path):
+        """Serve every version of the bundle from its own directory, like versioned bundles do."""
+
+        def write(version, task_id):
+            bundle_path = tmp_path / (version or "unversioned")
+            bundle_path.mkdir(exist_ok=True)
+            (bundle_path / "warm.py").write_text(DAG_FILE)
+            helpers = bundle_path / "warm_helpers.py"
+            helpers.write_text(f"TASK_ID = {task_id!r}\n")
+            # Make sure a rewrite is noticed even within the mtime resolution
+            os.utime(helpers, (helpers.stat().st_atime, helpers.stat().st_mtime + len(task_id)))
+            return bundle_path
+
+        with mock.patch("airflow.dag_processing.bundles.manager.DagBundlesManager.get_bundle") as get_bundle:
+            get_bundle.side_effect = lambda name, version: mock.Mock(
+                path=tmp_path / (version or "unversioned")
+            )
+            yield write
+
+        PREPARSED_DAG_BAGS.clear()
+        sys.modules.pop("warm_helpers", None)
+        sys.path[:] = [path for path in sys.path if not path.startswith(os.fspath(tmp_path))]
+
+    @staticmethod
+    def _workload(task_id, version=None, dag_rel_path="warm.py"):
+        ti = workloads.TaskInstance(
+            id=uuid7(),
+            dag_version_id=uuid7(),
+            task_id=task_id,
+            dag_id="warm",
+            run_id="run1",
+            try_number=1,
+            pool_slots=1,
+            queue="default",
+            priority_weight=1,
+            map_index=-1,
+        )
+        return workloads.ExecuteTask(
+            token="",
+            ti=ti,
+            dag_rel_path=dag_rel_path,
+            log_path=None,
+            bundle_info=dict(name="bundle", version=version),
+        )
+
+    def test_dag_file_is_parsed_once_for_task_processes(self, bundle_dir):
+        bundle_dir(None, "a")
+        warm_dag_files = _WarmDagFiles(max_size=2)
+
+        warm_dag_files.prepare(mock.Mock(), self._workload("a"))
+        dag_bag = PREPARSED_DAG_BAGS[("bundle", None, "warm.py")]
+        warm_dag_files.prepare(mock.Mock(), self._workload("a"))
+
+        assert PREPARSED_DAG_BAGS[("bundle", None, "warm.py")] is dag_bag
+        assert list(dag_bag.dags["warm"].task_dict) == ["a"]
+
+    def test_modified_bundle_files_are_imported_again(self, bundle_dir):
+        bundle_dir(None, "a")
+        warm_dag_files = _WarmDagFiles(max_size=2)
+        warm_dag_files.prepare(mock.Mock(), self._workload("a"))
+
+        bundle_dir(None, "bb")
+        warm_dag_files.prepare(mock.Mock(), self._workload("bb"))
+
+        assert list(PREPARSED_DAG_BAGS[("bundle", None, "warm.py")].dags["warm"].task_dict) == ["bb"]
+
+    def test_new_bundle_version_drops_old_one(self, bundle_dir):
+        old_path = bundle_dir("v1", "a")
+        bundle_dir("v2", "bb")
+        warm_dag_files = _WarmDagFiles(max_size=2)
+
+        warm_dag_files.prepare(mock.Mock(), self._workload("a", version="v1"))
+        warm_dag_files.prepare(mock.Mock(), self._workload("bb", version="v2"))
+
+        assert list(PREPARSED_DAG_BAGS) == [("bundle", "v2", "warm.py")]
+        assert list(PREPARSED_DAG_BAGS[("bundle", "v2", "warm.py")].dags["warm"].task_dict) == ["bb"]
+        assert os.fspath(old_path) not in sys.path
+
+    def test_least_recently_used_dag_file_is_dropped(self, bundle_dir):
+        bundle_path = bundle_dir(None, "a")
+        for name in ("other.py", "third.py"):
+            (bundle_path / name).write_text(DAG_FILE)
+        warm_dag_files = _WarmDagFiles(max_size=2)
+
+        for dag_rel_path in ("warm.py", "other.py", "warm.py", "third.py"):
+            warm_dag_files.prepare(mock.Mock(), self._workload("a", dag_rel_path=dag_rel_path))
+
+        assert set(PREPARSED_DAG_BAGS) == {("bundle", None, "warm.py"), ("bundle", None, "third.py")}
+
+    def test_exiting_dag_file_is_left_to_task_process(self):
+        warm_dag_files = _WarmDagFiles(max_size=2)
+
+        with mock.patch.object(warm_dag_files, "_parse", side_effect=SystemExit(1)):
+            warm_dag_files.prepare(mock.Mock(), self._workload("a"))
+
+        assert not PREPARSED_DAG_BAGS
+
+    def test_slow_dag_file_is_left_to_task_process(self):
+        warm_dag_files = _WarmDagFiles(max_size=2, parse_timeout=0.1)
+        log = mock.Mock()
+
+        with mock.patch.object(warm_dag_files, "_parse", side_effect=lambda workload: time.sleep(5)):
+            warm_dag_files.prepare(log, self._workload("a"))
+
+        assert not PREPARSED_DAG_BAGS
+        log.warning.assert_called_once()
+
+    def test_dag_file_that_fails_is_left_to_task_process(self, bundle_dir):
+        bundle_dir(None, "a")
+        warm_dag_files = _WarmDagFiles(max_size=2)
+
+        warm_dag_files.prepare(mock.Mock(), self._workload("missing"))
+
+        assert not PREPARSED_DAG_BAGS
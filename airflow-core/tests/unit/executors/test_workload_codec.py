@@ -0,0 +1,122 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+from __future__ import annotations
+
+import pytest
+from uuid6 import uuid7
+
+from airflow.executors import workloads
+from airflow.executors.workload_codec import (
+    CODEC_VERSION,
+    TEXT_PREFIX,
+    decode_workloads,
+    encode_workloads,
+    pack_workloads,
+    unpack_workloads,
+    workload_from_str,
+    workload_to_str,
+)
+
+from tests_common.test_utils.config import conf_vars
+
+
+def make_workload(task_id="hello", dag_rel_path="dags/hello.py", bundle=("dags-folder", None)):
+    return workloads.ExecuteTask(
+        token="token",
+        ti=workloads.TaskInstance(
+            id=uuid7(),
+            dag_version_id=uuid7(),
+            task_id=task_id,
+            dag_id="hello",
+            run_id="run1",
+            try_number=2,
+            map_index=3,
+            pool_slots=1,
+            queue="default",
+            priority_weight=5,
+            context_carrier={"traceparent": "00-abc"},
+        ),
+        dag_rel_path=dag_rel_path,
+        bundle_info=workloads.BundleInfo(name=bundle[0], version=bundle[1]),
+        log_path=f"dag_id=hello/{task_id}.log",
+    )
+
+
+class TestWorkloadCodec:
+    def test_round_trip(self):
+        batch = [make_workload("a"), make_workload("b", bundle=("other", "v1")), make_workload("c")]
+
+        decoded = decode_workloads(encode_workloads(batch))
+
+        assert [workload.model_dump() for workload in decoded] == [
+            workload.model_dump() for workload in batch
+        ]
+
+    def test_shared_fields_are_stored_once(self):
+        batch = [
+            make_workload("a"),
+            make_workload("b", dag_rel_path="dags/other.py"),
+            make_workload("c", bundle=("other", "v1")),
+        ]
+
+        version, bundles, paths, tasks = pack_workloads(batch)
+
+        assert version == CODEC_VERSION
+        assert bundles == [["dags-folder", None], ["other", "v1"]]
+        assert paths == ["dags/hello.py", "dags/other.py"]
+        assert [task[2:4] for task in tasks] == [[0, 0], [1, 0], [0, 1]]
+
+    def test_compact_is_smaller_than_json(self):
+        batch = [make_workload(f"task_{i}") for i in range(10)]
+
+        assert len(encode_workloads(batch)) < sum(len(w.model_dump_json()) for w in batch) / 2
+
+    def test_trailing_task_values_are_ignored(self):
+        packed = pack_workloads([make_workload()])
+        packed[3][0].append("some new field")
+
+        (workload,) = unpack_workloads(packed)
+
+        assert workload.ti.task_id == "hello"
+
+    def test_unknown_version(self):
+        packed = pack_workloads([make_workload()])
+        packed[0] = CODEC_VERSION + 1
+
+        with pytest.raises(ValueError, match="Unsupported workload encoding version"):
+            unpack_workloads(packed)
+
+    def test_only_execute_task_is_supported(self):
+        with pytest.raises(TypeError, match="Cannot encode workloads"):
+            pack_workloads([object()])
+
+    def test_to_str_defaults_to_json(self):
+        workload = make_workload()
+
+        text = workload_to_str(workload)
+
+        assert text == workload.model_dump_json()
+        assert workload_from_str(text) == workload
+
+    @conf_vars({("core", "workload_encoding"): "msgpack"})
+    def test_to_str_msgpack(self):
+        workload = make_workload()
+
+        text = workload_to_str(workload)
+
+        assert text.startswith(TEXT_PREFIX)
+        assert workload_from_str(text).model_dump() == workload.model_dump()
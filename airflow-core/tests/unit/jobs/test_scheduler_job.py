@@ -222,9 +222,11 @@ class TestSchedulerJob:
         default_executor = mock.MagicMock(name="DefaultExecutor", slots_available=8, slots_occupied=0)
         default_executor.name = ExecutorName(alias="default_exec", module_path="default.exec.module.path")
         default_executor.jwt_generator = mock_jwt_generator
+        default_executor.capacity_hint.return_value = None
         second_executor = mock.MagicMock(name="SeconadaryExecutor", slots_available=8, slots_occupied=0)
         second_executor.name = ExecutorName(alias="secondary_exec", module_path="secondary.exec.module.path")
         second_executor.jwt_generator = mock_jwt_generator
+        second_executor.capacity_hint.return_value = None
 
         # TODO: Task-SDK Make it look like a bound method. Needed until we remove the old queue_workload
         # interface from executors
@@ -1890,6 +1892,44 @@ class TestSchedulerJob:
         assert res == 31
         session.rollback()
 
+    @pytest.mark.parametrize(
+        ("capacity_hint", "expected"),
+        [
+            pytest.param(None, 31, id="no-hint"),
+            pytest.param(5, 5, id="hint-below-slots"),
+            pytest.param(100, 31, id="hint-above-slots"),
+            pytest.param(RuntimeError("broker down"), 31, id="failing-hint"),
+        ],
+    )
+    def test_execute_task_instances_limited_by_capacity_hint(
+        self, capacity_hint, expected, dag_maker, mock_executor
+    ):
+        session = settings.Session()
+        with dag_maker(
+            dag_id="test_execute_task_instances_capacity_hint", max_active_tasks=1024, session=session
+        ):
+            task = EmptyOperator(task_id="dummy_task")
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+
+        dagrun = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, state=State.RUNNING)
+        for _ in range(40):
+            dagrun.get_task_instance(task.task_id, session).state = State.SCHEDULED
+            dagrun = dag_maker.create_dagrun_after(dagrun, run_type=DagRunType.SCHEDULED, state=State.RUNNING)
+        session.flush()
+        scheduler_job.max_tis_per_query = 0
+        scheduler_job.executor.slots_available = 31
+        if isinstance(capacity_hint, Exception):
+            scheduler_job.executor.capacity_hint.side_effect = capacity_hint
+        else:
+            scheduler_job.executor.capacity_hint.return_value = capacity_hint
+
+        res = self.job_runner._critical_section_enqueue_task_instances(session)
+
+        assert res == expected
+        session.rollback()
+
     @pytest.mark.parametrize(
         "task1_exec, task2_exec",
         [
@@ -19,11 +19,13 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import json
 import os
 import selectors
+import sys
 import time
 from collections.abc import AsyncIterator
-from socket import socket
+from socket import socket, socketpair
 from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -33,13 +35,17 @@ from asgiref.sync import sync_to_async
 from structlog.typing import FilteringBoundLogger
 
 from airflow._shared.timezones import timezone
+from airflow.exceptions import AirflowConfigException
 from airflow.executors import workloads
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import (
+    TimedCoroutine,
+    TimerService,
     TriggerCommsDecoder,
     TriggererJobRunner,
     TriggerRunner,
     TriggerRunnerSupervisor,
+    get_event_loop_factory,
     messages,
 )
 from airflow.models import DagModel, DagRun, TaskInstance, Trigger
@@ -60,6 +66,7 @@ from airflow.triggers.testing import FailureTrigger, SuccessTrigger
 from airflow.utils.state import State, TaskInstanceState
 from airflow.utils.types import DagRunType
 
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.db import (
     clear_db_connections,
     clear_db_dag_bundles,
@@ -396,6 +403,175 @@ class TestTriggerRunner:
         trigger_instance.cancel()
         await runner.cleanup_finished_triggers()
 
+    @pytest.mark.asyncio
+    async def test_identical_shareable_triggers_share_one_instance(self):
+        release = asyncio.Event()
+        instances = []
+
+        class SharedTrigger(BaseTrigger):
+            shareable = True
+
+            def __init__(self, value):
+                super().__init__()
+                self.value = value
+                instances.append(self)
+
+            def serialize(self):
+                return "shared.SharedTrigger", {"value": self.value}
+
+            async def run(self):
+                await release.wait()
+                yield TriggerEvent(self.value)
+
+        runner = TriggerRunner()
+        runner.to_create.extend(
+            workloads.RunTrigger.model_construct(
+                id=id,
+                ti=None,
+                classpath="shared.SharedTrigger",
+                encrypted_kwargs=json.dumps({"value": value}),
+            )
+            for id, value in [(1, 1), (2, 1), (3, 2), (4, 1)]
+        )
+        with (
+            patch.object(TriggerRunner, "get_trigger_by_classpath", return_value=SharedTrigger),
+            patch.object(Trigger, "_decrypt_kwargs", side_effect=json.loads),
+        ):
+            await runner.create_triggers()
+
+        assert [instance.value for instance in instances] == [1, 2]
+        # Cancelling one of the triggers sharing an instance leaves the others running
+        runner.triggers[4]["task"].cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        for _ in range(100):
+            if all(details["task"].done() for details in runner.triggers.values()):
+                break
+            await asyncio.sleep(0.01)
+
+        assert sorted(await runner.cleanup_finished_triggers()) == [1, 2, 3, 4]
+        assert sorted(runner.events, key=lambda e: e[0]) == [
+            (1, TriggerEvent(1)),
+            (2, TriggerEvent(1)),
+            (3, TriggerEvent(2)),
+        ]
+        assert not runner.failed_triggers
+        assert runner.shared_triggers == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_trigger_cancelled_with_last_subscriber(self):
+        cleaned_up = asyncio.Event()
+
+        class SharedTrigger(BaseTrigger):
+            shareable = True
+
+            def serialize(self):
+                return "shared.SharedTrigger", {}
+
+            async def run(self):
+                await asyncio.Event().wait()
+                yield TriggerEvent(None)
+
+            async def cleanup(self):
+                cleaned_up.set()
+
+        runner = TriggerRunner()
+        runner.to_create.extend(
+            workloads.RunTrigger.model_construct(
+                id=id, ti=None, classpath="shared.SharedTrigger", encrypted_kwargs="{}"
+            )
+            for id in (1, 2)
+        )
+        with (
+            patch.object(TriggerRunner, "get_trigger_by_classpath", return_value=SharedTrigger),
+            patch.object(Trigger, "_decrypt_kwargs", side_effect=json.loads),
+        ):
+            await runner.create_triggers()
+        await asyncio.sleep(0.01)
+        (shared,) = runner.shared_triggers.values()
+
+        runner.triggers[1]["task"].cancel()
+        await asyncio.sleep(0.01)
+        assert not shared.task.done()
+
+        runner.triggers[2]["task"].cancel()
+        await asyncio.wait_for(cleaned_up.wait(), 1)
+        assert shared.task.cancelled()
+        assert runner.shared_triggers == {}
+        assert await runner.cleanup_finished_triggers() == [1, 2]
+        assert not runner.failed_triggers
+
+    @pytest.mark.asyncio
+    async def test_wait_for_activity_woken_by_supervisor(self):
+        supervisor_end, runner_end = socketpair()
+        runner = TriggerRunner(wakeup=runner_end)
+        runner_end.setblocking(False)
+        asyncio.get_running_loop().add_reader(runner_end.fileno(), runner._on_wakeup)
+        try:
+            start = time.monotonic()
+            asyncio.get_running_loop().call_later(0.05, supervisor_end.send, b"\0")
+            await runner.wait_for_activity(5)
+            assert time.monotonic() - start < 1
+            assert not runner.activity.is_set()
+
+            # Without anything to do we wait for the timeout
+            start = time.monotonic()
+            await runner.wait_for_activity(0.1)
+            assert time.monotonic() - start >= 0.1
+        finally:
+            asyncio.get_running_loop().remove_reader(runner_end.fileno())
+            supervisor_end.close()
+            runner_end.close()
+
+    @pytest.mark.asyncio
+    async def test_timer_triggers_fire_from_timer_service(self):
+        now = timezone.utcnow()
+        runner = TriggerRunner()
+        runner.to_create.extend(
+            workloads.RunTrigger.model_construct(
+                id=id,
+                ti=None,
+                classpath="airflow.providers.standard.triggers.temporal.DateTimeTrigger",
+                encrypted_kwargs=Trigger.from_object(DateTimeTrigger(now + delta)).encrypted_kwargs,
+            )
+            for id, delta in [
+                (1, datetime.timedelta(milliseconds=50)),
+                (2, datetime.timedelta(seconds=-1)),
+                (3, datetime.timedelta(milliseconds=50)),
+                (4, datetime.timedelta(days=1)),
+            ]
+        )
+
+        with patch.object(TriggerRunner, "run_trigger") as run_trigger:
+            await runner.create_triggers()
+        run_trigger.assert_not_called()
+
+        runner.triggers[3]["task"].cancel()
+        await asyncio.sleep(0.2)
+
+        assert sorted(await runner.cleanup_finished_triggers()) == [1, 2, 3]
+        assert sorted(id for id, _ in runner.events) == [1, 2]
+        assert not runner.failed_triggers
+        assert list(runner.triggers) == [4]
+        runner.triggers[4]["task"].cancel()
+
+    @pytest.mark.asyncio
+    async def test_timer_service_drops_cancelled_timers(self):
+        fired = []
+        timers = TimerService(lambda trigger_id, event: fired.append(trigger_id))
+        moment = timezone.utcnow() + datetime.timedelta(days=1)
+        futures = [timers.add(id, moment, TriggerEvent(id)) for id in range(10)]
+
+        for future in futures[:6]:
+            future.cancel()
+        await asyncio.sleep(0)
+
+        # Once more than half of the timers are cancelled, the heap is rebuilt without them
+        assert [timer[2] for timer in sorted(timers._heap)] == [6, 7, 8, 9]
+        assert timers.fire_due() == pytest.approx(86400, abs=5)
+        assert fired == []
+        futures[6].cancel()
+
 
 @pytest.mark.asyncio
 async def test_trigger_create_race_condition_38599(session, supervisor_builder, testing_dag_bundle):
@@ -1049,6 +1225,140 @@ def test_update_triggers_prevents_duplicate_creation_queue_entries(session, supe
     assert not any(trigger_id == trigger_orm.id for trigger_id, _ in supervisor.failed_triggers)
 
 
+def test_update_triggers_spreads_triggers_over_runners(session, supervisor_builder, dag_maker):
+    """New triggers go to the least loaded runner, and are cancelled on the runner that runs them."""
+    trigger1 = TimeDeltaTrigger(datetime.timedelta(days=7))
+    trigger2 = TimeDeltaTrigger(datetime.timedelta(days=14))
+
+    dag_model1, run1, trigger_orm1, task_instance1 = create_trigger_in_db(session, trigger1)
+
+    with dag_maker("test_dag_2"):
+        EmptyOperator(task_id="test_ti_2")
+
+    run2 = dag_maker.create_dagrun()
+    trigger_orm2 = Trigger.from_object(trigger2)
+    ti2 = run2.task_instances[0]
+    session.add(trigger_orm2)
+    session.flush()
+    ti2.trigger_id = trigger_orm2.id
+    session.merge(ti2)
+    session.flush()
+
+    supervisor = supervisor_builder()
+    peer = supervisor_builder(job=supervisor.job)
+    peer.runner_index = 1
+    supervisor.peers.append(peer)
+
+    supervisor.update_triggers({trigger_orm1.id, trigger_orm2.id})
+    assert len(supervisor.creating_triggers) == 1
+    assert len(peer.creating_triggers) == 1
+    on_peer = peer.creating_triggers[0].id
+    assert {supervisor.creating_triggers[0].id, on_peer} == {trigger_orm1.id, trigger_orm2.id}
+    assert on_peer in peer.logger_cache
+
+    # Triggers already known to a runner are not created again on another one
+    supervisor.update_triggers({trigger_orm1.id, trigger_orm2.id})
+    assert len(supervisor.creating_triggers) == 1
+    assert len(peer.creating_triggers) == 1
+
+    # Once running, removing a trigger cancels it on the runner it runs on
+    for runner in supervisor.runners:
+        runner.running_triggers.update(workload.id for workload in runner.creating_triggers)
+        runner.creating_triggers.clear()
+    remaining = ({trigger_orm1.id, trigger_orm2.id} - {on_peer}).pop()
+    supervisor.update_triggers({remaining})
+    assert peer.cancelling_triggers == {on_peer}
+    assert supervisor.cancelling_triggers == set()
+
+
+def test_supervisor_handles_events_of_all_runners(supervisor_builder):
+    supervisor = supervisor_builder()
+    peer = supervisor_builder(job=supervisor.job)
+    supervisor.peers.append(peer)
+
+    supervisor.events.append((1, TriggerEvent(True)))
+    peer.events.append((2, TriggerEvent(True)))
+    peer.failed_triggers.append((3, None))
+
+    with (
+        patch.object(Trigger, "submit_events") as submit_events,
+        patch.object(Trigger, "submit_failure") as submit_failure,
+    ):
+        supervisor.handle_events()
+        supervisor.handle_failed_triggers()
+
+    submit_events.assert_called_once()
+    assert [trigger_id for trigger_id, _ in submit_events.call_args.args[0]] == [1, 2]
+    submit_failure.assert_called_once_with(trigger_id=3, exc=None)
+    assert not peer.events
+    assert not peer.failed_triggers
+
+
+def test_update_triggers_wakes_runner(session, supervisor_builder):
+    trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
+    dag_model, run, trigger_orm, task_instance = create_trigger_in_db(session, trigger)
+    supervisor = supervisor_builder()
+    supervisor._wakeup, child_end = socketpair()
+    child_end.setblocking(False)
+
+    try:
+        supervisor.update_triggers({trigger_orm.id})
+        assert child_end.recv(16) == b"\0"
+
+        # Nothing new for the runner, so we don't wake it
+        supervisor.update_triggers({trigger_orm.id})
+        with pytest.raises(BlockingIOError):
+            child_end.recv(16)
+
+        supervisor.running_triggers.add(supervisor.creating_triggers.popleft().id)
+        supervisor.update_triggers(set())
+        assert child_end.recv(16) == b"\0"
+        assert supervisor.cancelling_triggers == {trigger_orm.id}
+    finally:
+        supervisor._wakeup.close()
+        child_end.close()
+
+
+def test_trigger_poll_backs_off_when_listening(supervisor_builder):
+    supervisor = supervisor_builder()
+
+    # Without notifications we poll every second
+    supervisor._schedule_trigger_poll(changed=False)
+    assert supervisor._trigger_poll_interval == 1
+
+    supervisor._trigger_listener = MagicMock()
+    intervals = []
+    with patch.object(TriggerRunnerSupervisor, "max_idle_poll_interval", 5):
+        for _ in range(4):
+            supervisor._schedule_trigger_poll(changed=False)
+            intervals.append(supervisor._trigger_poll_interval)
+    assert intervals == [2, 4, 5, 5]
+
+    supervisor._schedule_trigger_poll(changed=True)
+    assert supervisor._trigger_poll_interval == 1
+
+
+def test_trigger_notification_loads_triggers(supervisor_builder):
+    supervisor = supervisor_builder()
+    supervisor._triggers_changed = False
+    listener = MagicMock(notifies=[])
+
+    assert supervisor._on_trigger_notification(listener) is True
+    assert supervisor._triggers_changed is False
+
+    listener.notifies.append(MagicMock(channel="airflow_triggers_changed"))
+    assert supervisor._on_trigger_notification(listener) is True
+    assert supervisor._triggers_changed is True
+    assert listener.notifies == []
+
+    # If the connection is lost, we stop listening on it and fall back to polling
+    listener.poll.side_effect = OSError("connection lost")
+    assert supervisor._on_trigger_notification(listener) is False
+    supervisor._trigger_listener = listener
+    supervisor._on_trigger_listener_closed(listener)
+    assert supervisor._trigger_listener is None
+
+
 def test_update_triggers_prevents_duplicate_creation_queue_entries_with_multiple_triggers(
     session, supervisor_builder, dag_maker
 ):
@@ -1095,3 +1405,170 @@ def test_update_triggers_prevents_duplicate_creation_queue_entries_with_multiple
     trigger_ids = {trigger.id for trigger in supervisor.creating_triggers}
     assert trigger_orm1.id in trigger_ids
     assert trigger_orm2.id in trigger_ids
+
+
+def test_supervisor_reports_load_of_all_runners(supervisor_builder, session):
+    supervisor = supervisor_builder()
+    peer = supervisor_builder(job=supervisor.job)
+    supervisor.peers.append(peer)
+
+    # The CPU used to start up is not counted
+    for runner, cpu_time in ((supervisor, 3.0), (peer, 5.0)):
+        runner._handle_request(messages.TriggerStateChanges(cpu_time=cpu_time), req_id=1, log=MagicMock())
+    supervisor._handle_request(
+        messages.TriggerStateChanges(loop_lag=0.3, cpu_time=5.0), req_id=2, log=MagicMock()
+    )
+    peer._handle_request(messages.TriggerStateChanges(loop_lag=0.1, cpu_time=5.0), req_id=2, log=MagicMock())
+    peer.running_triggers.update({1, 2})
+    supervisor._load_reported_at = time.monotonic() - 4
+
+    supervisor.report_load(session)
+
+    assert supervisor.job.loop_lag == 0.3
+    assert supervisor.job.cpu_usage == pytest.approx(0.25, rel=0.05)
+    # 2 triggers out of a capacity of 10 cost less than the CPU in use
+    assert supervisor.job.trigger_cost == supervisor.job.cpu_usage
+    assert supervisor._loop_lag == peer._loop_lag == 0
+
+
+def test_load_triggers_rebalances_when_enabled(supervisor_builder):
+    supervisor = supervisor_builder()
+
+    with (
+        patch.object(TriggerRunnerSupervisor, "rebalance_triggers", True),
+        patch.object(Trigger, "release_excess") as release_excess,
+        patch.object(Trigger, "assign_unassigned") as assign_unassigned,
+    ):
+        supervisor.load_triggers()
+        supervisor.load_triggers()
+
+    # Only once per rebalance interval
+    release_excess.assert_called_once_with(supervisor.job.id, supervisor.health_check_threshold)
+    assert assign_unassigned.call_count == 2
+    assert assign_unassigned.call_args.kwargs["max_loop_lag"] == supervisor.max_loop_lag
+
+
+@pytest.mark.asyncio
+async def test_timed_coroutine_measures_each_step():
+    steps = []
+
+    async def blocking():
+        time.sleep(0.05)  # noqa: ASYNC251 - blocking on purpose
+        await asyncio.sleep(0)
+        return 42
+
+    assert await asyncio.create_task(TimedCoroutine(blocking(), steps.append)) == 42
+    assert len(steps) == 2
+    assert steps[0] >= 0.05
+    assert steps[1] < 0.05
+
+
+@pytest.mark.parametrize(
+    ("event_loop", "uvloop_installed", "expected"),
+    [
+        pytest.param("asyncio", True, None, id="asyncio"),
+        pytest.param("auto", False, None, id="auto-without-uvloop"),
+        pytest.param("auto", True, "uvloop", id="auto-with-uvloop"),
+        pytest.param("uvloop", True, "uvloop", id="uvloop"),
+        pytest.param("uvloop", False, AirflowConfigException, id="uvloop-not-installed"),
+        pytest.param("trio", True, AirflowConfigException, id="invalid"),
+    ],
+)
+def test_get_event_loop_factory(event_loop, uvloop_installed, expected):
+    uvloop = MagicMock() if uvloop_installed else None
+    with conf_vars({("triggerer", "event_loop"): event_loop}), patch.dict(sys.modules, {"uvloop": uvloop}):
+        if expected is AirflowConfigException:
+            with pytest.raises(AirflowConfigException):
+                get_event_loop_factory()
+        elif expected is None:
+            assert get_event_loop_factory() is None
+        else:
+            assert get_event_loop_factory() is uvloop.new_event_loop
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="asyncio.Runner needs Python 3.11")
+def test_trigger_runner_runs_on_configured_event_loop():
+    loops = []
+
+    def loop_factory():
+        loops.append(asyncio.new_event_loop())
+        return loops[-1]
+
+    ran_on = []
+
+    async def arun():
+        ran_on.append(asyncio.get_running_loop())
+
+    trigger_runner = TriggerRunner()
+    with (
+        patch("airflow.jobs.triggerer_job_runner.get_event_loop_factory", return_value=loop_factory),
+        patch.object(trigger_runner, "arun", side_effect=arun),
+    ):
+        trigger_runner.run()
+
+    assert len(loops) == 1
+    assert ran_on == loops
+    assert loops[0].is_closed()
+
+
+def test_trigger_runner_emits_loop_time_per_trigger_class():
+    trigger_runner = TriggerRunner()
+    for duration in (0.1, 0.3, 0.1):
+        trigger_runner._on_trigger_step("path.to.SlowTrigger", "ID 1", duration)
+    trigger_runner._on_trigger_step("path.to.FastTrigger", "ID 2", 0.001)
+
+    with (
+        patch("airflow.jobs.triggerer_job_runner.Stats") as stats,
+        patch.object(trigger_runner, "log") as trigger_log,
+    ):
+        trigger_runner._on_trigger_step("path.to.SlowTrigger", "ID 1", 0.5)
+        trigger_runner.emit_metrics(2.0)
+
+    trigger_log.warning.assert_called_once()
+    tags = {"runner": "0", "trigger_class": "path.to.SlowTrigger"}
+    stats.gauge.assert_any_call("triggers.loop_usage", pytest.approx(0.5), tags=tags)
+    stats.timing.assert_any_call("triggers.max_step_time", datetime.timedelta(seconds=0.5), tags=tags)
+    assert stats.gauge.call_count == stats.timing.call_count == 2
+    assert trigger_runner.loop_time == trigger_runner.max_step_time == {}
+
+
+def test_trigger_state_sync_sends_compact_workloads():
+    import msgspec
+
+    ti = workloads.TaskInstance(
+        id="4d828a62-a417-4936-a7a6-2b3fabacecab",
+        dag_version_id="01a15404-ec6c-7d9f-a722-60589013d054",
+        task_id="task",
+        dag_id="dag",
+        run_id="run",
+        try_number=1,
+        pool_slots=1,
+        queue="default",
+        priority_weight=1,
+    )
+    msg = messages.TriggerStateSync(
+        to_create=[
+            workloads.RunTrigger(
+                id=1,
+                ti=ti,
+                classpath="path.to.Trigger",
+                encrypted_kwargs="kwargs",
+                timeout_after=timezone.datetime(2025, 1, 1),
+            ),
+            workloads.RunTrigger(id=2, ti=None, classpath="path.to.Trigger", encrypted_kwargs="kwargs"),
+        ],
+        to_cancel={3},
+    )
+
+    body = msg.model_dump()
+    assert body["to_create"][1] == [2, "path.to.Trigger", "kwargs", None, None]
+
+    decoded = msgspec.msgpack.decode(msgspec.msgpack.encode(body))
+    assert messages.TriggerStateSync.model_validate(decoded) == msg
+
+
+def test_decrypt_kwargs_gives_exception_of_failed_triggers():
+    kwargs = TriggerRunner.decrypt_kwargs([Trigger.encrypt_kwargs({"delta": 1}), "not-a-token"])
+
+    assert kwargs[0] == {"delta": 1}
+    assert isinstance(kwargs[1], Exception)
@@ -20,18 +20,21 @@ import datetime
 import json
 from collections.abc import AsyncIterator
 from typing import Any
+from unittest import mock
 from unittest.mock import patch
 
 import pendulum
 import pytest
 import pytz
 from cryptography.fernet import Fernet
+from sqlalchemy import select
 
 from airflow._shared.timezones import timezone
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import TriggererJobRunner
 from airflow.models import Deadline, TaskInstance, Trigger
 from airflow.models.asset import AssetEvent, AssetModel, asset_trigger_association_table
+from airflow.models.trigger import notify_triggers_changed
 from airflow.models.xcom import XComModel
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk.definitions.deadline import AsyncCallback
@@ -300,6 +303,61 @@ def test_submit_event_task_end(mock_utcnow, session, create_task_instance, event
     assert actual_xcoms == expected_xcoms
 
 
+def test_submit_events(session, create_task_instance):
+    """
+    Tests that a batch of events resumes plain task instances in bulk, keeps the first event
+    of a trigger, and still ends task instances waiting on a BaseTaskEndEvent.
+    """
+    time_now = timezone.utcnow()
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(3)]
+    session.add_all(triggers)
+    session.flush()
+    task_instances = []
+    for i in range(len(triggers)):
+        task_instance = create_task_instance(
+            task_id=f"ti_{i}",
+            logical_date=time_now + datetime.timedelta(hours=i),
+            run_id=f"run_{i}",
+        )
+        task_instances.append(task_instance)
+    for i, (trigger, task_instance) in enumerate(zip(triggers, task_instances)):
+        task_instance.state = State.DEFERRED
+        task_instance.trigger_id = trigger.id
+        task_instance.next_kwargs = {"index": i}
+        session.merge(task_instance)
+    asset = AssetModel("test")
+    asset.triggers.append(triggers[0])
+    session.add(asset)
+    session.commit()
+
+    Trigger.submit_events(
+        [
+            (triggers[0].id, TriggerEvent("first")),
+            (triggers[1].id, TriggerEvent("second")),
+            (triggers[0].id, TriggerEvent("again")),
+            (triggers[2].id, TaskSuccessEvent(xcoms={"return_value": "xcomret"})),
+        ],
+        session=session,
+    )
+    session.flush()
+    session.expire_all()
+
+    first, second, ended = (session.get(TaskInstance, ti.id) for ti in task_instances)
+    assert first.state == second.state == State.SCHEDULED
+    assert first.trigger_id is None
+    assert first.scheduled_dttm is not None
+    assert first.next_kwargs == {"index": 0, "event": "first"}
+    assert second.next_kwargs == {"index": 1, "event": "second"}
+    assert ended.state == State.SUCCESS
+    assert ended.next_kwargs == {"index": 2}
+    assert XComModel.get_many(dag_ids=[ended.dag_id], task_ids=[ended.task_id], run_id=ended.run_id).count()
+    # Every event still reaches the assets of its trigger
+    assert [e.extra["payload"] for e in session.query(AssetEvent).filter_by(asset_id=asset.id)] == [
+        "first",
+        "again",
+    ]
+
+
 @pytest.mark.need_serialized_dag
 def test_assign_unassigned(session, create_task_instance):
     """
@@ -397,6 +455,75 @@ def test_assign_unassigned(session, create_task_instance):
     )
 
 
+@pytest.mark.parametrize(
+    ("own_load", "other_load", "expected_capacity"),
+    [
+        pytest.param({}, {}, 5, id="not-reported"),
+        # 4 triggers cost 0.8, so one more fits; and 0.2 / 1.2 of the unassigned ones is 2
+        pytest.param({"trigger_cost": 0.8, "loop_lag": 0.1}, {"trigger_cost": 0.0}, 1, id="expensive"),
+        pytest.param({"trigger_cost": 0.1}, {"trigger_cost": 0.9}, 9, id="other-loaded"),
+        pytest.param({"trigger_cost": 0.1, "loop_lag": 2.0}, {"trigger_cost": 0.1}, None, id="lagging"),
+    ],
+)
+def test_assign_unassigned_load_aware(session, own_load, other_load, expected_capacity):
+    """
+    Tests that triggerers take unassigned triggers according to the load they report.
+    """
+    own_triggerer = Job(heartrate=10, state=State.RUNNING, job_type="TriggererJob", **own_load)
+    other_triggerer = Job(heartrate=10, state=State.RUNNING, job_type="TriggererJob", **other_load)
+    session.add_all([own_triggerer, other_triggerer])
+    session.flush()
+    for i in range(14):
+        trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={"i": i})
+        trigger.triggerer_id = own_triggerer.id if i < 4 else None
+        session.add(trigger)
+    session.commit()
+
+    with patch.object(Trigger, "get_sorted_triggers", return_value=[]) as get_sorted_triggers:
+        Trigger.assign_unassigned(own_triggerer.id, 100, health_check_threshold=30, max_loop_lag=0.5)
+
+    if expected_capacity is None:
+        get_sorted_triggers.assert_not_called()
+    else:
+        assert get_sorted_triggers.call_args.kwargs["capacity"] == expected_capacity
+
+
+@pytest.mark.parametrize(
+    ("own_cost", "other_cost", "expected_released"),
+    [
+        pytest.param(0.9, 0.1, 4, id="loaded"),
+        pytest.param(0.5, 0.4, 0, id="balanced"),
+        pytest.param(0.9, None, 5, id="new-triggerer"),
+    ],
+)
+def test_release_excess(session, own_cost, other_cost, expected_released):
+    """
+    Tests that a triggerer much more loaded than the others hands back its newest triggers.
+    """
+    own_triggerer = Job(heartrate=10, state=State.RUNNING, job_type="TriggererJob", trigger_cost=own_cost)
+    other_triggerer = Job(heartrate=10, state=State.RUNNING, job_type="TriggererJob", trigger_cost=other_cost)
+    session.add_all([own_triggerer, other_triggerer])
+    session.flush()
+    created_date = timezone.utcnow()
+    for i in range(10):
+        trigger = Trigger(
+            classpath="airflow.triggers.testing.SuccessTrigger",
+            kwargs={"i": i},
+            created_date=created_date + datetime.timedelta(seconds=i),
+        )
+        trigger.triggerer_id = own_triggerer.id
+        session.add(trigger)
+    session.commit()
+
+    assert Trigger.release_excess(own_triggerer.id, health_check_threshold=30) == expected_released
+
+    session.expire_all()
+    released = session.scalars(select(Trigger).where(Trigger.triggerer_id.is_(None))).all()
+    assert len(released) == expected_released
+    # The newest triggers are handed back
+    assert sorted(trigger.kwargs["i"] for trigger in released) == list(range(10 - expected_released, 10))
+
+
 @pytest.mark.need_serialized_dag
 def test_get_sorted_triggers_same_priority_weight(session, create_task_instance):
     """
@@ -552,6 +679,31 @@ class SensitiveKwargsTrigger(BaseTrigger):
         yield TriggerEvent({})
 
 
+@pytest.mark.parametrize(("dialect", "notified"), [("postgresql", True), ("sqlite", False), ("mysql", False)])
+def test_notify_triggers_changed(dialect, notified):
+    connection = mock.Mock()
+    connection.dialect.name = dialect
+
+    notify_triggers_changed(connection)
+
+    assert connection.execute.called is notified
+    if notified:
+        (stmt,) = connection.execute.call_args.args
+        assert "pg_notify" in str(stmt)
+
+
+def test_creating_and_deleting_triggers_notifies(session):
+    with patch("airflow.models.trigger.notify_triggers_changed") as notify:
+        trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+        session.add(trigger)
+        session.flush()
+        assert notify.call_count == 1
+
+        session.delete(trigger)
+        session.flush()
+        assert notify.call_count == 2
+
+
 @conf_vars({("core", "fernet_key"): Fernet.generate_key().decode()})
 def test_serialize_sensitive_kwargs():
     """
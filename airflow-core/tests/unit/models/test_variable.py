@@ -36,11 +36,13 @@ pytestmark = pytest.mark.db_test
 
 class TestVariable:
     @pytest.fixture(autouse=True)
-    def setup_test_cases(self):
+    def setup_test_cases(self, tmp_path):
         crypto._fernet = None
         db.clear_db_variables()
         SecretCache.reset()
-        with conf_vars({("secrets", "use_cache"): "true"}):
+        with conf_vars(
+            {("secrets", "use_cache"): "true", ("secrets", "cache_path"): str(tmp_path / "secrets_cache.db")}
+        ):
             SecretCache.init()
         with mock.patch("airflow.models.variable.mask_secret", autospec=True) as m:
             self.mask_secret = m
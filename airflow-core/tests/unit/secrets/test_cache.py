@@ -18,10 +18,14 @@ from __future__ import annotations
 
 import datetime
 import multiprocessing
+import os
+import stat
+from unittest import mock
 
 import pytest
 
 from airflow.sdk import SecretCache
+from airflow.sdk.execution_time.cache import _default_cache_path
 
 from tests_common.test_utils.config import conf_vars
 
@@ -35,10 +39,11 @@ def test_cache_disabled_by_default():
 
 
 class TestSecretCache:
-    @staticmethod
-    @conf_vars({("secrets", "use_cache"): "true"})
-    def setup_method() -> None:
-        SecretCache.init()
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, tmp_path):
+        self.cache_path = tmp_path / "secrets_cache.db"
+        with conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_path"): str(self.cache_path)}):
+            SecretCache.init()
 
     @staticmethod
     def teardown_method(self) -> None:
@@ -141,3 +146,103 @@ class TestSecretCache:
 
         with pytest.raises(SecretCache.NotPresentException):
             SecretCache.get_connection_uri("key")
+
+    def test_negative_entries_expire_sooner(self):
+        SecretCache.save_variable("missing", None)
+        SecretCache.save_variable("present", "some_value")
+
+        SecretCache._negative_ttl = datetime.timedelta(0)
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("missing")
+        assert SecretCache.get_variable("present") == "some_value"
+
+    def test_oldest_entries_evicted(self):
+        SecretCache._cache.max_entries = 2
+        for key in ("first", "second", "third"):
+            SecretCache.save_variable(key, f"{key}_value")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("first")
+        assert SecretCache.get_variable("second") == "second_value"
+        assert SecretCache.get_variable("third") == "third_value"
+
+    def test_cache_file_only_accessible_by_owner(self):
+        SecretCache.save_variable("key", "some_value")
+
+        assert stat.S_IMODE(os.stat(self.cache_path).st_mode) == 0o600
+
+    def test_reset_keeps_entries_for_other_processes(self):
+        SecretCache.save_variable("key", "some_value")
+
+        SecretCache.reset()
+        with conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_path"): str(self.cache_path)}):
+            SecretCache.init()
+
+        assert SecretCache.get_variable("key") == "some_value"
+
+    def test_symlinked_cache_file_is_a_miss(self, tmp_path):
+        SecretCache.reset()
+        target = tmp_path / "elsewhere.db"
+        target.touch(mode=0o600)
+        self.cache_path.symlink_to(target)
+        with conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_path"): str(self.cache_path)}):
+            SecretCache.init()
+
+        SecretCache.save_variable("key", "some_value")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
+        assert target.stat().st_size == 0
+
+    def test_default_cache_dir_must_be_private(self, tmp_path):
+        cache_dir = tmp_path / "shared"
+        cache_dir.mkdir(mode=0o755)
+        cache_dir.chmod(0o755)
+        SecretCache.reset()
+        with (
+            conf_vars({("secrets", "use_cache"): "true", ("secrets", "cache_path"): ""}),
+            mock.patch(
+                "airflow.sdk.execution_time.cache._default_cache_path",
+                return_value=str(cache_dir / "secrets_cache.db"),
+            ),
+        ):
+            SecretCache.init()
+
+        SecretCache.save_variable("key", "some_value")
+
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("key")
+        assert not (cache_dir / "secrets_cache.db").exists()
+
+    def test_default_cache_path_depends_on_airflow_home(self):
+        with mock.patch("airflow.sdk.execution_time.cache.AIRFLOW_HOME", "/opt/airflow-a"):
+            path_a = _default_cache_path()
+        with mock.patch("airflow.sdk.execution_time.cache.AIRFLOW_HOME", "/opt/airflow-b"):
+            path_b = _default_cache_path()
+
+        assert path_a != path_b
+        assert os.path.dirname(path_a) == os.path.dirname(path_b)
+
+    @mock.patch("airflow.sdk.execution_time.cache.Stats")
+    def test_hit_and_miss_metrics(self, mock_stats):
+        SecretCache.save_connection_uri("conn", "postgres://host")
+
+        SecretCache.get_connection_uri("conn")
+        with pytest.raises(SecretCache.NotPresentException):
+            SecretCache.get_variable("var")
+
+        assert mock_stats.incr.mock_calls == [
+            mock.call("secrets.cache.hit", tags={"kind": "connection"}),
+            mock.call("secrets.cache.miss", tags={"kind": "variable"}),
+        ]
+
+    def test_unreadable_cache_is_a_miss(self):
+        SecretCache.save_variable("key", "some_value")
+
+        with mock.patch.object(SecretCache._cache, "_connect", side_effect=OSError("gone")):
+            with pytest.raises(SecretCache.NotPresentException):
+                SecretCache.get_variable("key")
+            SecretCache.save_variable("key", "other_value")  # simply shouldn't raise any exception.
+
+        assert SecretCache.get_variable("key") == "some_value"
@@ -0,0 +1,141 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from airflow.triggers.base import BaseTrigger
+from airflow.triggers.clients import SharedClientRegistry, get_shared_client_registry
+
+from tests_common.test_utils.config import conf_vars
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class ClientTrigger(BaseTrigger):
+    def __init__(self, conn_id: str):
+        super().__init__()
+        self.conn_id = conn_id
+
+    def serialize(self):
+        return ("unit.triggers.test_clients.ClientTrigger", {"conn_id": self.conn_id})
+
+    async def run(self):
+        yield
+
+
+class TestSharedClientRegistry:
+    @pytest.mark.asyncio
+    async def test_triggers_share_client_of_same_key(self):
+        registry = SharedClientRegistry(asyncio.get_running_loop(), idle_timeout=60)
+
+        async with registry.client(("hook", "conn_a"), FakeClient) as first:
+            async with registry.client(("hook", "conn_a"), FakeClient) as second:
+                async with registry.client(("hook", "conn_b"), FakeClient) as other:
+                    assert first is second
+                    assert other is not first
+                    assert len(registry) == 2
+
+        # Idle clients are kept for the next trigger
+        async with registry.client(("hook", "conn_a"), FakeClient) as third:
+            assert third is first
+        assert not first.closed
+
+    @pytest.mark.asyncio
+    async def test_idle_client_is_closed(self):
+        registry = SharedClientRegistry(asyncio.get_running_loop(), idle_timeout=0.01)
+
+        async with registry.client("key", FakeClient) as first:
+            await asyncio.sleep(0.05)
+            assert not first.closed
+        await asyncio.sleep(0.05)
+
+        assert first.closed
+        assert len(registry) == 0
+        async with registry.client("key", FakeClient) as second:
+            assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_triggers_create_client_once(self):
+        registry = SharedClientRegistry(asyncio.get_running_loop(), idle_timeout=60)
+        created = []
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            created.append(FakeClient())
+            return created[-1]
+
+        async def use():
+            async with registry.client("key", factory) as client:
+                return client
+
+        clients = await asyncio.gather(*(use() for _ in range(5)))
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_is_retried(self):
+        registry = SharedClientRegistry(asyncio.get_running_loop(), idle_timeout=60)
+
+        def failing():
+            raise ConnectionError("no route")
+
+        with pytest.raises(ConnectionError):
+            async with registry.client("key", failing):
+                pass
+
+        assert len(registry) == 0
+        async with registry.client("key", FakeClient) as client:
+            assert isinstance(client, FakeClient)
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients_with_their_close(self):
+        registry = SharedClientRegistry(asyncio.get_running_loop(), idle_timeout=60)
+        closed = []
+
+        async with registry.client("a", FakeClient) as first:
+            pass
+        async with registry.client("b", object, close=closed.append) as second:
+            await registry.aclose()
+
+        assert first.closed
+        assert closed == [second]
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_triggers_opt_in_through_base_trigger(self):
+        with conf_vars({("triggerer", "shared_client_idle_timeout"): "5"}):
+            registry = get_shared_client_registry()
+
+        async with ClientTrigger("conn").shared_client(("hook", "conn"), FakeClient) as first:
+            async with ClientTrigger("conn").shared_client(("hook", "conn"), FakeClient) as second:
+                assert first is second
+
+        assert registry.idle_timeout == 5
+        assert get_shared_client_registry() is registry
+        await registry.aclose()
+        assert first.closed
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark how fast LocalExecutor hands workloads to its workers and gets their results back.
+
+The workers don't run the tasks, so this only measures the executor's own overhead: the time the scheduler
+spends in ``queue_workload`` and ``sync``, the CPU time the scheduler process uses per task, and how many tasks
+per second make the round trip to a worker.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import rich_click as click
+from uuid6 import uuid7
+
+from airflow.executors import workloads
+from airflow.executors.local_executor import LocalExecutor
+
+
+def make_workloads(count: int) -> list[workloads.ExecuteTask]:
+    return [
+        workloads.ExecuteTask(
+            token="",
+            ti=workloads.TaskInstance(
+                id=uuid7(),
+                dag_version_id=uuid7(),
+                task_id=f"task_{i}",
+                dag_id="local_executor_benchmark",
+                run_id="benchmark",
+                try_number=1,
+                pool_slots=1,
+                queue="default",
+                priority_weight=1,
+            ),
+            dag_rel_path="benchmark.py",
+            log_path=None,
+            bundle_info=workloads.BundleInfo(name="benchmark"),
+        )
+        for i in range(count)
+    ]
+
+
+def run(count: int, parallelism: int, batch: int, loop_interval: float) -> dict[str, float]:
+    executor = LocalExecutor(parallelism=parallelism)
+    executor.start()
+    # Start the workers up front, so the first batches don't pay for it
+    for workload in make_workloads(parallelism):
+        executor.queue_workload(workload, session=None)
+    while len(executor.event_buffer) < parallelism:
+        executor.sync()
+    executor.event_buffer.clear()
+
+    pending = make_workloads(count)
+    queue_time = sync_time = 0.0
+    start = time.perf_counter()
+    start_cpu = time.process_time()
+    while pending or len(executor.event_buffer) < count:
+        # Like the scheduler, queue a batch of tasks and then sync once per loop
+        started = time.perf_counter()
+        for workload in pending[:batch]:
+            executor.queue_workload(workload, session=None)
+        del pending[:batch]
+        synced = time.perf_counter()
+        executor.sync()
+        sync_time += time.perf_counter() - synced
+        queue_time += synced - started
+        # The rest of the scheduler loop
+        time.sleep(loop_interval)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - start_cpu
+    executor.end()
+
+    return {
+        "tasks/s": count / elapsed,
+        "queue_workload µs/task": queue_time / count * 1e6,
+        "sync µs/task": sync_time / count * 1e6,
+        "scheduler CPU µs/task": cpu / count * 1e6,
+    }
+
+
+@click.command()
+@click.option("--counts", default="1000,10000", help="comma separated numbers of tasks to dispatch")
+@click.option("--parallelism", default=8, help="number of LocalExecutor workers")
+@click.option("--batch", default=32, help="tasks queued between each sync, like a scheduler loop")
+@click.option("--loop-interval", default=0.001, help="seconds the rest of each scheduler loop takes")
+@click.option("--repeat", default=3, help="number of runs to take the best of for each count")
+def main(counts, parallelism, batch, loop_interval, repeat):
+    """Benchmark LocalExecutor's dispatch of tasks to its workers."""
+    # The workers are forked from this process, so they inherit the patch and return at once
+    with mock.patch("airflow.executors.local_executor._execute_work"):
+        for count in map(int, counts.split(",")):
+            results = [run(count, parallelism, batch, loop_interval) for _ in range(repeat)]
+            best = max(results, key=lambda result: result["tasks/s"])
+            click.echo(f"{count} tasks: " + ", ".join(f"{value:.1f} {name}" for name, value in best.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import random
+import re
+import string
+import time
+from collections.abc import Callable
+
+import rich_click as click
+
+from airflow.sdk.execution_time.secrets_masker import _SecretMatcher
+
+LOG_LINES = [
+    "[2025-10-10T12:00:00.000+0000] {taskinstance.py:1234} INFO - Starting attempt 1 of 3",
+    "[2025-10-10T12:00:00.000+0000] {http.py:98} INFO - Calling HTTP method GET on https://example.com/api/v1",
+    "[2025-10-10T12:00:00.000+0000] {base.py:84} INFO - Retrieving connection 'postgres_default'",
+    "[2025-10-10T12:00:00.000+0000] {sql.py:511} INFO - Running statement: SELECT * FROM table WHERE x = 1",
+    "[2025-10-10T12:00:00.000+0000] {python.py:240} INFO - Done. Returned value was: None",
+]
+
+
+def make_secrets(count: int, rng: random.Random) -> list[str]:
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(rng.choices(alphabet, k=rng.randint(8, 32))) for _ in range(count)]
+
+
+def best_of(setup: Callable[[], Callable[[], object]], number: int, repeat: int) -> float:
+    """Return the best per-call time of the function returned by ``setup``, which is not itself timed."""
+    times = []
+    for _ in range(repeat):
+        func = setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+
+@click.command()
+@click.option("--counts", default="10,100,1000", help="comma separated numbers of secrets to benchmark")
+@click.option("--number", default=2000, help="number of redactions per timing")
+@click.option("--repeat", default=5, help="number of timings to take the best of")
+@click.option("--seed", default=0, help="seed for the generated secrets")
+def main(counts, number, repeat, seed):
+    """
+    Compare the secrets masker multi-pattern matcher against the regex alternation it replaced.
+
+    For each number of secrets this times:
+
+    * ``add all``: adding the secrets one by one, as ``mask_secret`` does. The regex is recompiled on
+      every new secret, the matcher only builds its automaton on the next redaction.
+    * ``add one``: adding one more secret to the existing ones and redacting a line.
+    * ``clean line`` / ``with secret``: redacting a few log lines without, or with, a secret in them.
+    """
+    rng = random.Random(seed)
+    clean = " ".join(LOG_LINES)
+    print(f"{'secrets':>8} {'case':<12} {'regex':>12} {'matcher':>12} {'speedup':>8}")
+    for count in map(int, counts.split(",")):
+        secrets = make_secrets(count, rng)
+        extra = make_secrets(1, rng)[0]
+        patterns = [re.escape(secret) for secret in secrets]
+        dirty = f"{clean} password={secrets[-1]}"
+
+        def add_all_regex():
+            def run():
+                pattern_set: set[str] = set()
+                for pattern in patterns:
+                    pattern_set.add(pattern)
+                    re.compile("|".join(pattern_set))
+                re.purge()
+
+            return run
+
+        def add_all_matcher():
+            def run():
+                matcher = _SecretMatcher()
+                for secret in secrets:
+                    matcher.add(secret)
+
+            return run
+
+        def add_one_regex():
+            def run():
+                re.compile("|".join([*patterns, re.escape(extra)])).sub("***", clean)
+                re.purge()
+
+            return run
+
+        def add_one_matcher():
+            matcher = _SecretMatcher(secrets)
+            matcher.sub("***", clean)
+
+            def run():
+                matcher.add(extra)
+                matcher.sub("***", clean)
+
+            return run
+
+        replacer = re.compile("|".join(patterns))
+        matcher = _SecretMatcher(secrets)
+        if replacer.sub("***", dirty) != matcher.sub("***", dirty):
+            raise SystemExit("The matcher and the regex disagree!")
+
+        cases = {
+            "add all": (add_all_regex, add_all_matcher, 1),
+            "add one": (add_one_regex, add_one_matcher, 1),
+            "clean line": (
+                lambda: lambda: replacer.sub("***", clean),
+                lambda: lambda: matcher.sub("***", clean),
+                number,
+            ),
+            "with secret": (
+                lambda: lambda: replacer.sub("***", dirty),
+                lambda: lambda: matcher.sub("***", dirty),
+                number,
+            ),
+        }
+        for case, (regex_setup, matcher_setup, case_number) in cases.items():
+            regex_time = best_of(regex_setup, case_number, repeat)
+            matcher_time = best_of(matcher_setup, case_number, repeat)
+            print(
+                f"{count:>8} {case:<12} {regex_time * 1e6:>10.1f}us {matcher_time * 1e6:>10.1f}us "
+                f"{regex_time / matcher_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import statistics
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import rich_click as click
+
+from airflow._shared.timezones import timezone
+from airflow.jobs.triggerer_job_runner import TimerService
+from airflow.providers.standard.triggers.temporal import DateTimeTrigger
+
+if TYPE_CHECKING:
+    from airflow.triggers.base import TriggerEvent
+
+
+class Timers:
+    """One timer per trigger, fired by the triggerer's timer service."""
+
+    def __init__(self):
+        self.fired = 0
+        self.service = TimerService(self.on_fire)
+        self.futures: list[asyncio.Future] = []
+
+    def on_fire(self, trigger_id: int, event: TriggerEvent) -> None:
+        self.fired += 1
+
+    def add(self, trigger_id: int, trigger: DateTimeTrigger) -> None:
+        moment, event = trigger.timer()
+        self.futures.append(self.service.add(trigger_id, moment, event))
+
+    def cancel(self) -> None:
+        for future in self.futures:
+            future.cancel()
+
+
+class Tasks:
+    """One task per trigger, sleeping in ``DateTimeTrigger.run`` as the triggerer used to."""
+
+    def __init__(self):
+        self.fired = 0
+        self.tasks: list[asyncio.Task] = []
+
+    async def run_trigger(self, trigger: DateTimeTrigger) -> None:
+        async for _ in trigger.run():
+            self.fired += 1
+
+    def add(self, trigger_id: int, trigger: DateTimeTrigger) -> None:
+        self.tasks.append(asyncio.create_task(self.run_trigger(trigger)))
+
+    def cancel(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+
+
+async def probe_latency(duration: float, interval: float = 0.01) -> list[float]:
+    """Return how late each of a series of short sleeps woke up, in seconds."""
+    lags = []
+    loop = asyncio.get_running_loop()
+    end = loop.time() + duration
+    while (start := loop.time()) < end:
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+    return lags
+
+
+async def measure(kind: type[Timers | Tasks], count: int, duration: float, fire_in: float | None) -> dict:
+    now = timezone.utcnow()
+    tracemalloc.start()
+    start = time.perf_counter()
+    timers = kind()
+    for trigger_id in range(count):
+        if fire_in is None:
+            # Spread over the next day, so nothing fires during the measurement
+            delta = datetime.timedelta(hours=1, seconds=trigger_id % 86400)
+        else:
+            delta = datetime.timedelta(seconds=fire_in * trigger_id / count)
+        timers.add(trigger_id, DateTimeTrigger(now + delta))
+    # Let the tasks start
+    await asyncio.sleep(0)
+    setup = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    lags = await probe_latency(duration)
+    result = {
+        "setup": setup,
+        "memory": memory,
+        "p50 lag": statistics.median(lags),
+        "max lag": max(lags),
+        "fired": timers.fired,
+    }
+    timers.cancel()
+    await asyncio.sleep(0)
+    return result
+
+
+@click.command()
+@click.option("--counts", default="10000,100000", help="comma separated numbers of timers to benchmark")
+@click.option("--duration", default=3.0, help="seconds to measure the event loop latency for")
+@click.option(
+    "--fire-in",
+    default=None,
+    type=float,
+    help="spread the timers over this many seconds, so they fire while measuring, rather than a day",
+)
+def main(counts, duration, fire_in):
+    """
+    Compare the triggerer timer service against running a coroutine per temporal trigger.
+
+    For each number of DateTimeTriggers this reports the time to schedule them, the memory allocated for
+    them, and how late a 10ms sleep on the same event loop wakes up (median and worst) while they wait.
+    """
+    logging.disable(logging.INFO)
+    print(f"{'timers':>8} {'kind':<7} {'setup':>9} {'memory':>10} {'p50 lag':>9} {'max lag':>9} {'fired':>7}")
+    for count in map(int, counts.split(",")):
+        for kind in (Tasks, Timers):
+            result = asyncio.run(measure(kind, count, duration, fire_in))
+            print(
+                f"{count:>8} {kind.__name__.lower():<7} {result['setup']:>8.2f}s "
+                f"{result['memory'] / 2**20:>8.1f}MB {result['p50 lag'] * 1e3:>7.2f}ms "
+                f"{result['max lag'] * 1e3:>7.2f}ms {result['fired']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+#!/usr/bin/env python
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark and soak test a triggerer running synthetic triggers against the configured database.
+
+The triggers are defined in this module, which the triggerer imports as ``triggerer_timing``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import rich_click as click
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+MODULE = Path(__file__).stem
+DAG_ID = "triggerer_benchmark"
+RUN_ID = "benchmark"
+BUNDLE_NAME = "triggerer_benchmark"
+
+
+class SleepTrigger(BaseTrigger):
+    """Waits until it is cancelled, as most triggers spend their life doing."""
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (f"{MODULE}.SleepTrigger", {})
+
+    async def run(self):
+        await asyncio.Event().wait()
+        yield
+
+
+class FireTrigger(BaseTrigger):
+    """Fires ``delay`` seconds after starting, with the moments it started and fired at."""
+
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.delay = delay
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (f"{MODULE}.FireTrigger", {"delay": self.delay})
+
+    async def run(self):
+        started_at = time.time()
+        await asyncio.sleep(self.delay)
+        yield TriggerEvent({"started_at": started_at, "fired_at": time.time()})
+
+
+class BlockTrigger(BaseTrigger):
+    """Blocks the event loop for ``block`` seconds every ``interval`` seconds, as badly written triggers do."""
+
+    def __init__(self, block: float = 0.001, interval: float = 1):
+        super().__init__()
+        self.block = block
+        self.interval = interval
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (f"{MODULE}.BlockTrigger", {"block": self.block, "interval": self.interval})
+
+    async def run(self):
+        while True:
+            time.sleep(self.block)  # noqa: ASYNC251 - blocking on purpose
+            await asyncio.sleep(self.interval)
+        yield
+
+
+class FailTrigger(BaseTrigger):
+    """Fails as soon as it starts."""
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (f"{MODULE}.FailTrigger", {})
+
+    async def run(self):
+        raise ValueError("Deliberate trigger failure")
+        yield
+
+
+TRIGGERS: dict[str, type[BaseTrigger]] = {
+    "sleep": SleepTrigger,
+    "fire": FireTrigger,
+    "block": BlockTrigger,
+    "fail": FailTrigger,
+}
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse ``kind=share,...`` into the share of the triggers of each kind."""
+    shares = {}
+    for item in mix.split(","):
+        kind, _, share = item.partition("=")
+        if kind not in TRIGGERS:
+            raise click.BadParameter(f"unknown trigger kind {kind!r}, expected one of {', '.join(TRIGGERS)}")
+        shares[kind] = float(share or 1)
+    total = sum(shares.values())
+    return {kind: share / total for kind, share in shares.items()}
+
+
+def interleave(count: int, mix: dict[str, float]) -> list[str]:
+    """Return the kind of each of ``count`` triggers, interleaving the kinds by their share."""
+    kinds = []
+    seen = dict.fromkeys(mix, 0)
+    for i in range(1, count + 1):
+        # The kind furthest behind its share goes next
+        kind = max(mix, key=lambda k: mix[k] * i - seen[k])
+        seen[kind] += 1
+        kinds.append(kind)
+    return kinds
+
+
+def reset(session) -> None:
+    """Delete the triggers and task instances of earlier runs."""
+    from sqlalchemy import delete
+
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.trigger import Trigger
+
+    session.rollback()
+    for statement in (
+        delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID),
+        delete(Trigger).where(Trigger.classpath.like(f"{MODULE}.%")),
+        delete(DagRun).where(DagRun.dag_id == DAG_ID),
+    ):
+        session.execute(statement.execution_options(synchronize_session=False))
+    session.commit()
+
+
+def create_dag_run(session):
+    """Create the Dag, its version and run the task instances of the benchmark belong to."""
+    from sqlalchemy import select
+
+    from airflow._shared.timezones import timezone
+    from airflow.models.dag import DagModel
+    from airflow.models.dag_version import DagVersion
+    from airflow.models.dagbundle import DagBundleModel
+    from airflow.models.dagrun import DagRun
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunType
+
+    if not session.get(DagBundleModel, BUNDLE_NAME):
+        session.add(DagBundleModel(name=BUNDLE_NAME))
+        session.flush()
+    if not session.get(DagModel, DAG_ID):
+        session.add(
+            DagModel(
+                dag_id=DAG_ID,
+                bundle_name=BUNDLE_NAME,
+                max_active_tasks=16,
+                max_consecutive_failed_dag_runs=0,
+                has_task_concurrency_limits=False,
+                is_paused=True,
+            )
+        )
+    session.flush()
+    version = session.scalar(select(DagVersion).where(DagVersion.dag_id == DAG_ID))
+    if not version:
+        version = DagVersion(dag_id=DAG_ID, bundle_name=BUNDLE_NAME)
+        session.add(version)
+    now = timezone.utcnow()
+    session.add(
+        DagRun(
+            dag_id=DAG_ID,
+            run_id=RUN_ID,
+            run_type=DagRunType.MANUAL,
+            run_after=now,
+            start_date=now,
+            state=DagRunState.RUNNING,
+        )
+    )
+    session.flush()
+    return version
+
+
+def create_triggers(kinds: list[str], fire_delay: float, session) -> None:
+    """Create a trigger of each kind, each deferring a mapped task instance of the benchmark run."""
+    from sqlalchemy import insert
+
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.trigger import Trigger
+    from airflow.utils.helpers import chunks
+    from airflow.utils.state import TaskInstanceState
+
+    version = create_dag_run(session)
+    kwargs = {"fire": {"delay": fire_delay}}
+    for batch in chunks(list(enumerate(kinds)), 5000):
+        triggers = [Trigger(*TRIGGERS[kind](**kwargs.get(kind, {})).serialize()) for _, kind in batch]
+        session.add_all(triggers)
+        session.flush()
+        session.execute(
+            insert(TaskInstance),
+            [
+                {
+                    "task_id": kind,
+                    "dag_id": DAG_ID,
+                    "run_id": RUN_ID,
+                    "map_index": map_index,
+                    "try_number": 1,
+                    "pool": "default_pool",
+                    "queue": "default",
+                    "priority_weight": 1,
+                    "state": TaskInstanceState.DEFERRED,
+                    "trigger_id": trigger.id,
+                    "next_method": "execute_complete",
+                    "dag_version_id": version.id,
+                }
+                for (map_index, kind), trigger in zip(batch, triggers)
+            ],
+        )
+        session.expunge_all()
+    session.commit()
+
+
+class Triggerer:
+    """An ``airflow triggerer`` process, importing the triggers of this module."""
+
+    def __init__(self, capacity: int, log_folder: str, session):
+        from sqlalchemy import func, select
+
+        from airflow.jobs.job import Job
+
+        # The job of the triggerer is the first one created after it starts
+        self.after_job_id = session.scalar(select(func.max(Job.id))) or 0
+        self.job_id: int | None = None
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(Path(__file__).parent), os.environ.get("PYTHONPATH")])
+            ),
+            "AIRFLOW__LOGGING__BASE_LOG_FOLDER": log_folder,
+        }
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "airflow", "triggerer", "--skip-serve-logs", "--capacity", str(capacity)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def rss(self) -> int:
+        """Return the memory used by the triggerer and its trigger runner, in bytes."""
+        import psutil
+
+        process = psutil.Process(self.process.pid)
+        return sum(p.memory_info().rss for p in [process, *process.children(recursive=True)])
+
+    def loop_lag(self, session) -> float | None:
+        """Return the event loop lag the triggerer reported at its last heartbeat."""
+        from airflow.jobs.job import Job
+
+        return session.get(Job, self.job_id, populate_existing=True).loop_lag
+
+    def wait_until_running(self, session, timeout: float = 120) -> None:
+        from sqlalchemy import select
+
+        from airflow.jobs.job import Job
+
+        end = time.monotonic() + timeout
+        while True:
+            self.job_id = session.scalar(
+                select(Job.id)
+                .where(Job.job_type == "TriggererJob", Job.id > self.after_job_id)
+                .order_by(Job.id)
+                .limit(1)
+            )
+            if self.job_id:
+                break
+            if self.process.poll() is not None:
+                sys.exit(f"The triggerer exited with {self.process.returncode}")
+            if time.monotonic() > end:
+                self.stop()
+                sys.exit("The triggerer did not start")
+            time.sleep(0.5)
+            session.rollback()
+        # Let the trigger runner start too
+        time.sleep(5)
+
+    def stop(self) -> None:
+        self.process.send_signal(signal.SIGTERM)
+        try:
+            self.process.wait(60)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def resumed(session) -> tuple[list[float], list[float], int]:
+    """Return when the fired triggers started and how late their task instances were resumed, and failures."""
+    from sqlalchemy import select
+
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.trigger import TRIGGER_FAIL_REPR
+    from airflow.utils.state import TaskInstanceState
+
+    started, latencies, failed = [], [], 0
+    rows = session.execute(
+        select(TaskInstance.next_method, TaskInstance.next_kwargs, TaskInstance.scheduled_dttm).where(
+            TaskInstance.dag_id == DAG_ID, TaskInstance.state == TaskInstanceState.SCHEDULED
+        )
+    )
+    for next_method, next_kwargs, scheduled_dttm in rows:
+        if next_method == TRIGGER_FAIL_REPR:
+            failed += 1
+            continue
+        event = next_kwargs["event"]
+        started.append(event["started_at"])
+        latencies.append(scheduled_dttm.timestamp() - event["fired_at"])
+    return started, latencies, failed
+
+
+def measure(
+    count: int, mix: dict[str, float], fire_delay: float, soak: float, sample_interval: float, timeout: float
+) -> dict[str, Any]:
+    from airflow.utils.session import create_session
+
+    kinds = interleave(count, mix)
+    expected = kinds.count("fire") + kinds.count("fail")
+    with create_session() as session, tempfile.TemporaryDirectory() as log_folder:
+        reset(session)
+        triggerer = Triggerer(count, log_folder, session)
+        try:
+            triggerer.wait_until_running(session)
+            baseline = triggerer.rss()
+
+            start = time.time()
+            create_triggers(kinds, fire_delay, session)
+            created_at = time.time()
+
+            # Triggers of all kinds are interleaved, so when the firing and failing ones are all done, the
+            # others have been created too
+            lags = []
+            end = time.monotonic() + timeout
+            while True:
+                started, latencies, failed = resumed(session)
+                lags.append(triggerer.loop_lag(session) or 0)
+                session.rollback()
+                if len(started) + failed >= expected or time.monotonic() > end:
+                    break
+                time.sleep(sample_interval)
+            memory = triggerer.rss()
+
+            soak_lags, soak_memory = [], []
+            end = time.monotonic() + soak
+            while time.monotonic() < end:
+                time.sleep(sample_interval)
+                soak_lags.append(triggerer.loop_lag(session) or 0)
+                soak_memory.append(triggerer.rss())
+                session.rollback()
+        finally:
+            triggerer.stop()
+            reset(session)
+
+    creation = (max(started) - created_at) if started else None
+    result: dict[str, Any] = {
+        "count": count,
+        "mix": mix,
+        "insert_s": created_at - start,
+        "created_per_s": len(kinds) / creation if creation else None,
+        "resumed": len(latencies),
+        "failed": failed,
+        "timed_out": len(started) + failed < expected,
+        "latency_p50_ms": statistics.median(latencies) * 1e3 if latencies else None,
+        "latency_p95_ms": statistics.quantiles(latencies, n=20, method="inclusive")[-1] * 1e3
+        if len(latencies) > 1
+        else None,
+        "latency_max_ms": max(latencies) * 1e3 if latencies else None,
+        "loop_lag_max_ms": max(lags) * 1e3,
+        "memory_per_trigger_kb": (memory - baseline) / count / 1024,
+    }
+    if soak:
+        result["soak_loop_lag_max_ms"] = max(soak_lags, default=0) * 1e3
+        result["soak_memory_growth_mb"] = (soak_memory[-1] - memory) / 2**20 if soak_memory else 0
+    return result
+
+
+COLUMNS = {
+    "count": "{:>8}",
+    "created_per_s": "{:>12.0f}",
+    "latency_p50_ms": "{:>14.1f}",
+    "latency_p95_ms": "{:>14.1f}",
+    "latency_max_ms": "{:>14.1f}",
+    "loop_lag_max_ms": "{:>15.1f}",
+    "memory_per_trigger_kb": "{:>21.2f}",
+    "failed": "{:>7}",
+    "soak_loop_lag_max_ms": "{:>20.1f}",
+    "soak_memory_growth_mb": "{:>21.1f}",
+}
+
+
+def print_report(results: list[dict[str, Any]], baseline: list[dict[str, Any]] | None) -> None:
+    columns = [column for column in COLUMNS if any(column in result for result in results)]
+    print(" ".join(f"{column:>{len(COLUMNS[column].format(0))}}" for column in columns))
+    by_count = {result["count"]: result for result in baseline or []}
+    for result in results:
+        cells = []
+        for column in columns:
+            value = result.get(column)
+            width = len(COLUMNS[column].format(0))
+            cells.append(COLUMNS[column].format(value) if value is not None else f"{'-':>{width}}")
+        print(" ".join(cells) + ("  (timed out)" if result["timed_out"] else ""))
+        if (before := by_count.get(result["count"])) is not None:
+            changes = []
+            for column in columns[1:]:
+                if before.get(column) and result.get(column) is not None:
+                    changes.append(f"{(result[column] - before[column]) / before[column]:+.0%}")
+                else:
+                    changes.append("-")
+            print(
+                f"{'vs base':>8} "
+                + " ".join(f"{c:>{len(COLUMNS[col].format(0))}}" for c, col in zip(changes, columns[1:]))
+            )
+
+
+@click.command()
+@click.option("--counts", default="1000,10000,100000", help="comma separated numbers of triggers to run")
+@click.option(
+    "--mix",
+    default="sleep=95,fire=4,fail=1",
+    help=f"comma separated kind=share of the triggers, of the kinds {', '.join(TRIGGERS)}",
+)
+@click.option("--fire-delay", default=0.0, help="seconds the firing triggers wait before firing")
+@click.option("--soak", default=0.0, help="seconds to keep the triggers running for, watching lag and memory")
+@click.option("--sample-interval", default=1.0, help="seconds between samples of the database and memory")
+@click.option("--timeout", default=600.0, help="seconds to wait for the triggers to fire for each count")
+@click.option("--output", type=click.Path(dir_okay=False), help="write the results to this JSON file")
+@click.option(
+    "--compare", type=click.File(), help="JSON file written by an earlier run to report the changes against"
+)
+def main(counts, mix, fire_delay, soak, sample_interval, timeout, output, compare):
+    """
+    Measure how a triggerer copes with large numbers of triggers.
+
+    For each number of triggers this starts ``airflow triggerer`` against the configured database, creates
+    the triggers (interleaving the kinds of ``--mix``) with a deferred task instance each, and reports:
+
+    \b
+    - how many triggers per second the triggerer started, from their creation in the database,
+    - the latency from a trigger firing to its task instance being scheduled (median, 95th percentile, max),
+    - the worst event loop lag the triggerer reported,
+    - the memory used per trigger by the triggerer processes,
+    - with ``--soak``, the worst loop lag and the memory growth while the triggers keep running.
+
+    The benchmark runs its triggers under the ``triggerer_benchmark`` Dag, which it cleans up after each
+    count. No other triggerer should be running against the database.
+    """
+    shares = parse_mix(mix)
+    baseline = json.load(compare)["results"] if compare else None
+    results = []
+    for count in map(int, counts.split(",")):
+        results.append(measure(count, shares, fire_delay, soak, sample_interval, timeout))
+    print_report(results, baseline)
+
+    if output:
+        from airflow import __version__
+
+        report = {
+            "airflow_version": __version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        Path(output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -31,7 +31,8 @@ import operator
 import time
 from collections import Counter
 from concurrent.futures import ProcessPoolExecutor
-from multiprocessing import cpu_count
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count, get_context
 from typing import TYPE_CHECKING, Any
 
 from celery import states as celery_states
@@ -299,15 +300,35 @@ class CeleryExecutor(BaseExecutor):
         self._sync_parallelism = conf.getint("celery", "SYNC_PARALLELISM")
         if self._sync_parallelism == 0:
             self._sync_parallelism = max(1, cpu_count() - 1)
-        from airflow.providers.celery.executors.celery_executor_utils import BulkStateFetcher
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            BulkStateFetcher,
+            TaskEventReceiver,
+        )
 
-        self.bulk_state_fetcher = BulkStateFetcher(self._sync_parallelism)
+        # Optionally follow the states of the tasks from their events, only fetching them all from the
+        # result backend every now and then, for the events that were missed
+        self.task_event_receiver = TaskEventReceiver() if conf.getboolean("celery", "task_events") else None
+        # Forking while the receiver's thread runs could leave a child with a lock the thread held, so the
+        # processes publishing tasks and fetching their states are started by a fork server then
+        self._mp_context = get_context("forkserver") if self.task_event_receiver else None
+        self.bulk_state_fetcher = BulkStateFetcher(self._sync_parallelism, mp_context=self._mp_context)
+        self._task_state_reconcile_interval = conf.getfloat("celery", "task_state_reconcile_interval")
+        self._next_task_state_reconcile = 0.0
+        # Processes publishing the tasks, kept with their broker connections from one heartbeat to the next
+        self._publisher_pool: ProcessPoolExecutor | None = None
         self.tasks = {}
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint("celery", "task_publish_max_retries")
+        # How many more tasks the workers could run when last asked, less the tasks sent since
+        self._capacity_hint_interval = conf.getfloat("celery", "capacity_hint_interval")
+        self._next_capacity_fetch = 0.0
+        self._free_worker_slots: int | None = None
+        self._tasks_sent_since_capacity_fetch = 0
 
     def start(self) -> None:
         self.log.debug("Starting Celery Executor using %s processes for syncing", self._sync_parallelism)
+        if self.task_event_receiver:
+            self.task_event_receiver.start()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -376,6 +397,7 @@ class CeleryExecutor(BaseExecutor):
                 result.backend = cached_celery_backend
                 self.running.add(key)
                 self.tasks[key] = result
+                self._tasks_sent_since_capacity_fetch += 1
 
                 # Store the Celery task_id in the event buffer. This will get "overwritten" if the task
                 # has another event, but that is fine, because the only other events are success/failed at
@@ -383,22 +405,71 @@ class CeleryExecutor(BaseExecutor):
                 self.event_buffer[key] = (TaskInstanceState.QUEUED, result.task_id)
 
     def _send_tasks_to_celery(self, task_tuples_to_send: Sequence[TaskInstanceInCelery]):
-        from airflow.providers.celery.executors.celery_executor_utils import send_task_to_executor
+        from airflow.providers.celery.executors.celery_executor_utils import (
+            ExceptionWithTraceback,
+            send_tasks_to_executor,
+        )
 
+        Stats.gauge("celery.publish_queue_depth", len(task_tuples_to_send))
         if len(task_tuples_to_send) == 1 or self._sync_parallelism == 1:
             # One tuple, or max one process -> send it in the main thread.
-            return list(map(send_task_to_executor, task_tuples_to_send))
+            results = send_tasks_to_executor(task_tuples_to_send)
+        else:
+            # Use chunks instead of a work queue to reduce context switching
+            # since tasks are roughly uniform in size
+            chunksize = self._num_tasks_per_send_process(len(task_tuples_to_send))
+            chunks = [
+                task_tuples_to_send[i : i + chunksize] for i in range(0, len(task_tuples_to_send), chunksize)
+            ]
+            if self._publisher_pool is None:
+                self._publisher_pool = ProcessPoolExecutor(
+                    max_workers=self._sync_parallelism, mp_context=self._mp_context
+                )
+            try:
+                results = [
+                    result
+                    for chunk_results in self._publisher_pool.map(send_tasks_to_executor, chunks)
+                    for result in chunk_results
+                ]
+            except BrokenProcessPool as e:
+                # Some of the tasks may have been sent before a publisher died, so don't send them again
+                self.log.exception("A Celery publisher process died, recreating the publisher pool")
+                self._shutdown_publisher_pool()
+                results = [
+                    (key, args, ExceptionWithTraceback(e, f"Celery Task ID: {key}"), 0)
+                    for key, args, _, _ in task_tuples_to_send
+                ]
+
+        key_and_async_results = []
+        for key, args, result, publish_time in results:
+            Stats.timing("celery.publish_duration", publish_time * 1000)
+            key_and_async_results.append((key, args, result))
+        return key_and_async_results
 
-        # Use chunks instead of a work queue to reduce context switching
-        # since tasks are roughly uniform in size
-        chunksize = self._num_tasks_per_send_process(len(task_tuples_to_send))
-        num_processes = min(len(task_tuples_to_send), self._sync_parallelism)
+    def capacity_hint(self) -> int | None:
+        """Estimate how many more tasks the workers can run, from their replies to inspection requests."""
+        if self._capacity_hint_interval <= 0:
+            return None
+        if time.monotonic() >= self._next_capacity_fetch:
+            from airflow.providers.celery.executors.celery_executor_utils import fetch_free_worker_slots
 
-        with ProcessPoolExecutor(max_workers=num_processes) as send_pool:
-            key_and_async_results = list(
-                send_pool.map(send_task_to_executor, task_tuples_to_send, chunksize=chunksize)
-            )
-        return key_and_async_results
+            try:
+                self._free_worker_slots = fetch_free_worker_slots()
+            except Exception:
+                self.log.exception("Failed to ask the Celery workers how many more tasks they can run")
+                self._free_worker_slots = None
+            self._tasks_sent_since_capacity_fetch = 0
+            self._next_capacity_fetch = time.monotonic() + self._capacity_hint_interval
+        if self._free_worker_slots is None:
+            return None
+        return max(
+            0, self._free_worker_slots - self._tasks_sent_since_capacity_fetch - len(self.queued_tasks)
+        )
+
+    def _shutdown_publisher_pool(self) -> None:
+        if self._publisher_pool is not None:
+            self._publisher_pool.shutdown(wait=False, cancel_futures=True)
+            self._publisher_pool = None
 
     def sync(self) -> None:
         if not self.tasks:
@@ -415,12 +486,18 @@ class CeleryExecutor(BaseExecutor):
 
     def update_all_task_states(self) -> None:
         """Update states of the tasks."""
-        self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
-        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+        if self.task_event_receiver and time.monotonic() < self._next_task_state_reconcile:
+            state_and_info_by_celery_task_id = self.task_event_receiver.get_many(self.tasks.values())
+        else:
+            self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
+            state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+            self.log.debug("Inquiries completed.")
+            if self.task_event_receiver:
+                self.task_event_receiver.retain({result.task_id for result in self.tasks.values()})
+                self._next_task_state_reconcile = time.monotonic() + self._task_state_reconcile_interval
 
-        self.log.debug("Inquiries completed.")
         for key, async_result in list(self.tasks.items()):
-            state, info = state_and_info_by_celery_task_id.get(async_result.task_id)
+            state, info = state_and_info_by_celery_task_id.get(async_result.task_id, (None, None))
             if state:
                 self.update_task_state(key, state, info)
 
@@ -449,9 +526,14 @@ class CeleryExecutor(BaseExecutor):
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
         self.sync()
+        self._shutdown_publisher_pool()
+        if self.task_event_receiver:
+            self.task_event_receiver.stop()
 
     def terminate(self):
-        pass
+        self._shutdown_publisher_pool()
+        if self.task_event_receiver:
+            self.task_event_receiver.stop()
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
@@ -28,6 +28,8 @@ import math
 import os
 import subprocess
 import sys
+import threading
+import time
 import traceback
 import warnings
 from collections.abc import Mapping, MutableMapping, Sequence
@@ -63,9 +65,11 @@ else:
     from setproctitle import setproctitle
 
 if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
     from typing import TypeAlias
 
     from celery.result import AsyncResult
+    from kombu import Producer
 
     from airflow.executors import workloads
     from airflow.executors.base_executor import EventBufferValueType
@@ -155,8 +159,12 @@ def execute_workload(input: str) -> None:
     from airflow.executors import workloads
     from airflow.sdk.execution_time.supervisor import supervise
 
-    decoder = TypeAdapter[workloads.All](workloads.All)
-    workload = decoder.validate_json(input)
+    try:
+        from airflow.executors.workload_codec import workload_from_str
+    except ImportError:  # Airflow < 3.2 only sends workloads as JSON
+        workload = TypeAdapter[workloads.All](workloads.All).validate_json(input)
+    else:
+        workload = workload_from_str(input)
 
     celery_task_id = app.current_task.request.id
 
@@ -270,19 +278,30 @@ class ExceptionWithTraceback:
 
 def send_task_to_executor(
     task_tuple: TaskInstanceInCelery,
+    producer: Producer | None = None,
 ) -> tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]:
-    """Send task to executor."""
+    """
+    Send task to executor.
+
+    :param task_tuple: The task to send
+    :param producer: The producer to publish the task with, rather than one acquired for this task only
+    """
     key, args, queue, task_to_run = task_tuple
 
     if AIRFLOW_V_3_0_PLUS:
         if TYPE_CHECKING:
             assert isinstance(args, workloads.BaseWorkload)
-        args = (args.model_dump_json(),)
+        try:
+            from airflow.executors.workload_codec import workload_to_str
+        except ImportError:  # Airflow < 3.2
+            args = (args.model_dump_json(),)
+        else:
+            args = (workload_to_str(args),)
     else:
         args = [args]  # type: ignore[list-item]
     try:
         with timeout(seconds=OPERATION_TIMEOUT):
-            result = task_to_run.apply_async(args=args, queue=queue)
+            result = task_to_run.apply_async(args=args, queue=queue, producer=producer)
     except (Exception, AirflowTaskTimeout) as e:
         exception_traceback = f"Celery Task ID: {key}\n{traceback.format_exc()}"
         result = ExceptionWithTraceback(e, exception_traceback)
@@ -292,6 +311,27 @@ def send_task_to_executor(
     return key, args, result
 
 
+def send_tasks_to_executor(
+    task_tuples: Sequence[TaskInstanceInCelery],
+) -> list[tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback, float]]:
+    """
+    Send tasks to executor one after the other, through the same producer and broker connection.
+
+    The scope of this function is global so that it can be called by subprocesses in the pool, which keep
+    their connections to the broker from one call to the next.
+
+    :param task_tuples: The tasks to send
+    :return: The result of ``send_task_to_executor`` for each task, with the seconds publishing it took
+    """
+    results = []
+    with app.producer_or_acquire() as producer:
+        for task_tuple in task_tuples:
+            start = time.monotonic()
+            key, args, result = send_task_to_executor(task_tuple, producer=producer)
+            results.append((key, args, result, time.monotonic() - start))
+    return results
+
+
 def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | ExceptionWithTraceback, Any]:
     """
     Fetch and return the state of the given celery task.
@@ -314,6 +354,26 @@ def fetch_celery_task_state(async_result: AsyncResult) -> tuple[str, str | Excep
         return async_result.task_id, ExceptionWithTraceback(e, exception_traceback), None
 
 
+def fetch_free_worker_slots() -> int | None:
+    """
+    Ask the Celery workers how many more tasks they can run right now.
+
+    :return: The total concurrency of the workers replying, less the tasks they are running or have
+        reserved, or None if no worker replied
+    """
+    stats = app.control.inspect(timeout=OPERATION_TIMEOUT).stats()
+    if not stats:
+        return None
+    concurrency = sum(
+        worker_stats.get("pool", {}).get("max-concurrency", 0) for worker_stats in stats.values()
+    )
+    # Stop waiting for replies once all the workers that replied to the first request did
+    inspect = app.control.inspect(destination=list(stats), timeout=OPERATION_TIMEOUT, limit=len(stats))
+    busy = sum(len(tasks) for tasks in (inspect.active() or {}).values())
+    busy += sum(len(tasks) for tasks in (inspect.reserved() or {}).values())
+    return max(0, concurrency - busy)
+
+
 class BulkStateFetcher(LoggingMixin):
     """
     Gets status for many Celery tasks using the best method available.
@@ -323,9 +383,10 @@ class BulkStateFetcher(LoggingMixin):
     Otherwise, multiprocessing.Pool will be used. Each task status will be downloaded individually.
     """
 
-    def __init__(self, sync_parallelism=None):
+    def __init__(self, sync_parallelism=None, mp_context: BaseContext | None = None):
         super().__init__()
         self._sync_parallelism = sync_parallelism
+        self._mp_context = mp_context
 
     def _tasks_list_to_task_ids(self, async_tasks) -> set[str]:
         return {a.task_id for a in async_tasks}
@@ -384,7 +445,7 @@ class BulkStateFetcher(LoggingMixin):
     def _get_many_using_multiprocessing(self, async_results) -> Mapping[str, EventBufferValueType]:
         num_process = min(len(async_results), self._sync_parallelism)
 
-        with ProcessPoolExecutor(max_workers=num_process) as sync_pool:
+        with ProcessPoolExecutor(max_workers=num_process, mp_context=self._mp_context) as sync_pool:
             chunksize = max(1, math.ceil(len(async_results) / self._sync_parallelism))
 
             task_id_to_states_and_info = list(
@@ -403,3 +464,73 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class TaskEventReceiver(LoggingMixin):
+    """
+    Follows the state of Celery tasks from the task events the workers send, in a background thread.
+
+    The states of the tasks are kept in memory from the moment the receiver starts, so the states of tasks
+    whose events were missed (e.g. while it was reconnecting to the broker) must still be fetched from the
+    result backend.
+    """
+
+    EVENT_STATES = {
+        "task-started": celery_states.STARTED,
+        "task-succeeded": celery_states.SUCCESS,
+        "task-failed": celery_states.FAILURE,
+        "task-revoked": celery_states.REVOKED,
+        "task-retried": celery_states.RETRY,
+    }
+
+    def __init__(self, celery_app: Celery | None = None):
+        super().__init__()
+        self.app = celery_app or app
+        self._states: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._receiver = None
+        self._thread = threading.Thread(target=self._run, name="celery-task-events", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                with self.app.connection_for_read() as connection:
+                    self._receiver = self.app.events.Receiver(connection, handlers={"*": self.on_event})
+                    if self._stopped.is_set():
+                        break
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Lost the Celery task events, reconnecting")
+                self._stopped.wait(5)
+
+    def on_event(self, event: Mapping[str, Any]) -> None:
+        state = self.EVENT_STATES.get(event["type"])
+        if state is not None:
+            with self._lock:
+                # Events can arrive out of order, a late task-started must not undo the task's completion
+                if self._states.get(event["uuid"]) not in celery_states.READY_STATES:
+                    self._states[event["uuid"]] = state
+
+    def get_many(self, async_results) -> Mapping[str, EventBufferValueType]:
+        """Get the states of the tasks that sent events, like ``BulkStateFetcher.get_many``."""
+        with self._lock:
+            return {
+                async_result.task_id: (state, None)
+                for async_result in async_results
+                if (state := self._states.get(async_result.task_id)) is not None
+            }
+
+    def retain(self, task_ids: set[str]) -> None:
+        """Forget the states of all the other tasks, which the executor no longer follows."""
+        with self._lock:
+            self._states = {task_id: state for task_id, state in self._states.items() if task_id in task_ids}
@@ -90,6 +90,7 @@ DEFAULT_CELERY_CONFIG = {
     ),
     "worker_concurrency": conf.getint("celery", "WORKER_CONCURRENCY", fallback=16),
     "worker_enable_remote_control": conf.getboolean("celery", "worker_enable_remote_control", fallback=True),
+    "worker_send_task_events": conf.getboolean("celery", "task_events", fallback=False),
     **(extra_celery_config if isinstance(extra_celery_config, dict) else {}),
 }
 
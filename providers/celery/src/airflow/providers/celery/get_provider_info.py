@@ -148,7 +148,7 @@ def get_provider_info():
                         "default": "",
                     },
                     "sync_parallelism": {
-                        "description": "How many processes CeleryExecutor uses to sync task state.\n0 means to use max(1, number of cores - 1) processes.\n",
+                        "description": "How many processes CeleryExecutor uses to sync task state, and to publish tasks. The publishing\nprocesses are kept running, with their connections to the broker, between scheduler loops.\n0 means to use max(1, number of cores - 1) processes.\n",
                         "version_added": None,
                         "type": "string",
                         "example": None,
@@ -224,6 +224,27 @@ def get_provider_info():
                         "example": None,
                         "default": "3",
                     },
+                    "task_events": {
+                        "description": "Whether CeleryExecutor follows the state of its tasks from the task events Celery workers send,\nrather than by asking the result backend for the state of every running task in each scheduler\nloop. Turning it on also makes the workers send task events.\n",
+                        "version_added": "3.13.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "task_state_reconcile_interval": {
+                        "description": "When ``[celery] task_events`` is on, how often (in seconds) CeleryExecutor still asks the result\nbackend for the state of all its running tasks, for the tasks whose events it missed.\n",
+                        "version_added": "3.13.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "60",
+                    },
+                    "capacity_hint_interval": {
+                        "description": "How often (in seconds) CeleryExecutor asks the workers how many more tasks they can run, so that\nthe scheduler queues no more tasks than that. Asking the workers takes up to\n``[celery] operation_timeout``, as the executor waits for their replies. ``0`` disables this,\nleaving the executor's slots alone to limit how many tasks are queued.\n",
+                        "version_added": "3.13.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "0",
+                    },
                     "extra_celery_config": {
                         "description": 'Extra celery configs to include in the celery worker.\nAny of the celery config can be added to this config and it\nwill be applied while starting the celery worker. e.g. {"worker_max_tasks_per_child": 10}\nSee also:\nhttps://docs.celeryq.dev/en/stable/userguide/configuration.html#configuration-and-defaults\n',
                         "version_added": None,
@@ -22,6 +22,7 @@ import logging
 import os
 import signal
 import sys
+import time
 from datetime import timedelta
 from unittest import mock
 
@@ -154,6 +155,158 @@ class TestCeleryExecutor:
         ]
         mock_stats_gauge.assert_has_calls(calls)
 
+    @conf_vars({("celery", "sync_parallelism"): "2"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.Stats")
+    @mock.patch("airflow.providers.celery.executors.celery_executor.ProcessPoolExecutor")
+    def test_send_tasks_to_celery_keeps_publisher_pool(self, mock_pool_cls, mock_stats):
+        mock_pool_cls.return_value.map.side_effect = lambda send, chunks: [
+            [(key, args, f"result-{key}", 0.5) for key, args, _, _ in chunk] for chunk in chunks
+        ]
+        executor = celery_executor.CeleryExecutor()
+        task_tuples = [(f"key{i}", f"args{i}", None, None) for i in range(3)]
+
+        for _ in range(2):
+            results = executor._send_tasks_to_celery(task_tuples)
+            assert results == [(f"key{i}", f"args{i}", f"result-key{i}") for i in range(3)]
+
+        mock_pool_cls.assert_called_once_with(max_workers=2, mp_context=None)
+        _, chunks = mock_pool_cls.return_value.map.call_args.args
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        mock_stats.gauge.assert_called_with("celery.publish_queue_depth", 3)
+        mock_stats.timing.assert_called_with("celery.publish_duration", 500)
+
+        executor.end()
+        mock_pool_cls.return_value.shutdown.assert_called_once()
+        assert executor._publisher_pool is None
+
+    @conf_vars({("celery", "sync_parallelism"): "2"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.ProcessPoolExecutor")
+    def test_send_tasks_to_celery_fails_tasks_of_broken_publisher_pool(self, mock_pool_cls):
+        from concurrent.futures.process import BrokenProcessPool
+
+        mock_pool_cls.return_value.map.side_effect = BrokenProcessPool("A child process terminated")
+        executor = celery_executor.CeleryExecutor()
+
+        results = executor._send_tasks_to_celery(
+            [("key0", "args0", None, None), ("key1", "args1", None, None)]
+        )
+
+        assert [(key, args) for key, args, _ in results] == [("key0", "args0"), ("key1", "args1")]
+        assert all(
+            isinstance(result, celery_executor_utils.ExceptionWithTraceback)
+            and isinstance(result.exception, BrokenProcessPool)
+            for _, _, result in results
+        )
+        assert executor._publisher_pool is None
+
+    def test_send_tasks_to_executor_publishes_with_one_producer(self):
+        task = mock.MagicMock()
+        task.apply_async.side_effect = lambda **kwargs: f"result-{kwargs['args'][0]}"
+        workloads = [mock.MagicMock(**{"model_dump_json.return_value": f"w{i}"}) for i in range(3)]
+
+        with mock.patch.object(celery_executor_utils.app, "producer_or_acquire") as mock_acquire:
+            results = celery_executor_utils.send_tasks_to_executor(
+                [(f"key{i}", workload, "queue", task) for i, workload in enumerate(workloads)]
+            )
+
+        producer = mock_acquire.return_value.__enter__.return_value
+        mock_acquire.assert_called_once_with()
+        assert task.apply_async.call_args_list == [
+            mock.call(args=(f"w{i}",), queue="queue", producer=producer) for i in range(3)
+        ]
+        assert [result[:3] for result in results] == [
+            (f"key{i}", (f"w{i}",), f"result-w{i}") for i in range(3)
+        ]
+        assert all(publish_time >= 0 for *_, publish_time in results)
+
+    @conf_vars({("core", "workload_encoding"): "msgpack"})
+    def test_send_task_to_executor_compact_workload(self):
+        workload_codec = pytest.importorskip("airflow.executors.workload_codec")
+        from airflow.executors import workloads
+
+        task = mock.MagicMock()
+        workload = workloads.ExecuteTask(
+            token="token",
+            ti=workloads.TaskInstance(
+                id="4d828a62-a417-4936-a7a6-2b3fabacecab",
+                dag_version_id="4d828a62-a417-4936-a7a6-2b3fabacecac",
+                task_id="task",
+                dag_id="dag",
+                run_id="run",
+                try_number=1,
+                pool_slots=1,
+                queue="default",
+                priority_weight=1,
+            ),
+            dag_rel_path="dag.py",
+            bundle_info=workloads.BundleInfo(name="dags-folder"),
+            log_path="task.log",
+        )
+
+        celery_executor_utils.send_task_to_executor(("key", workload, "queue", task))
+
+        (text,) = task.apply_async.call_args.kwargs["args"]
+        assert text.startswith(workload_codec.TEXT_PREFIX)
+        assert workload_codec.workload_from_str(text) == workload
+
+    def test_no_capacity_hint_by_default(self):
+        assert celery_executor.CeleryExecutor().capacity_hint() is None
+
+    @conf_vars({("celery", "capacity_hint_interval"): "30"})
+    @mock.patch.object(celery_executor_utils, "fetch_free_worker_slots", return_value=10)
+    def test_capacity_hint_from_free_worker_slots(self, mock_fetch):
+        executor = celery_executor.CeleryExecutor()
+
+        with mock.patch.object(celery_executor.time, "monotonic", return_value=100) as mock_monotonic:
+            assert executor.capacity_hint() == 10
+            # Tasks sent or about to be sent since asking the workers take some of their slots
+            executor._tasks_sent_since_capacity_fetch = 3
+            executor.queued_tasks[mock.MagicMock()] = mock.MagicMock()
+            assert executor.capacity_hint() == 6
+            assert mock_fetch.call_count == 1
+
+            mock_monotonic.return_value = 131
+            mock_fetch.return_value = None
+            assert executor.capacity_hint() is None
+            assert mock_fetch.call_count == 2
+
+    def test_fetch_free_worker_slots(self):
+        with mock.patch.object(celery_executor_utils.app.control, "inspect") as mock_inspect:
+            mock_inspect.return_value.stats.return_value = {
+                "worker1": {"pool": {"max-concurrency": 16}},
+                "worker2": {"pool": {"max-concurrency": 8}},
+            }
+            mock_inspect.return_value.active.return_value = {"worker1": [{}] * 5, "worker2": [{}] * 8}
+            mock_inspect.return_value.reserved.return_value = {"worker1": [{}] * 2}
+
+            assert celery_executor_utils.fetch_free_worker_slots() == 9
+
+            mock_inspect.return_value.stats.return_value = None
+            assert celery_executor_utils.fetch_free_worker_slots() is None
+
+    @conf_vars({("celery", "task_events"): "True", ("celery", "task_state_reconcile_interval"): "60"})
+    @mock.patch("airflow.providers.celery.executors.celery_executor.CeleryExecutor.update_task_state")
+    def test_update_all_task_states_from_task_events(self, mock_update_task_state):
+        executor = celery_executor.CeleryExecutor()
+        executor.task_event_receiver = mock.MagicMock(spec=celery_executor_utils.TaskEventReceiver)
+        executor.bulk_state_fetcher = mock.MagicMock()
+        executor.tasks = {"key_a": mock.Mock(task_id="a"), "key_b": mock.Mock(task_id="b")}
+        executor.bulk_state_fetcher.get_many.return_value = {"a": ("STARTED", None), "b": ("PENDING", None)}
+        executor.task_event_receiver.get_many.return_value = {"a": ("SUCCESS", None)}
+
+        # States are first reconciled with the result backend, then come from the events
+        executor.update_all_task_states()
+        executor.task_event_receiver.retain.assert_called_once_with({"a", "b"})
+        executor.update_all_task_states()
+
+        executor.bulk_state_fetcher.get_many.assert_called_once()
+        executor.task_event_receiver.get_many.assert_called_once()
+        assert mock_update_task_state.call_args_list == [
+            mock.call("key_a", "STARTED", None),
+            mock.call("key_b", "PENDING", None),
+            mock.call("key_a", "SUCCESS", None),
+        ]
+
     @pytest.mark.skipif(AIRFLOW_V_3_0_PLUS, reason="Airflow 3 doesn't have execute_command anymore")
     @pytest.mark.parametrize(
         "command, raise_exception",
@@ -447,3 +600,68 @@ def test_celery_extra_celery_config_loaded_from_string():
     # reload celery conf to apply the new config
     importlib.reload(default_celery)
     assert default_celery.DEFAULT_CELERY_CONFIG["worker_max_tasks_per_child"] == 10
+
+
+@conf_vars({("celery", "task_events"): "True"})
+def test_celery_task_events_sent_by_workers():
+    import importlib
+
+    # reload celery conf to apply the new config
+    importlib.reload(default_celery)
+    assert default_celery.DEFAULT_CELERY_CONFIG["worker_send_task_events"] is True
+
+
+class TestTaskEventReceiver:
+    def test_keeps_states_of_task_events(self):
+        receiver = celery_executor_utils.TaskEventReceiver(mock.MagicMock())
+
+        receiver.on_event({"type": "task-started", "uuid": "a"})
+        receiver.on_event({"type": "task-started", "uuid": "b"})
+        receiver.on_event({"type": "task-succeeded", "uuid": "a"})
+        receiver.on_event({"type": "worker-heartbeat", "hostname": "worker"})
+
+        results = [mock.Mock(task_id=task_id) for task_id in ("a", "b", "c")]
+        assert receiver.get_many(results) == {"a": ("SUCCESS", None), "b": ("STARTED", None)}
+
+        receiver.retain({"b"})
+        assert receiver.get_many(results) == {"b": ("STARTED", None)}
+
+    def test_late_events_do_not_undo_completion(self):
+        receiver = celery_executor_utils.TaskEventReceiver(mock.MagicMock())
+
+        receiver.on_event({"type": "task-succeeded", "uuid": "a"})
+        receiver.on_event({"type": "task-started", "uuid": "a"})
+
+        assert receiver.get_many([mock.Mock(task_id="a")]) == {"a": ("SUCCESS", None)}
+
+    @pytest.mark.parametrize(("task_events", "start_method"), [("True", "forkserver"), ("False", None)])
+    def test_processes_not_forked_while_receiving_events(self, task_events, start_method):
+        with conf_vars({("celery", "task_events"): task_events}):
+            executor = celery_executor.CeleryExecutor()
+
+        mp_context = executor._mp_context
+        assert (mp_context.get_start_method() if mp_context else None) == start_method
+        assert executor.bulk_state_fetcher._mp_context is mp_context
+
+    def test_receives_events_in_background_until_stopped(self):
+        celery_app = mock.MagicMock()
+        receiver = celery_executor_utils.TaskEventReceiver(celery_app)
+
+        def capture(**kwargs):
+            handler = celery_app.events.Receiver.call_args.kwargs["handlers"]["*"]
+            handler({"type": "task-failed", "uuid": "a"})
+            receiver._stopped.wait()
+
+        celery_app.events.Receiver.return_value.capture.side_effect = capture
+        receiver.start()
+        try:
+            for _ in range(50):
+                if receiver.get_many([mock.Mock(task_id="a")]):
+                    break
+                time.sleep(0.1)
+            assert receiver.get_many([mock.Mock(task_id="a")]) == {"a": ("FAILURE", None)}
+        finally:
+            receiver.stop()
+
+        assert not receiver._thread.is_alive()
+        assert receiver._receiver.should_stop is True
@@ -167,9 +167,21 @@ class KubernetesExecutor(BaseExecutor):
         self.task_publish_max_retries = conf.getint(
             "kubernetes_executor", "task_publish_max_retries", fallback=0
         )
+        # How many more pods the cluster could run when last checked, less the pods created since
+        self._next_capacity_fetch = 0.0
+        self._free_pod_slots: int | None = None
+        self._pods_created_since_capacity_fetch = 0
         super().__init__(parallelism=self.kube_config.parallelism)
 
     def _list_pods(self, query_kwargs):
+        if self.kube_config.use_pod_informer and self.kube_scheduler:
+            # Selectors the pod informer cache can't evaluate are sent to the API
+            with suppress(ValueError):
+                pods = self.kube_scheduler.list_cached_pods(
+                    query_kwargs.get("label_selector"), query_kwargs.get("field_selector")
+                )
+                if pods is not None:
+                    return pods
         query_kwargs["header_params"] = {
             "Accept": "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io"
         }
@@ -356,54 +368,76 @@ class KubernetesExecutor(BaseExecutor):
 
         from kubernetes.client.rest import ApiException
 
+        tasks = []
         with contextlib.suppress(Empty):
             for _ in range(self.kube_config.worker_pods_creation_batch_size):
-                task = self.task_queue.get_nowait()
+                tasks.append(self.task_queue.get_nowait())
 
-                try:
-                    key, command, kube_executor_config, pod_template_file = task
-                    self.kube_scheduler.run_next(task)
-                    self.task_publish_retries.pop(key, None)
-                except PodReconciliationError as e:
-                    self.log.exception(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-                    body = json.loads(e.body)
-                    retries = self.task_publish_retries[key]
-                    # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
-                    if (
-                        str(e.status) == "403"
-                        and "exceeded quota" in body["message"]
-                        and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
-                    ):
-                        self.log.warning(
-                            "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
-                            self.task_publish_retries[key] + 1,
-                            self.task_publish_max_retries,
-                            key,
-                            e.reason,
-                            body["message"],
-                        )
-                        self.task_queue.put(task)
-                        self.task_publish_retries[key] = retries + 1
-                    else:
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
-                        self.fail(key, e)
-                        self.task_publish_retries.pop(key, None)
-                except PodMutationHookException as e:
-                    key, _, _, _ = task
-                    self.log.error(
-                        "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+        for task, error in self.kube_scheduler.run_next_batch(tasks):
+            try:
+                key, command, kube_executor_config, pod_template_file = task
+                if error:
+                    raise error
+                self.task_publish_retries.pop(key, None)
+                self._pods_created_since_capacity_fetch += 1
+            except PodReconciliationError as e:
+                self.log.exception(
+                    "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                    "Try clearing the task to re-run.",
+                )
+                self.fail(task[0], e)
+            except ApiException as e:
+                body = json.loads(e.body)
+                retries = self.task_publish_retries[key]
+                # In case of exceeded quota errors, requeue the task as per the task_publish_max_retries
+                if (
+                    str(e.status) == "403"
+                    and "exceeded quota" in body["message"]
+                    and (self.task_publish_max_retries == -1 or retries < self.task_publish_max_retries)
+                ):
+                    self.log.warning(
+                        "[Try %s of %s] Kube ApiException for Task: (%s). Reason: %r. Message: %s",
+                        self.task_publish_retries[key] + 1,
+                        self.task_publish_max_retries,
                         key,
-                        e.__cause__,
+                        e.reason,
+                        body["message"],
                     )
+                    self.task_queue.put(task)
+                    self.task_publish_retries[key] = retries + 1
+                else:
+                    self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+                    key, _, _, _ = task
                     self.fail(key, e)
-                finally:
-                    self.task_queue.task_done()
+                    self.task_publish_retries.pop(key, None)
+            except PodMutationHookException as e:
+                key, _, _, _ = task
+                self.log.error(
+                    "Pod Mutation Hook failed for the task %s. Failing task. Details: %s",
+                    key,
+                    e.__cause__,
+                )
+                self.fail(key, e)
+            finally:
+                self.task_queue.task_done()
+
+    def capacity_hint(self) -> int | None:
+        """Estimate how many more pods the cluster can run, from its resource quotas or nodes."""
+        if not self.kube_config.capacity_hint_source or not self.kube_scheduler:
+            return None
+        if time.monotonic() >= self._next_capacity_fetch:
+            try:
+                self._free_pod_slots = self.kube_scheduler.fetch_free_pod_slots()
+            except Exception:
+                self.log.exception("Failed to find out how many more pods the cluster can run")
+                self._free_pod_slots = None
+            self._pods_created_since_capacity_fetch = 0
+            self._next_capacity_fetch = time.monotonic() + self.kube_config.capacity_hint_interval
+        if self._free_pod_slots is None:
+            return None
+        # Tasks whose pods are still to be created will take some of the slots too
+        pending = len(self.queued_tasks) + self.task_queue.qsize()
+        return max(0, self._free_pod_slots - self._pods_created_since_capacity_fetch - pending)
 
     @provide_session
     def _change_state(
@@ -0,0 +1,377 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A local cache of pods, kept up to date by listing them once and then watching for their changes.
+
+This is the "informer" pattern of the Kubernetes Go client, reduced to what the KubernetesExecutor needs: the
+pods are listed once, then watched from the resource version of the list, and only listed again when the
+watch can't be resumed. Everyone who needs to look at the worker pods can then read the cache instead of
+listing them from the Kubernetes API.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import ReadTimeoutError
+
+from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import ALL_NAMESPACES
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+if TYPE_CHECKING:
+    from kubernetes import client
+    from kubernetes.client import models as k8s
+
+    PodHandler = Callable[[dict[str, Any], "k8s.V1Pod | None"], None]
+    PodIndexer = Callable[["k8s.V1Pod"], "str | None"]
+
+# Field selectors the cache can answer, and how to get the field from a pod
+POD_SELECTOR_FIELDS: dict[str, Callable[[k8s.V1Pod], str | None]] = {
+    "metadata.name": lambda pod: pod.metadata.name,
+    "metadata.namespace": lambda pod: pod.metadata.namespace,
+    "status.phase": lambda pod: pod.status.phase if pod.status else None,
+}
+
+
+def parse_selector(selector: str | None) -> list[tuple[str, str, str | None]]:
+    """
+    Parse an equality based label or field selector into its requirements.
+
+    Each requirement is a ``(key, operator, value)`` tuple, with the operator being one of ``=``, ``!=``,
+    ``exists`` or ``!exists``. Set based selectors (``in``, ``notin``) are not supported.
+
+    :param selector: the selector, like ``airflow-worker=1,airflow_executor_done!=True``
+    :return: the requirements of the selector
+    """
+    requirements: list[tuple[str, str, str | None]] = []
+    if not selector:
+        return requirements
+    for requirement in selector.split(","):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        if "(" in requirement or " in " in requirement or " notin " in requirement:
+            raise ValueError(f"Set based selector requirements are not supported: {requirement}")
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            requirements.append((key.strip(), "!=", value.strip()))
+        elif "=" in requirement:
+            key, value = requirement.split("==", 1) if "==" in requirement else requirement.split("=", 1)
+            requirements.append((key.strip(), "=", value.strip()))
+        elif requirement.startswith("!"):
+            requirements.append((requirement[1:].strip(), "!exists", None))
+        else:
+            requirements.append((requirement, "exists", None))
+    return requirements
+
+
+def _matches(values: dict[str, str], requirements: list[tuple[str, str, str | None]]) -> bool:
+    for key, operator, value in requirements:
+        if operator == "=" and values.get(key) != value:
+            return False
+        if operator == "!=" and values.get(key) == value:
+            return False
+        if operator == "exists" and key not in values:
+            return False
+        if operator == "!exists" and key in values:
+            return False
+    return True
+
+
+class PodStore:
+    """
+    Thread safe store of pods, keyed by their namespace and name, with optional indexes.
+
+    :param indexers: functions giving the index value of a pod, by index name. A pod whose index value is
+        None is not part of that index.
+    """
+
+    def __init__(self, indexers: dict[str, PodIndexer] | None = None):
+        self._lock = threading.RLock()
+        self._pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self._indexers = indexers or {}
+        self._indexes: dict[str, dict[str, set[tuple[str, str]]]] = {
+            name: defaultdict(set) for name in self._indexers
+        }
+
+    @staticmethod
+    def key(pod: k8s.V1Pod) -> tuple[str, str]:
+        return pod.metadata.namespace, pod.metadata.name
+
+    def _index(self, key: tuple[str, str], pod: k8s.V1Pod) -> None:
+        for name, indexer in self._indexers.items():
+            value = indexer(pod)
+            if value is not None:
+                self._indexes[name][value].add(key)
+
+    def _unindex(self, key: tuple[str, str], pod: k8s.V1Pod) -> None:
+        for name, indexer in self._indexers.items():
+            value = indexer(pod)
+            if value is not None:
+                keys = self._indexes[name].get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._indexes[name][value]
+
+    def upsert(self, pod: k8s.V1Pod) -> k8s.V1Pod | None:
+        """Add or update a pod, returning the pod it replaced."""
+        key = self.key(pod)
+        with self._lock:
+            old = self._pods.get(key)
+            if old is not None:
+                self._unindex(key, old)
+            self._pods[key] = pod
+            self._index(key, pod)
+        return old
+
+    def delete(self, pod: k8s.V1Pod) -> k8s.V1Pod | None:
+        """Remove a pod, returning the pod that was stored."""
+        key = self.key(pod)
+        with self._lock:
+            old = self._pods.pop(key, None)
+            if old is not None:
+                self._unindex(key, old)
+        return old
+
+    def replace(self, pods: list[k8s.V1Pod]) -> list[k8s.V1Pod]:
+        """Replace the content of the store with the given pods, returning the pods that were removed."""
+        with self._lock:
+            keys = {self.key(pod) for pod in pods}
+            removed = [pod for key, pod in self._pods.items() if key not in keys]
+            self._pods = {}
+            self._indexes = {name: defaultdict(set) for name in self._indexers}
+            for pod in pods:
+                self.upsert(pod)
+        return removed
+
+    def get(self, namespace: str, name: str) -> k8s.V1Pod | None:
+        with self._lock:
+            return self._pods.get((namespace, name))
+
+    def list(self) -> list[k8s.V1Pod]:
+        with self._lock:
+            return list(self._pods.values())
+
+    def by_index(self, index_name: str, value: str) -> list[k8s.V1Pod]:
+        """Get the pods whose value for the given index is ``value``."""
+        with self._lock:
+            return [self._pods[key] for key in self._indexes[index_name].get(value, ())]
+
+    def select(self, label_selector: str | None = None, field_selector: str | None = None) -> list[k8s.V1Pod]:
+        """
+        Get the pods matching a label selector and a field selector, like listing them from the API would.
+
+        An index named after a label is used to narrow the pods down when the label selector requires an
+        exact value of that label.
+
+        :raises ValueError: if the selectors use something the store can't evaluate.
+        """
+        label_requirements = parse_selector(label_selector)
+        field_requirements = parse_selector(field_selector)
+        for key, operator, _ in field_requirements:
+            if key not in POD_SELECTOR_FIELDS or operator not in ("=", "!="):
+                raise ValueError(f"Unsupported field selector: {field_selector}")
+        with self._lock:
+            candidates = None
+            for key, operator, value in label_requirements:
+                if operator == "=" and key in self._indexes:
+                    candidates = self.by_index(key, value)  # type: ignore[arg-type]
+                    break
+            if candidates is None:
+                candidates = self.list()
+        pods = []
+        for pod in candidates:
+            fields = {key: getter(pod) for key, getter in POD_SELECTOR_FIELDS.items()}
+            if _matches(pod.metadata.labels or {}, label_requirements) and _matches(
+                {key: value for key, value in fields.items() if value is not None}, field_requirements
+            ):
+                pods.append(pod)
+        return pods
+
+
+class PodInformer(LoggingMixin):
+    """
+    Keep a :class:`PodStore` of the pods matching a label selector up to date, in a background thread.
+
+    The pods are listed once, then watched from the resource version of the list. A watch that ends is
+    resumed from the last resource version seen, and the pods are only listed again when that resource
+    version is too old. Handlers get every change of the store, as a watch event and the pod it replaced.
+
+    :param kube_client: the client to list and watch the pods with
+    :param namespace: the namespace to watch, or ``ALL_NAMESPACES``
+    :param label_selector: the label selector of the pods to keep
+    :param indexers: indexes to keep in the store, see :class:`PodStore`
+    :param request_kwargs: extra arguments of the list and watch requests
+    """
+
+    min_backoff = 1.0
+    max_backoff = 30.0
+
+    def __init__(
+        self,
+        kube_client: client.CoreV1Api,
+        namespace: str,
+        label_selector: str,
+        *,
+        indexers: dict[str, PodIndexer] | None = None,
+        request_kwargs: dict[str, Any] | None = None,
+    ):
+        super().__init__()
+        self.kube_client = kube_client
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.request_kwargs = request_kwargs or {}
+        self.store = PodStore(indexers)
+        self.resource_version: str | None = None
+        self._handlers: list[PodHandler] = []
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch: watch.Watch | None = None
+        self._thread: threading.Thread | None = None
+
+    def add_handler(self, handler: PodHandler) -> None:
+        """Add a function called with each event and the pod it replaced in the store."""
+        self._handlers.append(handler)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"pod-informer-{self.namespace}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the informer, whose thread ends when its current watch request does."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread:
+            self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def has_synced(self) -> bool:
+        """Whether the store holds the result of a full list of the pods."""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: float | None = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def _list_func(self):
+        if self.namespace == ALL_NAMESPACES:
+            return self.kube_client.list_pod_for_all_namespaces, ()
+        return self.kube_client.list_namespaced_pod, (self.namespace,)
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        kwargs = {"label_selector": self.label_selector, **self.request_kwargs}
+        # For info about k8s timeout settings see
+        # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
+        kwargs.setdefault("_request_timeout", 30)
+        return kwargs
+
+    def _notify(self, event: dict[str, Any], old: k8s.V1Pod | None) -> None:
+        for handler in self._handlers:
+            try:
+                handler(event, old)
+            except Exception:
+                self.log.exception("Error handling the %s event of pod %s", event["type"], event["object"])
+
+    def _event(self, event_type: str, pod: k8s.V1Pod) -> dict[str, Any]:
+        raw_object = self.kube_client.api_client.sanitize_for_serialization(pod)
+        return {"type": event_type, "object": pod, "raw_object": raw_object}
+
+    def _relist(self) -> None:
+        previous = {self.store.key(pod): pod for pod in self.store.list()}
+        func, args = self._list_func()
+        pod_list = func(*args, **self._request_kwargs())
+        for pod in self.store.replace(pod_list.items):
+            self._notify(self._event("DELETED", pod), pod)
+        for pod in pod_list.items:
+            old = previous.get(self.store.key(pod))
+            if old is None:
+                self._notify(self._event("ADDED", pod), None)
+            elif old.metadata.resource_version != pod.metadata.resource_version:
+                self._notify(self._event("MODIFIED", pod), old)
+        self.resource_version = pod_list.metadata.resource_version
+        self.log.info(
+            "Listed %d pods in namespace %s at resource version %s",
+            len(pod_list.items),
+            self.namespace,
+            self.resource_version,
+        )
+        self._synced.set()
+
+    def _watch_pods(self) -> None:
+        kwargs = self._request_kwargs()
+        kwargs.setdefault("timeout_seconds", 3600)
+        kwargs["resource_version"] = self.resource_version
+        kwargs["allow_watch_bookmarks"] = True
+        func, args = self._list_func()
+        self._watch = watch.Watch()
+        for event in self._watch.stream(func, *args, **kwargs):
+            if event["type"] == "BOOKMARK":
+                self.resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                continue
+            if event["type"] == "ERROR":
+                raw_object = event["raw_object"]
+                raise ApiException(status=raw_object.get("code"), reason=raw_object.get("message"))
+            pod = event["object"]
+            if event["type"] == "DELETED":
+                old = self.store.delete(pod)
+            else:
+                old = self.store.upsert(pod)
+            self.resource_version = pod.metadata.resource_version
+            self._notify(event, old)
+            if self._stopped.is_set():
+                break
+
+    def _run(self) -> None:
+        backoff = self.min_backoff
+        needs_list = True
+        while not self._stopped.is_set():
+            try:
+                if needs_list:
+                    self._relist()
+                    needs_list = False
+                self._watch_pods()
+                backoff = self.min_backoff
+            except ReadTimeoutError:
+                self.log.debug("Pod watch in namespace %s timed out waiting for events", self.namespace)
+            except ApiException as e:
+                if str(e.status) == "410":
+                    self.log.info(
+                        "Resource version %s of namespace %s is too old, listing the pods again",
+                        self.resource_version,
+                        self.namespace,
+                    )
+                    needs_list = True
+                    continue
+                self.log.warning("Error watching pods in namespace %s, listing them again", self.namespace)
+                needs_list = True
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+            except Exception:
+                self.log.exception("Error watching pods in namespace %s, listing them again", self.namespace)
+                needs_list = True
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
@@ -17,18 +17,29 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import json
+import logging
 import multiprocessing
+import os
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Queue
 from typing import TYPE_CHECKING, Any
 
+import tenacity
 from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
+from kubernetes.utils import parse_quantity
 from urllib3.exceptions import ReadTimeoutError
 
 from airflow.exceptions import AirflowException
 from airflow.providers.cncf.kubernetes.backcompat import get_logical_date_key
+from airflow.providers.cncf.kubernetes.exceptions import PodMutationHookException
+from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_informer import PodInformer
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import (
     ADOPTED,
     ALL_NAMESPACES,
@@ -56,143 +67,87 @@ if TYPE_CHECKING:
     )
 
 
-class ResourceVersion(metaclass=Singleton):
-    """Singleton for tracking resourceVersion from Kubernetes."""
+# Stand-ins for the values of a task instance in the worker pods rendered once per task, see
+# AirflowKubernetesScheduler.render_worker_pod
+_POD_ID_PLACEHOLDER = "airflow-pod-id-placeholder"
+_TRY_NUMBER_PLACEHOLDER = 2**31 - 1
+_MAP_INDEX_PLACEHOLDER = 2**31 - 2
+_RUN_ID_PLACEHOLDER = "airflow-run-id-placeholder"
+_ARGS_PLACEHOLDER = ["airflow-args-placeholder"]
 
-    resource_version: dict[str, str] = {}
 
+def should_retry_create_pod(exception: BaseException) -> bool:
+    """Check if creating a pod was throttled or conflicted, and is worth retrying."""
+    if isinstance(exception, ApiException):
+        return str(exception.status) in ("409", "429")
+    return False
 
-class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
-    """Watches for Kubernetes jobs."""
-
-    def __init__(
-        self,
-        namespace: str,
-        watcher_queue: Queue[KubernetesWatchType],
-        resource_version: str | None,
-        scheduler_job_id: str,
-        kube_config: Configuration,
-    ):
-        super().__init__()
-        self.namespace = namespace
-        self.scheduler_job_id = scheduler_job_id
-        self.watcher_queue = watcher_queue
-        self.resource_version = resource_version
-        self.kube_config = kube_config
 
-    def run(self) -> None:
-        """Perform watching."""
-        if TYPE_CHECKING:
-            assert self.scheduler_job_id
+class RateLimiter:
+    """
+    Token bucket limiting how often something happens, shared by threads.
 
-        kube_client: client.CoreV1Api = get_kube_client()
-        while True:
-            try:
-                self.resource_version = self._run(
-                    kube_client, self.resource_version, self.scheduler_job_id, self.kube_config
-                )
-            except ReadTimeoutError:
-                self.log.info("Kubernetes watch timed out waiting for events. Restarting watch.")
-                time.sleep(1)
-            except Exception:
-                self.log.exception("Unknown error in KubernetesJobWatcher. Failing")
-                self.resource_version = "0"
-                ResourceVersion().resource_version[self.namespace] = "0"
-                raise
-            else:
-                self.log.warning(
-                    "Watch died gracefully, starting back up with: last resource_version: %s",
-                    self.resource_version,
-                )
+    :param rate: number of times per second
+    :param burst: number of times it can happen at once after being idle
+    """
 
-    def _pod_events(self, kube_client: client.CoreV1Api, query_kwargs: dict):
-        watcher = watch.Watch()
-        try:
-            if self.namespace == ALL_NAMESPACES:
-                return watcher.stream(kube_client.list_pod_for_all_namespaces, **query_kwargs)
-            return watcher.stream(kube_client.list_namespaced_pod, self.namespace, **query_kwargs)
-        except ApiException as e:
-            if str(e.status) == "410":  # Resource version is too old
-                if self.namespace == ALL_NAMESPACES:
-                    pods = kube_client.list_pod_for_all_namespaces(watch=False)
-                else:
-                    pods = kube_client.list_namespaced_pod(namespace=self.namespace, watch=False)
-                resource_version = pods.metadata.resource_version
-                query_kwargs["resource_version"] = resource_version
-                return self._pod_events(kube_client=kube_client, query_kwargs=query_kwargs)
-            raise
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until it may happen again."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Taking the token of a later caller makes it wait for it instead
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
 
-    def _run(
-        self,
-        kube_client: client.CoreV1Api,
-        resource_version: str | None,
-        scheduler_job_id: str,
-        kube_config: Any,
-    ) -> str | None:
-        self.log.info("Event: and now my watch begins starting at resource_version: %s", resource_version)
 
-        kwargs: dict[str, Any] = {
-            "label_selector": f"airflow-worker={scheduler_job_id},{POD_EXECUTOR_DONE_KEY}!=True",
-        }
-        if resource_version:
-            kwargs["resource_version"] = resource_version
-        if kube_config.kube_client_request_args:
-            for key, value in kube_config.kube_client_request_args.items():
-                kwargs[key] = value
+class ResourceVersion(metaclass=Singleton):
+    """Singleton for tracking resourceVersion from Kubernetes."""
 
-        last_resource_version: str | None = None
+    resource_version: dict[str, str] = {}
 
-        # For info about k8s timeout settings see
-        # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
-        # and https://github.com/kubernetes-client/python/blob/v29.0.0/kubernetes/client/api_client.py#L336-L339
-        if "_request_timeout" not in kwargs:
-            kwargs["_request_timeout"] = 30
-        if "timeout_seconds" not in kwargs:
-            kwargs["timeout_seconds"] = 3600
 
-        logical_date_key = get_logical_date_key()
-        for event in self._pod_events(kube_client=kube_client, query_kwargs=kwargs):
-            task = event["object"]
-            self.log.debug("Event: %s had an event of type %s", task.metadata.name, event["type"])
-            if event["type"] == "ERROR":
-                return self.process_error(event)
-            annotations = task.metadata.annotations
-            task_instance_related_annotations = {
-                "dag_id": annotations["dag_id"],
-                "task_id": annotations["task_id"],
-                logical_date_key: annotations.get(logical_date_key),
-                "run_id": annotations.get("run_id"),
-                "try_number": annotations["try_number"],
-            }
-            map_index = annotations.get("map_index")
-            if map_index is not None:
-                task_instance_related_annotations["map_index"] = map_index
-
-            self.process_status(
-                pod_name=task.metadata.name,
-                namespace=task.metadata.namespace,
-                status=task.status.phase,
-                annotations=task_instance_related_annotations,
-                resource_version=task.metadata.resource_version,
-                event=event,
-            )
-            last_resource_version = task.metadata.resource_version
+class WorkerPodEventHandler(LoggingMixin):
+    """Puts the state changes of worker pods, told by their events, on the watcher queue."""
 
-        return last_resource_version
+    def __init__(self, watcher_queue: Queue[KubernetesWatchType], kube_config: Configuration):
+        super().__init__()
+        self.watcher_queue = watcher_queue
+        self.kube_config = kube_config
 
-    def process_error(self, event: Any) -> str:
-        """Process error response."""
-        self.log.error("Encountered Error response from k8s list namespaced pod stream => %s", event)
-        raw_object = event["raw_object"]
-        if raw_object["code"] == 410:
-            self.log.info(
-                "Kubernetes resource version is too old, must reset to 0 => %s", (raw_object["message"],)
-            )
-            # Return resource version 0
-            return "0"
-        raise AirflowException(
-            f"Kubernetes failure for {raw_object['reason']} with code {raw_object['code']} and message: "
-            f"{raw_object['message']}"
+    def process_event(self, event: dict[str, Any]) -> None:
+        """Process a pod event of the watch stream."""
+        task = event["object"]
+        annotations = task.metadata.annotations
+        logical_date_key = get_logical_date_key()
+        task_instance_related_annotations = {
+            "dag_id": annotations["dag_id"],
+            "task_id": annotations["task_id"],
+            logical_date_key: annotations.get(logical_date_key),
+            "run_id": annotations.get("run_id"),
+            "try_number": annotations["try_number"],
+        }
+        map_index = annotations.get("map_index")
+        if map_index is not None:
+            task_instance_related_annotations["map_index"] = map_index
+
+        self.process_status(
+            pod_name=task.metadata.name,
+            namespace=task.metadata.namespace,
+            status=task.status.phase,
+            annotations=task_instance_related_annotations,
+            resource_version=task.metadata.resource_version,
+            event=event,
         )
 
     def process_status(
@@ -302,6 +257,120 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             )
 
 
+class KubernetesJobWatcher(multiprocessing.Process, WorkerPodEventHandler):
+    """Watches for Kubernetes jobs."""
+
+    def __init__(
+        self,
+        namespace: str,
+        watcher_queue: Queue[KubernetesWatchType],
+        resource_version: str | None,
+        scheduler_job_id: str,
+        kube_config: Configuration,
+    ):
+        super().__init__()
+        self.namespace = namespace
+        self.scheduler_job_id = scheduler_job_id
+        self.watcher_queue = watcher_queue
+        self.resource_version = resource_version
+        self.kube_config = kube_config
+
+    def run(self) -> None:
+        """Perform watching."""
+        if TYPE_CHECKING:
+            assert self.scheduler_job_id
+
+        kube_client: client.CoreV1Api = get_kube_client()
+        while True:
+            try:
+                self.resource_version = self._run(
+                    kube_client, self.resource_version, self.scheduler_job_id, self.kube_config
+                )
+            except ReadTimeoutError:
+                self.log.info("Kubernetes watch timed out waiting for events. Restarting watch.")
+                time.sleep(1)
+            except Exception:
+                self.log.exception("Unknown error in KubernetesJobWatcher. Failing")
+                self.resource_version = "0"
+                ResourceVersion().resource_version[self.namespace] = "0"
+                raise
+            else:
+                self.log.warning(
+                    "Watch died gracefully, starting back up with: last resource_version: %s",
+                    self.resource_version,
+                )
+
+    def _pod_events(self, kube_client: client.CoreV1Api, query_kwargs: dict):
+        watcher = watch.Watch()
+        try:
+            if self.namespace == ALL_NAMESPACES:
+                return watcher.stream(kube_client.list_pod_for_all_namespaces, **query_kwargs)
+            return watcher.stream(kube_client.list_namespaced_pod, self.namespace, **query_kwargs)
+        except ApiException as e:
+            if str(e.status) == "410":  # Resource version is too old
+                if self.namespace == ALL_NAMESPACES:
+                    pods = kube_client.list_pod_for_all_namespaces(watch=False)
+                else:
+                    pods = kube_client.list_namespaced_pod(namespace=self.namespace, watch=False)
+                resource_version = pods.metadata.resource_version
+                query_kwargs["resource_version"] = resource_version
+                return self._pod_events(kube_client=kube_client, query_kwargs=query_kwargs)
+            raise
+
+    def _run(
+        self,
+        kube_client: client.CoreV1Api,
+        resource_version: str | None,
+        scheduler_job_id: str,
+        kube_config: Any,
+    ) -> str | None:
+        self.log.info("Event: and now my watch begins starting at resource_version: %s", resource_version)
+
+        kwargs: dict[str, Any] = {
+            "label_selector": f"airflow-worker={scheduler_job_id},{POD_EXECUTOR_DONE_KEY}!=True",
+        }
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+        if kube_config.kube_client_request_args:
+            for key, value in kube_config.kube_client_request_args.items():
+                kwargs[key] = value
+
+        last_resource_version: str | None = None
+
+        # For info about k8s timeout settings see
+        # https://github.com/kubernetes-client/python/blob/v29.0.0/examples/watch/timeout-settings.md
+        # and https://github.com/kubernetes-client/python/blob/v29.0.0/kubernetes/client/api_client.py#L336-L339
+        if "_request_timeout" not in kwargs:
+            kwargs["_request_timeout"] = 30
+        if "timeout_seconds" not in kwargs:
+            kwargs["timeout_seconds"] = 3600
+
+        for event in self._pod_events(kube_client=kube_client, query_kwargs=kwargs):
+            task = event["object"]
+            self.log.debug("Event: %s had an event of type %s", task.metadata.name, event["type"])
+            if event["type"] == "ERROR":
+                return self.process_error(event)
+            self.process_event(event)
+            last_resource_version = task.metadata.resource_version
+
+        return last_resource_version
+
+    def process_error(self, event: Any) -> str:
+        """Process error response."""
+        self.log.error("Encountered Error response from k8s list namespaced pod stream => %s", event)
+        raw_object = event["raw_object"]
+        if raw_object["code"] == 410:
+            self.log.info(
+                "Kubernetes resource version is too old, must reset to 0 => %s", (raw_object["message"],)
+            )
+            # Return resource version 0
+            return "0"
+        raise AirflowException(
+            f"Kubernetes failure for {raw_object['reason']} with code {raw_object['code']} and message: "
+            f"{raw_object['message']}"
+        )
+
+
 class AirflowKubernetesScheduler(LoggingMixin):
     """Airflow Scheduler for Kubernetes."""
 
@@ -322,24 +391,54 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self._manager = multiprocessing.Manager()
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
-        self.kube_watchers = self._make_kube_watchers()
+        self._worker_pod_templates: OrderedDict[tuple, tuple[k8s.V1Pod, dict, dict]] = OrderedDict()
+        self._worker_pod_templates_lock = threading.Lock()
+        self._pod_launcher: ThreadPoolExecutor | None = None
+        if self.kube_config.worker_pods_creation_concurrency > 1:
+            self._pod_launcher = ThreadPoolExecutor(
+                max_workers=self.kube_config.worker_pods_creation_concurrency,
+                thread_name_prefix="pod-launcher",
+            )
+        self._pod_creation_rate_limiter: RateLimiter | None = None
+        if self.kube_config.worker_pods_creation_rate_limit > 0:
+            self._pod_creation_rate_limiter = RateLimiter(
+                self.kube_config.worker_pods_creation_rate_limit,
+                burst=self.kube_config.worker_pods_creation_concurrency,
+            )
+        self.kube_watchers: dict[str, KubernetesJobWatcher] = {}
+        self.pod_informers: dict[str, PodInformer] = {}
+        if self.kube_config.use_pod_informer:
+            self.pod_event_handler = WorkerPodEventHandler(self.watcher_queue, self.kube_config)
+            self.pod_informers = self._make_pod_informers()
+        else:
+            self.kube_watchers = self._make_kube_watchers()
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
         """Run POD asynchronously."""
         sanitized_pod = self.kube_client.api_client.sanitize_for_serialization(pod)
-        json_pod = json.dumps(sanitized_pod, indent=2)
-
-        self.log.debug("Pod Creation Request: \n%s", json_pod)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Pod Creation Request: \n%s", json.dumps(sanitized_pod, indent=2))
         try:
-            resp = self.kube_client.create_namespaced_pod(
-                body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
-            )
+            resp = self._create_pod(sanitized_pod, pod.metadata.namespace, **kwargs)
             self.log.debug("Pod Creation Response: %s", resp)
         except Exception as e:
-            self.log.exception("Exception when attempting to create Namespaced Pod: %s", json_pod)
+            self.log.exception(
+                "Exception when attempting to create Namespaced Pod: %s", json.dumps(sanitized_pod, indent=2)
+            )
             raise e
         return resp
 
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(5),
+        wait=tenacity.wait_random_exponential(max=15),
+        reraise=True,
+        retry=tenacity.retry_if_exception(should_retry_create_pod),
+    )
+    def _create_pod(self, body: dict, namespace: str, **kwargs):
+        if self._pod_creation_rate_limiter:
+            self._pod_creation_rate_limiter.acquire()
+        return self.kube_client.create_namespaced_pod(body=body, namespace=namespace, **kwargs)
+
     def _make_kube_watcher(self, namespace) -> KubernetesJobWatcher:
         resource_version = ResourceVersion().resource_version.get(namespace, "0")
         watcher = KubernetesJobWatcher(
@@ -352,21 +451,124 @@ class AirflowKubernetesScheduler(LoggingMixin):
         watcher.start()
         return watcher
 
-    def _make_kube_watchers(self) -> dict[str, KubernetesJobWatcher]:
-        watchers = {}
+    def _namespaces_to_watch(self) -> list[str]:
         if self.kube_config.multi_namespace_mode:
-            namespaces_to_watch = (
+            return (
                 self.kube_config.multi_namespace_mode_namespace_list
                 if self.kube_config.multi_namespace_mode_namespace_list
                 else [ALL_NAMESPACES]
             )
-        else:
-            namespaces_to_watch = [self.kube_config.kube_namespace]
+        return [self.kube_config.kube_namespace]
 
-        for namespace in namespaces_to_watch:
+    def _make_kube_watchers(self) -> dict[str, KubernetesJobWatcher]:
+        watchers = {}
+        for namespace in self._namespaces_to_watch():
             watchers[namespace] = self._make_kube_watcher(namespace)
         return watchers
 
+    def _make_pod_informer(self, namespace: str) -> PodInformer:
+        # Cache every worker pod, not only the ones of this scheduler, as adoption looks for the pods
+        # of other schedulers
+        informer = PodInformer(
+            get_kube_client(),
+            namespace,
+            "airflow-worker",
+            indexers={"airflow-worker": lambda pod: (pod.metadata.labels or {}).get("airflow-worker")},
+            request_kwargs=self.kube_config.kube_client_request_args,
+        )
+        informer.add_handler(self._process_pod_event)
+        informer.start()
+        return informer
+
+    def _make_pod_informers(self) -> dict[str, PodInformer]:
+        return {namespace: self._make_pod_informer(namespace) for namespace in self._namespaces_to_watch()}
+
+    def _is_watched_pod(self, pod: k8s.V1Pod | None) -> bool:
+        """Whether the KubernetesJobWatcher of this scheduler would watch the pod."""
+        if pod is None:
+            return False
+        labels = pod.metadata.labels or {}
+        return (
+            labels.get("airflow-worker") == self.scheduler_job_id
+            and labels.get(POD_EXECUTOR_DONE_KEY) != "True"
+        )
+
+    def _process_pod_event(self, event: dict[str, Any], old_pod: k8s.V1Pod | None) -> None:
+        """Handle a change of the pod informer cache like the KubernetesJobWatcher would handle its event."""
+        if self._is_watched_pod(event["object"]):
+            self.pod_event_handler.process_event(event)
+        elif self._is_watched_pod(old_pod):
+            # The pod no longer matches the label selector of the watcher, which gets a DELETED event then
+            self.pod_event_handler.process_event({**event, "type": "DELETED"})
+
+    def list_cached_pods(
+        self, label_selector: str | None = None, field_selector: str | None = None, sync_timeout: float = 60
+    ) -> list[k8s.V1Pod] | None:
+        """
+        List the worker pods matching the selectors from the pod informer cache.
+
+        :param label_selector: label selector of the pods
+        :param field_selector: field selector of the pods
+        :param sync_timeout: how long to wait for the first list of the pods, in seconds
+        :return: the pods, or None if the pods are not cached and must be listed from the API instead
+        """
+        if not self.pod_informers:
+            return None
+        pods = []
+        for informer in self.pod_informers.values():
+            if not informer.wait_for_sync(sync_timeout):
+                self.log.warning("Pod informer for namespace %s has not synced yet", informer.namespace)
+                return None
+            pods.extend(informer.store.select(label_selector, field_selector))
+        return pods
+
+    def fetch_free_pod_slots(self) -> int | None:
+        """
+        Find out how many more pods the cluster can run right now, as per ``capacity_hint_source``.
+
+        With ``resource_quota``, this is the lowest number of pods left by the resource quotas of the
+        namespace of the executor limiting them. With ``node_allocatable``, this is the number of pods the
+        schedulable nodes can be allocated, less the pods not done yet.
+
+        :return: the number of pods, or None if nothing limits them
+        """
+        source = self.kube_config.capacity_hint_source
+        if source == "resource_quota":
+            free_pod_slots = None
+            quotas = self.kube_client.list_namespaced_resource_quota(
+                self.namespace, **self.kube_config.kube_client_request_args
+            )
+            for quota in quotas.items:
+                hard = (quota.status and quota.status.hard) or {}
+                used = (quota.status and quota.status.used) or {}
+                for resource in ("pods", "count/pods"):
+                    if resource in hard:
+                        free = int(parse_quantity(hard[resource]) - parse_quantity(used.get(resource, "0")))
+                        free_pod_slots = free if free_pod_slots is None else min(free_pod_slots, free)
+            return None if free_pod_slots is None else max(0, free_pod_slots)
+        if source == "node_allocatable":
+            nodes = self.kube_client.list_node(**self.kube_config.kube_client_request_args)
+            schedulable_nodes = {
+                node.metadata.name: int(parse_quantity((node.status.allocatable or {}).get("pods", "0")))
+                for node in nodes.items
+                if not (node.spec and node.spec.unschedulable)
+                and any(
+                    condition.type == "Ready" and condition.status == "True"
+                    for condition in (node.status.conditions or [])
+                )
+            }
+            # Pods not scheduled yet will take the slots of some node too
+            pods = self.kube_client.list_pod_for_all_namespaces(
+                field_selector="status.phase!=Succeeded,status.phase!=Failed",
+                resource_version="0",
+                **self.kube_config.kube_client_request_args,
+            )
+            used = sum(
+                1 for pod in pods.items if not pod.spec.node_name or pod.spec.node_name in schedulable_nodes
+            )
+            return max(0, sum(schedulable_nodes.values()) - used)
+        raise AirflowException(f"Unknown capacity hint source {source!r}")
+
     def _health_check_kube_watchers(self):
         for namespace, kube_watcher in self.kube_watchers.items():
             if kube_watcher.is_alive():
@@ -381,6 +583,10 @@ class AirflowKubernetesScheduler(LoggingMixin):
                 )
                 ResourceVersion().resource_version[namespace] = "0"
                 self.kube_watchers[namespace] = self._make_kube_watcher(namespace)
+        for namespace, informer in self.pod_informers.items():
+            if not informer.is_alive():
+                self.log.error("Pod informer for namespace %s died for unknown reasons", namespace)
+                self.pod_informers[namespace] = self._make_pod_informer(namespace)
 
     def run_next(self, next_job: KubernetesJobType) -> None:
         """Receives the next job to run, builds the pod, and creates it."""
@@ -400,28 +606,16 @@ class AirflowKubernetesScheduler(LoggingMixin):
         elif command[0:3] != ["airflow", "tasks", "run"]:
             raise ValueError('The command must start with ["airflow", "tasks", "run"].')
 
-        base_worker_pod = get_base_pod_from_template(pod_template_file, self.kube_config)
-
-        if not base_worker_pod:
-            raise AirflowException(
-                f"could not find a valid worker template yaml at {self.kube_config.pod_template_file}"
-            )
-
-        pod = PodGenerator.construct_pod(
-            namespace=self.namespace,
-            scheduler_job_id=self.scheduler_job_id,
+        pod = self.render_worker_pod(
             pod_id=create_unique_id(dag_id, task_id),
             dag_id=dag_id,
             task_id=task_id,
-            kube_image=self.kube_config.kube_image,
             try_number=try_number,
             map_index=map_index,
-            date=None,
             run_id=run_id,
             args=list(command),
             pod_override_object=kube_executor_config,
-            base_worker_pod=base_worker_pod,
-            with_mutation_hook=True,
+            pod_template_file=pod_template_file,
         )
         # Reconcile the pod generated by the Operator and the Pod
         # generated by the .cfg file
@@ -438,6 +632,151 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self.run_pod_async(pod, **self.kube_config.kube_client_request_args)
         self.log.debug("Kubernetes Job created!")
 
+    def run_next_batch(
+        self, next_jobs: Sequence[KubernetesJobType]
+    ) -> Iterator[tuple[KubernetesJobType, Exception | None]]:
+        """
+        Run the next jobs, creating their pods concurrently when a pod launcher pool is configured.
+
+        :param next_jobs: the jobs to run
+        :return: each job, in order, with the exception its creation raised if any
+        """
+        if self._pod_launcher is None or len(next_jobs) < 2:
+            for next_job in next_jobs:
+                try:
+                    self.run_next(next_job)
+                except Exception as e:
+                    yield next_job, e
+                else:
+                    yield next_job, None
+            return
+        futures = [self._pod_launcher.submit(self.run_next, next_job) for next_job in next_jobs]
+        for next_job, future in zip(next_jobs, futures):
+            yield next_job, future.exception()  # type: ignore[misc]
+
+    def _worker_pod_template(
+        self,
+        *,
+        dag_id: str,
+        task_id: str,
+        mapped: bool,
+        with_run_id: bool,
+        pod_override_object: k8s.V1Pod | None,
+        pod_template_file: str | None,
+    ) -> tuple[k8s.V1Pod, dict, dict]:
+        """Get the worker pod of a task with placeholders for the values of its task instances."""
+        template_file = pod_template_file or self.kube_config.pod_template_file
+        # The template file is read again when it changes
+        template_mtime = os.stat(template_file).st_mtime_ns if template_file else None
+        override_key = (
+            json.dumps(PodGenerator.serialize_pod(pod_override_object), sort_keys=True)
+            if pod_override_object
+            else None
+        )
+        key = (dag_id, task_id, mapped, with_run_id, template_file, template_mtime, override_key)
+        with self._worker_pod_templates_lock:
+            cached = self._worker_pod_templates.get(key)
+            if cached:
+                self._worker_pod_templates.move_to_end(key)
+                return cached
+
+        base_worker_pod = get_base_pod_from_template(pod_template_file, self.kube_config)
+        if not base_worker_pod:
+            raise AirflowException(
+                f"could not find a valid worker template yaml at {self.kube_config.pod_template_file}"
+            )
+        placeholders = {
+            "dag_id": dag_id,
+            "task_id": task_id,
+            "try_number": _TRY_NUMBER_PLACEHOLDER,
+            "map_index": _MAP_INDEX_PLACEHOLDER if mapped else -1,
+            "run_id": _RUN_ID_PLACEHOLDER if with_run_id else None,
+        }
+        template = PodGenerator.construct_pod(
+            namespace=self.namespace,
+            scheduler_job_id=self.scheduler_job_id,
+            pod_id=_POD_ID_PLACEHOLDER,
+            kube_image=self.kube_config.kube_image,
+            date=None,
+            args=_ARGS_PLACEHOLDER,
+            pod_override_object=pod_override_object,
+            base_worker_pod=base_worker_pod,
+            **placeholders,
+        )
+        placeholder_annotations = PodGenerator.build_annotations_for_k8s_executor_pod(**placeholders)
+        placeholder_labels = PodGenerator.build_labels_for_k8s_executor_pod(
+            airflow_worker=self.scheduler_job_id, **placeholders
+        )
+        cached = template, placeholder_annotations, placeholder_labels
+        with self._worker_pod_templates_lock:
+            self._worker_pod_templates[key] = cached
+            if len(self._worker_pod_templates) > 1024:
+                self._worker_pod_templates.popitem(last=False)
+        return cached
+
+    def render_worker_pod(
+        self,
+        *,
+        pod_id: str,
+        dag_id: str,
+        task_id: str,
+        try_number: int,
+        map_index: int,
+        run_id: str | None,
+        args: list[str],
+        pod_override_object: k8s.V1Pod | None,
+        pod_template_file: str | None,
+    ) -> k8s.V1Pod:
+        """
+        Build the worker pod of a task instance.
+
+        Reconciling the pod template, the executor config and the pod of the task instance is done once
+        per task and executor config, with placeholders for the values of the task instance. Each task
+        instance, like each index of a mapped task, gets a copy with the placeholders replaced. The result
+        is the same as building the pod with ``PodGenerator.construct_pod``.
+        """
+        template, placeholder_annotations, placeholder_labels = self._worker_pod_template(
+            dag_id=dag_id,
+            task_id=task_id,
+            mapped=map_index >= 0,
+            with_run_id=bool(run_id),
+            pod_override_object=pod_override_object,
+            pod_template_file=pod_template_file,
+        )
+        values = {
+            "dag_id": dag_id,
+            "task_id": task_id,
+            "try_number": try_number,
+            "map_index": map_index,
+            "run_id": run_id,
+        }
+        annotations = PodGenerator.build_annotations_for_k8s_executor_pod(**values)
+        labels = PodGenerator.build_labels_for_k8s_executor_pod(
+            airflow_worker=self.scheduler_job_id, **values
+        )
+
+        pod = copy.deepcopy(template)
+        # Only replace what the executor config or the template did not override
+        if pod.metadata.name == _POD_ID_PLACEHOLDER:
+            pod.metadata.name = pod_id
+        for key, value in placeholder_annotations.items():
+            if pod.metadata.annotations.get(key) == value:
+                pod.metadata.annotations[key] = annotations[key]
+        for key, value in placeholder_labels.items():
+            if pod.metadata.labels.get(key) == value:
+                pod.metadata.labels[key] = labels[key]
+        for container in pod.spec.containers:
+            if container.name == "base" and container.args == _ARGS_PLACEHOLDER:
+                container.args = args
+
+        from airflow.settings import pod_mutation_hook
+
+        try:
+            pod_mutation_hook(pod)
+        except Exception as e:
+            raise PodMutationHookException from e
+        return pod
+
     def delete_pod(self, pod_name: str, namespace: str) -> None:
         """Delete Pod from a namespace; does not raise if it does not exist."""
         try:
@@ -527,6 +866,11 @@ class AirflowKubernetesScheduler(LoggingMixin):
 
     def terminate(self) -> None:
         """Terminates the watcher."""
+        if self._pod_launcher:
+            self._pod_launcher.shutdown(wait=True)
+        self.log.debug("Stopping pod_informers...")
+        for informer in self.pod_informers.values():
+            informer.stop()
         self.log.debug("Terminating kube_watchers...")
         for kube_watcher in self.kube_watchers.values():
             kube_watcher.terminate()
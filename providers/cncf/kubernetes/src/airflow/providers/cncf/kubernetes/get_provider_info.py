@@ -178,6 +178,20 @@ def get_provider_info():
                         "example": None,
                         "default": "1",
                     },
+                    "worker_pods_creation_concurrency": {
+                        "description": 'Number of threads creating the worker pods of a scheduler loop in parallel. With the\ndefault of "1", the pods are created one after the other by the scheduler loop.\n',
+                        "version_added": "10.8.0",
+                        "type": "integer",
+                        "example": None,
+                        "default": "1",
+                    },
+                    "worker_pods_creation_rate_limit": {
+                        "description": 'Maximum number of worker pod creation requests sent to the Kubernetes API per second.\nPod creations throttled (429) or conflicting (409) are also retried with backoff.\n"0" for no limit.\n',
+                        "version_added": "10.8.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "0",
+                    },
                     "multi_namespace_mode": {
                         "description": "Allows users to launch pods in multiple namespaces.\nWill require creating a cluster-role for the scheduler,\nor use multi_namespace_mode_namespace_list configuration.\n",
                         "version_added": None,
@@ -276,6 +290,27 @@ def get_provider_info():
                         "example": None,
                         "default": "0",
                     },
+                    "use_pod_informer": {
+                        "description": "Keep a local cache of the worker pods, filled by listing them once and then watching\nfor their changes, instead of running a watcher process per namespace and listing pods\nfrom the Kubernetes API each time the executor adopts tasks or looks for a task's pod.\n",
+                        "version_added": "10.8.0",
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                    "capacity_hint_source": {
+                        "description": "How the scheduler finds out how many more worker pods the cluster can run, so that it queues no\nmore tasks than that: ``resource_quota`` from the resource quotas limiting the pods of the namespace\nof the executor, or ``node_allocatable`` from the pods the schedulable nodes can be allocated, which\nneeds permission to list nodes and the pods of all namespaces. Leave empty for only the parallelism\nof the executor to limit how many tasks are queued.\n",
+                        "version_added": "10.8.0",
+                        "type": "string",
+                        "example": None,
+                        "default": "",
+                    },
+                    "capacity_hint_interval": {
+                        "description": "How often (in seconds) the executor checks how many more pods the cluster can run, as per\n``capacity_hint_source``.\n",
+                        "version_added": "10.8.0",
+                        "type": "float",
+                        "example": None,
+                        "default": "30",
+                    },
                 },
             },
         },
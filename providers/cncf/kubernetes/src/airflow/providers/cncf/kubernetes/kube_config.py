@@ -52,6 +52,12 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, "worker_pods_creation_batch_size"
         )
+        self.worker_pods_creation_concurrency = conf.getint(
+            self.kubernetes_section, "worker_pods_creation_concurrency", fallback=1
+        )
+        self.worker_pods_creation_rate_limit = conf.getfloat(
+            self.kubernetes_section, "worker_pods_creation_rate_limit", fallback=0
+        )
         self.worker_container_repository = conf.get(self.kubernetes_section, "worker_container_repository")
         self.worker_container_tag = conf.get(self.kubernetes_section, "worker_container_tag")
         if self.worker_container_repository and self.worker_container_tag:
@@ -79,6 +85,12 @@ class KubeConfig:
         # interact with cluster components.
         self.executor_namespace = conf.get(self.kubernetes_section, "namespace")
 
+        self.use_pod_informer = conf.getboolean(self.kubernetes_section, "use_pod_informer", fallback=False)
+        self.capacity_hint_source = conf.get(self.kubernetes_section, "capacity_hint_source", fallback="")
+        self.capacity_hint_interval = conf.getfloat(
+            self.kubernetes_section, "capacity_hint_interval", fallback=30
+        )
+
         self.kube_client_request_args = conf.getjson(
             self.kubernetes_section, "kube_client_request_args", fallback={}
         )
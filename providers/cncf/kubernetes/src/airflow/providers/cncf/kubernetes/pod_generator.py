@@ -69,12 +69,20 @@ def workload_to_command_args(workload: workloads.ExecuteTask) -> list[str]:
     :param workload: The ExecuteTask workload to convert
     :return: List of command arguments for the Task SDK
     """
-    ser_input = workload.model_dump_json()
+    flag = "--json-string"
+    try:
+        from airflow.executors.workload_codec import TEXT_PREFIX, workload_to_str
+    except ImportError:  # Airflow < 3.2
+        ser_input = workload.model_dump_json()
+    else:
+        ser_input = workload_to_str(workload)
+        if ser_input.startswith(TEXT_PREFIX):
+            flag = "--workload-string"
     return [
         "python",
         "-m",
         "airflow.sdk.execution_time.execute_workload",
-        "--json-string",
+        flag,
         ser_input,
     ]
 
@@ -352,17 +360,14 @@ class PodGenerator:
         except Exception:
             image = kube_image
 
-        annotations = {
-            "dag_id": dag_id,
-            "task_id": task_id,
-            "try_number": str(try_number),
-        }
-        if map_index >= 0:
-            annotations["map_index"] = str(map_index)
-        if date:
-            annotations[get_logical_date_key()] = date.isoformat()
-        if run_id:
-            annotations["run_id"] = run_id
+        annotations = cls.build_annotations_for_k8s_executor_pod(
+            dag_id=dag_id,
+            task_id=task_id,
+            try_number=try_number,
+            map_index=map_index,
+            logical_date=date,
+            run_id=run_id,
+        )
 
         main_container = k8s.V1Container(
             name="base",
@@ -448,6 +453,34 @@ class PodGenerator:
             selector += ",airflow-worker"
         return selector
 
+    @staticmethod
+    def build_annotations_for_k8s_executor_pod(
+        *,
+        dag_id,
+        task_id,
+        try_number,
+        map_index=-1,
+        logical_date=None,
+        run_id=None,
+    ):
+        """
+        Generate annotations for kubernetes executor pod.
+
+        :meta private:
+        """
+        annotations = {
+            "dag_id": dag_id,
+            "task_id": task_id,
+            "try_number": str(try_number),
+        }
+        if map_index >= 0:
+            annotations["map_index"] = str(map_index)
+        if logical_date:
+            annotations[get_logical_date_key()] = logical_date.isoformat()
+        if run_id:
+            annotations["run_id"] = run_id
+        return annotations
+
     @classmethod
     def build_labels_for_k8s_executor_pod(
         cls,
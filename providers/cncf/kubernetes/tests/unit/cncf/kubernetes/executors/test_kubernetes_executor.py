@@ -19,6 +19,9 @@ from __future__ import annotations
 import random
 import re
 import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import mock
 
@@ -42,6 +45,7 @@ from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types impor
 from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import (
     AirflowKubernetesScheduler,
     KubernetesJobWatcher,
+    RateLimiter,
     ResourceVersion,
     get_base_pod_from_template,
 )
@@ -226,6 +230,223 @@ class TestAirflowKubernetesScheduler:
         finally:
             kube_executor.end()
 
+    @pytest.fixture
+    def kube_scheduler(self):
+        with (
+            mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client"),
+            mock.patch(
+                "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.KubernetesJobWatcher"
+            ),
+        ):
+            kube_executor = KubernetesExecutor()
+            kube_executor.job_id = 1
+            kube_executor.start()
+            try:
+                yield kube_executor.kube_scheduler
+            finally:
+                kube_executor.end()
+
+    @pytest.mark.parametrize("map_index", [-1, 0, 7])
+    @pytest.mark.parametrize(
+        "pod_override",
+        [
+            None,
+            k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(labels={"release": "stable"}, annotations={"team": "data"}),
+                spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base", image="airflow:3.6")]),
+            ),
+            k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(name="fixed-name"),
+                spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base", args=["overridden"])]),
+            ),
+        ],
+    )
+    def test_render_worker_pod_matches_construct_pod(
+        self, kube_scheduler, data_file, map_index, pod_override
+    ):
+        template_file = data_file("executor/basic_template.yaml").as_posix()
+        for try_number, run_id in ((1, "run_1"), (2, "run_2")):
+            pod = kube_scheduler.render_worker_pod(
+                pod_id="pod-id",
+                dag_id="dag",
+                task_id="task",
+                try_number=try_number,
+                map_index=map_index,
+                run_id=run_id,
+                args=["airflow", "tasks", "run", run_id],
+                pod_override_object=pod_override,
+                pod_template_file=template_file,
+            )
+            expected = pod_generator.PodGenerator.construct_pod(
+                namespace=kube_scheduler.namespace,
+                scheduler_job_id=kube_scheduler.scheduler_job_id,
+                pod_id="pod-id",
+                dag_id="dag",
+                task_id="task",
+                kube_image=kube_scheduler.kube_config.kube_image,
+                try_number=try_number,
+                map_index=map_index,
+                date=None,
+                run_id=run_id,
+                args=["airflow", "tasks", "run", run_id],
+                pod_override_object=pod_override,
+                base_worker_pod=get_base_pod_from_template(template_file, kube_scheduler.kube_config),
+                with_mutation_hook=True,
+            )
+            assert pod == expected
+
+    def test_render_worker_pod_reconciles_once_per_task(self, kube_scheduler, data_file):
+        template_file = data_file("executor/basic_template.yaml").as_posix()
+
+        def render(task_id, map_index, pod_override=None):
+            return kube_scheduler.render_worker_pod(
+                pod_id=f"pod-{map_index}",
+                dag_id="dag",
+                task_id=task_id,
+                try_number=1,
+                map_index=map_index,
+                run_id="run_id",
+                args=["airflow", "tasks", "run", str(map_index)],
+                pod_override_object=pod_override,
+                pod_template_file=template_file,
+            )
+
+        with mock.patch.object(
+            pod_generator.PodGenerator, "construct_pod", wraps=pod_generator.PodGenerator.construct_pod
+        ) as mock_construct_pod:
+            pods = [render("mapped", map_index) for map_index in range(5)]
+            assert mock_construct_pod.call_count == 1
+            render("mapped", 5, k8s.V1Pod(metadata=k8s.V1ObjectMeta(labels={"release": "stable"})))
+            render("other", 0)
+            assert mock_construct_pod.call_count == 3
+
+        assert [pod.metadata.name for pod in pods] == [f"pod-{map_index}" for map_index in range(5)]
+        assert [pod.metadata.labels["map_index"] for pod in pods] == [str(i) for i in range(5)]
+        assert [pod.spec.containers[0].args[-1] for pod in pods] == [str(i) for i in range(5)]
+
+    def test_run_next_batch_concurrently(self, kube_scheduler):
+        kube_scheduler._pod_launcher = ThreadPoolExecutor(max_workers=4)
+        error = ApiException(status=400)
+        threads = set()
+
+        def run_next(next_job):
+            threads.add(threading.get_ident())
+            time.sleep(0.2)
+            if next_job == "job-2":
+                raise error
+
+        jobs = [f"job-{i}" for i in range(4)]
+        with mock.patch.object(kube_scheduler, "run_next", side_effect=run_next):
+            start = time.monotonic()
+            results = list(kube_scheduler.run_next_batch(jobs))
+            assert time.monotonic() - start < 0.6
+
+        assert results == [("job-0", None), ("job-1", None), ("job-2", error), ("job-3", None)]
+        assert len(threads) == 4
+
+    @pytest.mark.parametrize("status", [409, 429])
+    def test_create_pod_retries(self, kube_scheduler, status):
+        pod = k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="pod", namespace="ns"))
+        kube_scheduler.kube_client = mock.MagicMock()
+        kube_scheduler.kube_client.api_client.sanitize_for_serialization.return_value = {"kind": "Pod"}
+        create_namespaced_pod = kube_scheduler.kube_client.create_namespaced_pod
+        create_namespaced_pod.side_effect = [ApiException(status=status), ApiException(status=status), pod]
+
+        with mock.patch.object(AirflowKubernetesScheduler._create_pod.retry, "sleep") as mock_sleep:
+            assert kube_scheduler.run_pod_async(pod) is pod
+
+        assert create_namespaced_pod.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_create_pod_does_not_retry_other_errors(self, kube_scheduler):
+        pod = k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="pod", namespace="ns"))
+        kube_scheduler.kube_client = mock.MagicMock()
+        kube_scheduler.kube_client.api_client.sanitize_for_serialization.return_value = {"kind": "Pod"}
+        kube_scheduler.kube_client.create_namespaced_pod.side_effect = ApiException(status=403)
+
+        with pytest.raises(ApiException):
+            kube_scheduler.run_pod_async(pod)
+        assert kube_scheduler.kube_client.create_namespaced_pod.call_count == 1
+
+    def test_rate_limiter(self):
+        rate_limiter = RateLimiter(rate=50, burst=2)
+        start = time.monotonic()
+        for _ in range(7):
+            rate_limiter.acquire()
+        # The first two are let through at once, the others every 20ms
+        assert time.monotonic() - start >= 0.1
+
+    def test_fetch_free_pod_slots_from_resource_quotas(self, kube_scheduler):
+        kube_scheduler.kube_config.capacity_hint_source = "resource_quota"
+        kube_scheduler.kube_client.list_namespaced_resource_quota.return_value = k8s.V1ResourceQuotaList(
+            items=[
+                k8s.V1ResourceQuota(status=k8s.V1ResourceQuotaStatus(hard={"cpu": "10"}, used={"cpu": "2"})),
+                k8s.V1ResourceQuota(
+                    status=k8s.V1ResourceQuotaStatus(hard={"pods": "50"}, used={"pods": "20"})
+                ),
+                k8s.V1ResourceQuota(
+                    status=k8s.V1ResourceQuotaStatus(hard={"count/pods": "40"}, used={"count/pods": "20"})
+                ),
+            ]
+        )
+
+        assert kube_scheduler.fetch_free_pod_slots() == 20
+        kube_scheduler.kube_client.list_namespaced_resource_quota.assert_called_once_with("default")
+
+        kube_scheduler.kube_client.list_namespaced_resource_quota.return_value = k8s.V1ResourceQuotaList(
+            items=[]
+        )
+        assert kube_scheduler.fetch_free_pod_slots() is None
+
+    def test_fetch_free_pod_slots_from_node_allocatable(self, kube_scheduler):
+        def node(name, pods, ready=True, unschedulable=False):
+            return k8s.V1Node(
+                metadata=k8s.V1ObjectMeta(name=name),
+                spec=k8s.V1NodeSpec(unschedulable=unschedulable),
+                status=k8s.V1NodeStatus(
+                    allocatable={"pods": pods},
+                    conditions=[k8s.V1NodeCondition(type="Ready", status=str(ready))],
+                ),
+            )
+
+        def pod(node_name):
+            return k8s.V1Pod(spec=k8s.V1PodSpec(containers=[], node_name=node_name))
+
+        kube_scheduler.kube_config.capacity_hint_source = "node_allocatable"
+        kube_scheduler.kube_client.list_node.return_value = k8s.V1NodeList(
+            items=[
+                node("node-1", "110"),
+                node("node-2", "110"),
+                node("node-3", "110", ready=False),
+                node("node-4", "110", unschedulable=True),
+            ]
+        )
+        kube_scheduler.kube_client.list_pod_for_all_namespaces.return_value = k8s.V1PodList(
+            items=[pod("node-1")] * 100 + [pod("node-2")] * 50 + [pod("node-3")] * 10 + [pod(None)] * 5
+        )
+
+        # 220 pods on the 2 ready and schedulable nodes, less the 150 pods on them and 5 pods still to schedule
+        assert kube_scheduler.fetch_free_pod_slots() == 65
+
+    def test_capacity_hint(self):
+        executor = KubernetesExecutor()
+        assert executor.capacity_hint() is None
+
+        executor.kube_config.capacity_hint_source = "resource_quota"
+        executor.kube_scheduler = mock.MagicMock(**{"fetch_free_pod_slots.return_value": 10})
+        executor.task_queue = mock.MagicMock(**{"qsize.return_value": 2})
+        with mock.patch.object(time, "monotonic", return_value=100) as mock_monotonic:
+            assert executor.capacity_hint() == 8
+            # Pods created or about to be since checking take some of the slots
+            executor._pods_created_since_capacity_fetch = 3
+            executor.queued_tasks[mock.MagicMock()] = mock.MagicMock()
+            assert executor.capacity_hint() == 4
+            assert executor.kube_scheduler.fetch_free_pod_slots.call_count == 1
+
+            mock_monotonic.return_value = 131
+            executor.kube_scheduler.fetch_free_pod_slots.side_effect = ApiException(status=403)
+            assert executor.capacity_hint() is None
+
     def test_running_pod_log_lines(self):
         # default behaviour
         kube_executor = KubernetesExecutor()
@@ -1138,6 +1359,37 @@ class TestKubernetesExecutor:
         )
         assert executor.running == expected_running_ti_keys
 
+    @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
+    @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
+    def test_adopt_completed_pods_from_pod_informer(self, mock_kube_client, mock_kube_dynamic_client):
+        """With the pod informer, the pods are taken from its cache instead of being listed from the API"""
+        executor = self.kubernetes_executor
+        executor.scheduler_job_id = "modified"
+        executor.kube_client = mock_kube_client
+        executor.kube_config.use_pod_informer = True
+        executor.kube_scheduler = mock.MagicMock()
+        annotations = {"dag_id": "dag", "run_id": "run_id", "task_id": "one", "try_number": "1"}
+        executor.kube_scheduler.list_cached_pods.return_value = [
+            k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="one", annotations=annotations, namespace="somens"))
+        ]
+
+        executor._adopt_completed_pods(mock_kube_client)
+        executor.kube_scheduler.list_cached_pods.assert_called_once_with(
+            "kubernetes_executor=True,airflow-worker!=modified,airflow_executor_done!=True",
+            "status.phase=Succeeded",
+        )
+        mock_kube_dynamic_client.assert_not_called()
+        mock_kube_client.patch_namespaced_pod.assert_called_once_with(
+            body={"metadata": {"labels": {"airflow-worker": "modified"}}}, name="one", namespace="somens"
+        )
+        assert executor.running == {annotations_to_key(annotations)}
+
+        # Pods that aren't cached are listed from the API
+        executor.kube_scheduler.list_cached_pods.return_value = None
+        mock_kube_dynamic_client.return_value.get.return_value.items = []
+        executor._adopt_completed_pods(mock_kube_client)
+        mock_kube_dynamic_client.return_value.get.assert_called_once()
+
     @mock.patch("airflow.providers.cncf.kubernetes.executors.kubernetes_executor.DynamicClient")
     @mock.patch("airflow.providers.cncf.kubernetes.kube_client.get_kube_client")
     def test_adopt_completed_pods_api_exception(self, mock_kube_client, mock_kube_dynamic_client):
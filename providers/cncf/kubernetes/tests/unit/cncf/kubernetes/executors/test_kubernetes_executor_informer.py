@@ -0,0 +1,418 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Empty
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from kubernetes import client
+from kubernetes.client import models as k8s
+
+from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_informer import (
+    PodInformer,
+    PodStore,
+    parse_selector,
+)
+from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_types import ADOPTED
+from airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils import AirflowKubernetesScheduler
+from airflow.providers.cncf.kubernetes.kube_config import KubeConfig
+from airflow.utils.state import TaskInstanceState
+
+from tests_common.test_utils.config import conf_vars
+
+NAMESPACE = "airflow"
+
+
+class FakeKubeApi:
+    """The pods part of a Kubernetes API server: lists, and watches streaming the changes of the pods."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.resource_version = 0
+        self.compacted_resource_version = 0
+        self.pods: dict[str, dict] = {}
+        self.events: list[tuple[int, dict]] = []
+        self.lists = 0
+        self.watched_resource_versions: list[int] = []
+        self.closed = False
+
+    def _change(self, event_type: str, pod: dict) -> None:
+        with self.condition:
+            self.resource_version += 1
+            pod = copy.deepcopy(pod)
+            pod["metadata"]["resourceVersion"] = str(self.resource_version)
+            if event_type == "DELETED":
+                del self.pods[pod["metadata"]["name"]]
+            else:
+                self.pods[pod["metadata"]["name"]] = pod
+            self.events.append((self.resource_version, {"type": event_type, "object": pod}))
+            self.condition.notify_all()
+
+    def add_pod(self, name: str, labels: dict[str, str], phase: str = "Pending", **annotations) -> None:
+        pod = {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": name, "namespace": NAMESPACE, "labels": labels, "annotations": annotations},
+            "status": {"phase": phase},
+        }
+        self._change("ADDED", pod)
+
+    def update_pod(self, name: str, labels: dict[str, str] | None = None, phase: str | None = None) -> None:
+        with self.condition:
+            pod = copy.deepcopy(self.pods[name])
+            if labels:
+                pod["metadata"]["labels"].update(labels)
+            if phase:
+                pod["status"]["phase"] = phase
+            self._change("MODIFIED", pod)
+
+    def delete_pod(self, name: str, *, graceful: bool = True) -> None:
+        with self.condition:
+            pod = copy.deepcopy(self.pods[name])
+            if graceful:
+                pod["metadata"]["deletionTimestamp"] = "2025-01-01T00:00:00Z"
+            self._change("DELETED", pod)
+
+    def bookmark(self) -> None:
+        with self.condition:
+            self.resource_version += 1
+            event = {
+                "type": "BOOKMARK",
+                "object": {"kind": "Pod", "metadata": {"resourceVersion": str(self.resource_version)}},
+            }
+            self.events.append((self.resource_version, event))
+            self.condition.notify_all()
+
+    def compact(self) -> None:
+        """Forget the past events, so that watches from before now end with 410 Gone."""
+        with self.condition:
+            self.compacted_resource_version = self.resource_version
+            self.events = []
+            self.condition.notify_all()
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def selected_pods(self, label_selector: str) -> list[dict]:
+        """Get the pods matching a selector of ``key`` and ``key=value`` requirements."""
+        pods = []
+        for pod in self.pods.values():
+            labels = pod["metadata"]["labels"]
+            requirements = [
+                requirement.partition("=") for requirement in label_selector.split(",") if requirement
+            ]
+            if all(key in labels and (not value or labels[key] == value) for key, _, value in requirements):
+                pods.append(copy.deepcopy(pod))
+        return pods
+
+
+class FakeKubeApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        api: FakeKubeApi = self.server.api  # type: ignore[attr-defined]
+        params = {key: values[0] for key, values in parse_qs(urlsplit(self.path).query).items()}
+        label_selector = params.get("labelSelector", "")
+        if params.get("watch", "").lower() != "true":
+            with api.condition:
+                api.lists += 1
+                body = json.dumps(
+                    {
+                        "apiVersion": "v1",
+                        "kind": "PodList",
+                        "metadata": {"resourceVersion": str(api.resource_version)},
+                        "items": api.selected_pods(label_selector),
+                    }
+                ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        cursor = int(params.get("resourceVersion") or 0)
+        api.watched_resource_versions.append(cursor)
+        deadline = time.monotonic() + float(params.get("timeoutSeconds", 5))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        while True:
+            with api.condition:
+                api.condition.wait_for(
+                    lambda: api.closed
+                    or api.compacted_resource_version > cursor
+                    or any(rv > cursor for rv, _ in api.events),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+                if api.compacted_resource_version > cursor:
+                    gone = {"kind": "Status", "code": 410, "reason": "Expired", "message": "too old"}
+                    events = [(cursor, {"type": "ERROR", "object": gone})]
+                else:
+                    events = [(rv, event) for rv, event in api.events if rv > cursor]
+            for rv, event in events:
+                self._write_chunk(json.dumps(event).encode() + b"\n")
+                cursor = rv
+            if api.closed or time.monotonic() >= deadline or any(e["type"] == "ERROR" for _, e in events):
+                break
+        self._write_chunk(b"")
+
+
+@pytest.fixture
+def fake_api():
+    api = FakeKubeApi()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeKubeApiHandler)
+    server.daemon_threads = True
+    server.api = api  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield api, f"http://127.0.0.1:{server.server_port}"
+    api.close()
+    server.shutdown()
+    server.server_close()
+
+
+def make_kube_client(host: str) -> client.CoreV1Api:
+    configuration = client.Configuration()
+    configuration.host = host
+    return client.CoreV1Api(client.ApiClient(configuration))
+
+
+def wait_until(predicate, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the condition")
+        time.sleep(0.01)
+
+
+def make_pod(name: str, labels: dict[str, str], phase: str = "Running") -> k8s.V1Pod:
+    return k8s.V1Pod(
+        metadata=k8s.V1ObjectMeta(name=name, namespace=NAMESPACE, labels=labels),
+        status=k8s.V1PodStatus(phase=phase),
+    )
+
+
+class TestParseSelector:
+    def test_parse_selector(self):
+        assert parse_selector("a=1,b==2,c!=3,d,!e") == [
+            ("a", "=", "1"),
+            ("b", "=", "2"),
+            ("c", "!=", "3"),
+            ("d", "exists", None),
+            ("e", "!exists", None),
+        ]
+        assert parse_selector(None) == []
+
+    def test_set_based_selector_not_supported(self):
+        with pytest.raises(ValueError, match="Set based"):
+            parse_selector("env in (prod,dev)")
+
+
+class TestPodStore:
+    def test_select(self):
+        store = PodStore(indexers={"airflow-worker": lambda pod: pod.metadata.labels.get("airflow-worker")})
+        store.upsert(make_pod("a", {"airflow-worker": "1", "kubernetes_executor": "True"}, "Succeeded"))
+        store.upsert(make_pod("b", {"airflow-worker": "1", "kubernetes_executor": "True"}))
+        store.upsert(make_pod("c", {"airflow-worker": "2", "kubernetes_executor": "True"}))
+        store.upsert(make_pod("d", {"airflow-worker": "2", "airflow_executor_done": "True"}))
+
+        def names(pods):
+            return sorted(pod.metadata.name for pod in pods)
+
+        assert names(store.select("airflow-worker=1")) == ["a", "b"]
+        assert names(store.select("airflow-worker=1", "status.phase!=Succeeded")) == ["b"]
+        assert names(store.select("airflow-worker!=1,airflow_executor_done!=True")) == ["c"]
+        assert names(store.select("kubernetes_executor=True", "status.phase=Running")) == ["b", "c"]
+        with pytest.raises(ValueError, match="Unsupported field selector"):
+            store.select("airflow-worker=1", "spec.nodeName=node")
+
+    def test_indexes_follow_updates(self):
+        store = PodStore(indexers={"airflow-worker": lambda pod: pod.metadata.labels.get("airflow-worker")})
+        old = make_pod("a", {"airflow-worker": "1"})
+        store.upsert(old)
+        new = make_pod("a", {"airflow-worker": "2"})
+
+        assert store.upsert(new) is old
+        assert store.by_index("airflow-worker", "1") == []
+        assert store.by_index("airflow-worker", "2") == [new]
+        assert store.replace([]) == [new]
+        assert store.by_index("airflow-worker", "2") == []
+
+
+class TestPodInformer:
+    def make_informer(self, host: str) -> tuple[PodInformer, list]:
+        informer = PodInformer(
+            make_kube_client(host),
+            NAMESPACE,
+            "airflow-worker",
+            request_kwargs={"timeout_seconds": 2},
+        )
+        events: list = []
+        informer.add_handler(lambda event, old: events.append((event["type"], event["object"], old)))
+        return informer, events
+
+    def test_list_then_watch(self, fake_api):
+        api, host = fake_api
+        api.add_pod("a", {"airflow-worker": "1"})
+        api.add_pod("other", {"app": "web"})
+        informer, events = self.make_informer(host)
+        informer.start()
+        try:
+            assert informer.wait_for_sync(10)
+            assert [(t, pod.metadata.name, old) for t, pod, old in events] == [("ADDED", "a", None)]
+
+            api.add_pod("b", {"airflow-worker": "1"})
+            api.update_pod("a", phase="Running")
+            api.bookmark()
+            api.delete_pod("b")
+            wait_until(lambda: len(events) == 4)
+        finally:
+            informer.stop()
+            informer.join(timeout=10)
+
+        assert [(t, pod.metadata.name) for t, pod, _ in events[1:]] == [
+            ("ADDED", "b"),
+            ("MODIFIED", "a"),
+            ("DELETED", "b"),
+        ]
+        # The MODIFIED event comes with the pod it replaced
+        assert events[2][2].status.phase == "Pending"
+        assert [pod.metadata.name for pod in informer.store.list()] == ["a"]
+        assert informer.store.get(NAMESPACE, "a").status.phase == "Running"
+        assert api.lists == 1
+        assert api.watched_resource_versions[0] == 2
+        assert informer.resource_version == str(api.resource_version)
+
+    def test_relist_when_resource_version_is_too_old(self, fake_api):
+        api, host = fake_api
+        api.add_pod("a", {"airflow-worker": "1"})
+        api.add_pod("b", {"airflow-worker": "1"})
+        informer, events = self.make_informer(host)
+        informer.start()
+        try:
+            assert informer.wait_for_sync(10)
+            wait_until(lambda: api.watched_resource_versions)
+            # The changes are missed by the watch, which gets 410 Gone
+            with api.condition:
+                api.delete_pod("a")
+                api.update_pod("b", phase="Running")
+                api.add_pod("c", {"airflow-worker": "1"})
+                api.compact()
+            wait_until(lambda: len(events) == 5)
+        finally:
+            informer.stop()
+            informer.join(timeout=10)
+
+        assert api.lists == 2
+        assert sorted((t, pod.metadata.name) for t, pod, _ in events[2:]) == [
+            ("ADDED", "c"),
+            ("DELETED", "a"),
+            ("MODIFIED", "b"),
+        ]
+        assert sorted(pod.metadata.name for pod in informer.store.list()) == ["b", "c"]
+
+    def test_handler_errors_do_not_stop_the_informer(self, fake_api):
+        api, host = fake_api
+        informer, events = self.make_informer(host)
+        informer.add_handler(mock.Mock(side_effect=RuntimeError))
+        informer.start()
+        try:
+            assert informer.wait_for_sync(10)
+            api.add_pod("a", {"airflow-worker": "1"})
+            api.add_pod("b", {"airflow-worker": "1"})
+            wait_until(lambda: len(events) == 2)
+            assert informer.is_alive()
+        finally:
+            informer.stop()
+            informer.join(timeout=10)
+        assert not informer.is_alive()
+
+
+class TestAirflowKubernetesSchedulerPodInformer:
+    @pytest.fixture
+    def kube_scheduler(self, fake_api):
+        _, host = fake_api
+        with conf_vars(
+            {
+                ("kubernetes_executor", "use_pod_informer"): "True",
+                ("kubernetes_executor", "namespace"): NAMESPACE,
+                ("kubernetes_executor", "kube_client_request_args"): '{"timeout_seconds": 2}',
+            }
+        ):
+            kube_config = KubeConfig()
+        with mock.patch(
+            "airflow.providers.cncf.kubernetes.executors.kubernetes_executor_utils.get_kube_client",
+            side_effect=lambda: make_kube_client(host),
+        ):
+            kube_scheduler = AirflowKubernetesScheduler(
+                kube_config=kube_config,
+                result_queue=mock.MagicMock(),
+                kube_client=make_kube_client(host),
+                scheduler_job_id="1",
+            )
+        yield kube_scheduler
+        kube_scheduler.terminate()
+
+    @staticmethod
+    def get_watcher_task(kube_scheduler: AirflowKubernetesScheduler):
+        try:
+            return kube_scheduler.watcher_queue.get(timeout=10)
+        finally:
+            kube_scheduler.watcher_queue.task_done()
+
+    def test_pod_events_reach_the_watcher_queue(self, fake_api, kube_scheduler):
+        api, _ = fake_api
+        annotations = {"dag_id": "dag", "task_id": "task", "run_id": "run", "try_number": "1"}
+
+        assert kube_scheduler.kube_watchers == {}
+        assert kube_scheduler.list_cached_pods("airflow-worker=1") == []
+        api.add_pod("mine", {"airflow-worker": "1"}, **annotations)
+        api.add_pod("theirs", {"airflow-worker": "2"}, **annotations)
+        api.update_pod("theirs", phase="Failed")
+        api.update_pod("mine", phase="Failed")
+        assert self.get_watcher_task(kube_scheduler)[:3] == ("mine", NAMESPACE, TaskInstanceState.FAILED)
+
+        # Marking the pod done takes it out of the watcher's selector, as an adoption would
+        api.update_pod("mine", labels={"airflow_executor_done": "True"})
+        assert self.get_watcher_task(kube_scheduler)[:3] == ("mine", NAMESPACE, ADOPTED)
+        with pytest.raises(Empty):
+            kube_scheduler.watcher_queue.get(timeout=0.5)
+
+        wait_until(lambda: len(kube_scheduler.list_cached_pods("airflow-worker")) == 2)
+        assert [pod.metadata.name for pod in kube_scheduler.list_cached_pods("airflow-worker=2")] == [
+            "theirs"
+        ]
+        assert kube_scheduler.list_cached_pods("airflow-worker=1,airflow_executor_done!=True") == []
+        assert api.lists == 1
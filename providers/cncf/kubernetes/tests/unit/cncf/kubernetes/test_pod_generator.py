@@ -34,9 +34,11 @@ from airflow.providers.cncf.kubernetes.pod_generator import (
     datetime_to_label_safe_datestring,
     extend_object_field,
     merge_objects,
+    workload_to_command_args,
 )
 from airflow.providers.cncf.kubernetes.secret import Secret
 
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.version_compat import AIRFLOW_V_3_0_PLUS
 
 now = pendulum.now("UTC")
@@ -211,6 +213,38 @@ class TestPodGenerator:
             expected,
         ]
 
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Task SDK workloads are only used on Airflow 3")
+    @pytest.mark.parametrize(
+        ("encoding", "flag"), [("json", "--json-string"), ("msgpack", "--workload-string")]
+    )
+    def test_workload_to_command_args(self, encoding, flag):
+        workload_codec = pytest.importorskip("airflow.executors.workload_codec")
+        from airflow.executors import workloads
+
+        workload = workloads.ExecuteTask(
+            token="token",
+            ti=workloads.TaskInstance(
+                id="4d828a62-a417-4936-a7a6-2b3fabacecab",
+                dag_version_id="4d828a62-a417-4936-a7a6-2b3fabacecac",
+                task_id="task",
+                dag_id="dag",
+                run_id="run",
+                try_number=1,
+                pool_slots=1,
+                queue="default",
+                priority_weight=1,
+            ),
+            dag_rel_path="dag.py",
+            bundle_info=workloads.BundleInfo(name="dags-folder"),
+            log_path="task.log",
+        )
+
+        with conf_vars({("core", "workload_encoding"): encoding}):
+            args = workload_to_command_args(workload)
+
+        assert args[:4] == ["python", "-m", "airflow.sdk.execution_time.execute_workload", flag]
+        assert workload_codec.workload_from_str(args[4]) == workload
+
     def test_from_obj_pod_override_object(self):
         obj = {
             "pod_override": k8s.V1Pod(
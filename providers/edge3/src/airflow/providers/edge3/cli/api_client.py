@@ -34,7 +34,9 @@ from airflow.providers.edge3.models.edge_worker import EdgeWorkerVersionExceptio
 from airflow.providers.edge3.version_compat import AIRFLOW_V_3_0_PLUS
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobsFetched,
     PushLogsBody,
+    WorkerJobsFetchBody,
     WorkerQueuesBody,
     WorkerRegistrationReturn,
     WorkerSetStateReturn,
@@ -172,6 +174,20 @@ def jobs_fetch(hostname: str, queues: list[str] | None, free_concurrency: int) -
     return None
 
 
+def jobs_fetch_many(
+    hostname: str, queues: list[str] | None, free_concurrency: int, max_jobs: int, wait_seconds: float
+) -> list[EdgeJobFetched]:
+    """Fetch jobs to execute on the edge worker, waiting for jobs to be queued if there are none."""
+    result = _make_generic_request(
+        "POST",
+        f"jobs/fetch_many/{quote(hostname)}",
+        WorkerJobsFetchBody(
+            queues=queues, free_concurrency=free_concurrency, max_jobs=max_jobs, wait_seconds=wait_seconds
+        ).model_dump_json(exclude_unset=True),
+    )
+    return EdgeJobsFetched(**result).jobs
+
+
 def jobs_set_state(key: TaskInstanceKey, state: TaskInstanceState) -> None:
     """Set the state of a job."""
     _make_generic_request(
@@ -37,6 +37,7 @@ from airflow.configuration import conf
 from airflow.providers.edge3 import __version__ as edge_provider_version
 from airflow.providers.edge3.cli.api_client import (
     jobs_fetch,
+    jobs_fetch_many,
     jobs_set_state,
     logs_logfile_path,
     logs_push,
@@ -106,6 +107,8 @@ class EdgeWorker:
         self.concurrency = concurrency
         self.free_concurrency = concurrency
         self.daemon = daemon
+        # Whether the API server can hand out several jobs at once and wait for them to be queued
+        self.fetch_many_supported = True
 
         EdgeWorker.edge_instance = self
 
@@ -293,9 +296,12 @@ class EdgeWorker:
     def loop(self):
         """Run a loop of scheduling and monitoring tasks."""
         new_job = False
+        waited_for_jobs = False
         previous_jobs = EdgeWorker.jobs
         if not any((EdgeWorker.drain, EdgeWorker.maintenance_mode)) and self.free_concurrency > 0:
             new_job = self.fetch_job()
+            # Fetching the jobs waited for them already, unless the API server only hands out one at once
+            waited_for_jobs = self.fetch_many_supported
         self.check_running_jobs()
 
         if (
@@ -307,17 +313,18 @@ class EdgeWorker:
             self.worker_state_changed = self.heartbeat()
             self.last_hb = datetime.now()
 
-        if not new_job:
+        if not new_job and not waited_for_jobs:
             self.interruptible_sleep()
 
     def fetch_job(self) -> bool:
-        """Fetch and start a new job from central site."""
-        logger.debug("Attempting to fetch a new job...")
-        edge_job = jobs_fetch(self.hostname, self.queues, self.free_concurrency)
-        if edge_job:
+        """Fetch and start new jobs from central site, waiting up to the job poll interval for them."""
+        logger.debug("Attempting to fetch new jobs...")
+        edge_jobs = self._fetch_jobs()
+        for edge_job in edge_jobs:
             logger.info("Received job: %s", edge_job)
             self._launch_job(edge_job)
             jobs_set_state(edge_job.key, TaskInstanceState.RUNNING)
+        if edge_jobs:
             return True
 
         logger.info(
@@ -326,6 +333,24 @@ class EdgeWorker:
         )
         return False
 
+    def _fetch_jobs(self) -> list[EdgeJobFetched]:
+        if self.fetch_many_supported:
+            try:
+                return jobs_fetch_many(
+                    self.hostname,
+                    self.queues,
+                    self.free_concurrency,
+                    max_jobs=self.free_concurrency,
+                    wait_seconds=self.job_poll_interval,
+                )
+            except HTTPError as e:
+                if e.response is None or e.response.status_code != HTTPStatus.NOT_FOUND:
+                    raise
+                logger.info("API server can only hand out one job at once, fetching jobs one by one.")
+                self.fetch_many_supported = False
+        edge_job = jobs_fetch(self.hostname, self.queues, self.free_concurrency)
+        return [edge_job] if edge_job else []
+
     def check_running_jobs(self) -> None:
         """Check which of the running tasks/jobs are completed and report back."""
         used_concurrency = 0
@@ -117,6 +117,26 @@ class WorkerQueuesBody(WorkerQueuesBase):
     free_concurrency: Annotated[int, Field(description="Number of free concurrency slots on the worker.")]
 
 
+class WorkerJobsFetchBody(WorkerQueuesBody):
+    """Queues and capacity from which a worker fetches jobs, and how long it waits for them."""
+
+    max_jobs: Annotated[int, Field(ge=1, description="Maximum number of jobs to fetch.")] = 1
+    wait_seconds: Annotated[
+        float,
+        Field(
+            ge=0,
+            description="Number of seconds to wait for jobs to be queued if there are none, capped by the "
+            "API server.",
+        ),
+    ] = 0
+
+
+class EdgeJobsFetched(BaseModel):
+    """Jobs that are to be executed on the edge worker."""
+
+    jobs: Annotated[list[EdgeJobFetched], Field(description="The jobs, empty if none is queued.")]
+
+
 class WorkerStateBody(WorkerQueuesBase):
     """Details of the worker state sent to the scheduler."""
 
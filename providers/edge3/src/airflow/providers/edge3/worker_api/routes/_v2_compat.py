@@ -23,6 +23,7 @@ from airflow.providers.edge3.version_compat import AIRFLOW_V_3_0_PLUS
 if AIRFLOW_V_3_0_PLUS:
     # Just re-import the types from FastAPI and Airflow Core
     from fastapi import Body, Depends, Header, HTTPException, Path, Request, status
+    from fastapi.concurrency import run_in_threadpool
 
     from airflow.api_fastapi.common.db.common import SessionDep
     from airflow.api_fastapi.common.router import AirflowRouter
@@ -61,6 +62,9 @@ else:
     class SessionDep:  # type: ignore[no-redef]
         pass
 
+    async def run_in_threadpool(func: Callable, *args, **kwargs):  # type: ignore[no-redef]
+        return func(*args, **kwargs)
+
     def create_openapi_http_exception_doc(responses_status_code: list[int]) -> dict:
         return {}
 
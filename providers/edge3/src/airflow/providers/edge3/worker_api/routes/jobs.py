@@ -17,15 +17,19 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+import asyncio
+import time
+from typing import TYPE_CHECKING, Annotated
 
-from sqlalchemy import select, update
+from sqlalchemy import select, tuple_, update
 
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
 from airflow.providers.edge3.worker_api.auth import jwt_token_authorization_rest
 from airflow.providers.edge3.worker_api.datamodels import (
     EdgeJobFetched,
+    EdgeJobsFetched,
     WorkerApiDocs,
+    WorkerJobsFetchBody,
     WorkerQueuesBody,
 )
 from airflow.providers.edge3.worker_api.routes._v2_compat import (
@@ -35,15 +39,41 @@ from airflow.providers.edge3.worker_api.routes._v2_compat import (
     SessionDep,
     create_openapi_http_exception_doc,
     parse_command,
+    run_in_threadpool,
     status,
 )
 from airflow.stats import Stats
 from airflow.utils import timezone
+from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import with_row_locks
 from airflow.utils.state import TaskInstanceState
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 jobs_router = AirflowRouter(tags=["Jobs"], prefix="/jobs")
 
+# Longest the API server waits for jobs to be queued before answering a worker fetching jobs, in seconds
+MAX_FETCH_WAIT_SECONDS = 60.0
+# How often queued jobs are looked for while a worker waits for them, in seconds
+FETCH_WAIT_CHECK_INTERVAL = 1.0
+
+
+def _job_fetched(job: EdgeJobModel) -> EdgeJobFetched:
+    # Edge worker does not backport emitted Airflow metrics, so export some metrics
+    tags = {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue}
+    Stats.incr(f"edge_worker.ti.start.{job.queue}.{job.dag_id}.{job.task_id}", tags=tags)
+    Stats.incr("edge_worker.ti.start", tags=tags)
+    return EdgeJobFetched(
+        dag_id=job.dag_id,
+        task_id=job.task_id,
+        run_id=job.run_id,
+        map_index=job.map_index,
+        try_number=job.try_number,
+        command=parse_command(job.command),
+        concurrency_slots=job.concurrency_slots,
+    )
+
 
 @jobs_router.post(
     "/fetch/{worker_name}",
@@ -86,19 +116,85 @@ def fetch(
     job.edge_worker = worker_name
     job.last_update = timezone.utcnow()
     session.commit()
-    # Edge worker does not backport emitted Airflow metrics, so export some metrics
-    tags = {"dag_id": job.dag_id, "task_id": job.task_id, "queue": job.queue}
-    Stats.incr(f"edge_worker.ti.start.{job.queue}.{job.dag_id}.{job.task_id}", tags=tags)
-    Stats.incr("edge_worker.ti.start", tags=tags)
-    return EdgeJobFetched(
-        dag_id=job.dag_id,
-        task_id=job.task_id,
-        run_id=job.run_id,
-        map_index=job.map_index,
-        try_number=job.try_number,
-        command=parse_command(job.command),
-        concurrency_slots=job.concurrency_slots,
+    return _job_fetched(job)
+
+
+@provide_session
+def _claim_jobs(
+    worker_name: str, body: WorkerJobsFetchBody, session: Session = NEW_SESSION
+) -> list[EdgeJobFetched]:
+    """Claim the oldest queued jobs for the worker, as many as its free concurrency can run."""
+    query = (
+        select(EdgeJobModel)
+        .where(
+            EdgeJobModel.state == TaskInstanceState.QUEUED,
+            EdgeJobModel.concurrency_slots <= body.free_concurrency,
+        )
+        .order_by(EdgeJobModel.queued_dttm)
+    )
+    if body.queues:
+        query = query.where(EdgeJobModel.queue.in_(body.queues))
+    query = query.limit(body.max_jobs)
+    query = with_row_locks(query, of=EdgeJobModel, session=session, skip_locked=True)
+    jobs = []
+    free_concurrency = body.free_concurrency
+    for job in session.scalars(query):
+        if job.concurrency_slots <= free_concurrency:
+            jobs.append(job)
+            free_concurrency -= job.concurrency_slots
+    if not jobs:
+        return []
+    session.execute(
+        update(EdgeJobModel)
+        .where(
+            tuple_(
+                EdgeJobModel.dag_id,
+                EdgeJobModel.task_id,
+                EdgeJobModel.run_id,
+                EdgeJobModel.map_index,
+                EdgeJobModel.try_number,
+            ).in_([(job.dag_id, job.task_id, job.run_id, job.map_index, job.try_number) for job in jobs])
+        )
+        .values(state=TaskInstanceState.RUNNING, edge_worker=worker_name, last_update=timezone.utcnow())
+        .execution_options(synchronize_session=False)
     )
+    session.commit()
+    return [_job_fetched(job) for job in jobs]
+
+
+@jobs_router.post(
+    "/fetch_many/{worker_name}",
+    dependencies=[Depends(jwt_token_authorization_rest)],
+    responses=create_openapi_http_exception_doc(
+        [
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_403_FORBIDDEN,
+        ]
+    ),
+)
+async def fetch_many(
+    worker_name: str,
+    body: Annotated[
+        WorkerJobsFetchBody,
+        Body(
+            title="Fetch parameters",
+            description="The queues and capacity from which the worker can fetch jobs, and how long to wait.",
+        ),
+    ],
+) -> EdgeJobsFetched:
+    """
+    Fetch jobs to execute on the edge worker, waiting for jobs to be queued if there are none.
+
+    Jobs are claimed oldest first, as many as ``max_jobs`` and the free concurrency of the worker allow. The
+    request is answered as soon as there are jobs, or after ``wait_seconds`` with none.
+    """
+    deadline = time.monotonic() + min(body.wait_seconds, MAX_FETCH_WAIT_SECONDS)
+    while True:
+        jobs = await run_in_threadpool(_claim_jobs, worker_name, body)
+        remaining = deadline - time.monotonic()
+        if jobs or remaining <= 0:
+            return EdgeJobsFetched(jobs=jobs)
+        await asyncio.sleep(min(FETCH_WAIT_CHECK_INTERVAL, remaining))
 
 
 @jobs_router.patch(
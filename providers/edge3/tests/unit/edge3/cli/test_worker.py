@@ -211,24 +211,26 @@ class TestEdgeWorker:
     @pytest.mark.parametrize(
         "reserve_result, fetch_result, expected_calls",
         [
-            pytest.param(None, False, (0, 0), id="no_job"),
+            pytest.param([], False, (0, 0), id="no_job"),
             pytest.param(
-                EdgeJobFetched(
-                    dag_id="test",
-                    task_id="test",
-                    run_id="test",
-                    map_index=-1,
-                    try_number=1,
-                    concurrency_slots=1,
-                    command=MOCK_COMMAND,  # type: ignore[arg-type]
-                ),
+                [
+                    EdgeJobFetched(
+                        dag_id="test",
+                        task_id="test",
+                        run_id="test",
+                        map_index=-1,
+                        try_number=1,
+                        concurrency_slots=1,
+                        command=MOCK_COMMAND,  # type: ignore[arg-type]
+                    )
+                ],
                 True,
                 (1, 1),
                 id="new_job",
             ),
         ],
     )
-    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_many")
     @patch("airflow.providers.edge3.cli.worker.logs_logfile_path")
     @patch("airflow.providers.edge3.cli.worker.jobs_set_state")
     @patch("subprocess.Popen")
@@ -257,6 +259,55 @@ class TestEdgeWorker:
             assert mock_logfile_path.call_count == logfile_path_call_count
         assert mock_set_state.call_count == set_state_call_count
 
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch")
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_many")
+    def test_fetch_job_many_at_once(self, mock_fetch_many, mock_fetch, worker_with_job: EdgeWorker):
+        worker_with_job.free_concurrency = 3
+        mock_fetch_many.return_value = []
+
+        assert not worker_with_job.fetch_job()
+
+        mock_fetch_many.assert_called_once_with("mock", None, 3, max_jobs=3, wait_seconds=5)
+        mock_fetch.assert_not_called()
+
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch", return_value=None)
+    @patch("airflow.providers.edge3.cli.worker.jobs_fetch_many")
+    def test_fetch_job_one_by_one_from_older_api_server(
+        self, mock_fetch_many, mock_fetch, worker_with_job: EdgeWorker
+    ):
+        response = Response()
+        response.status_code = 404
+        mock_fetch_many.side_effect = HTTPError(response=response)
+
+        assert not worker_with_job.fetch_job()
+        assert not worker_with_job.fetch_job()
+
+        mock_fetch_many.assert_called_once()
+        assert mock_fetch.call_count == 2
+        assert not worker_with_job.fetch_many_supported
+
+    @pytest.mark.parametrize("fetch_many_supported, expected_sleeps", [(True, 0), (False, 1)])
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.interruptible_sleep")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.check_running_jobs")
+    @patch("airflow.providers.edge3.cli.worker.EdgeWorker.fetch_job", return_value=False)
+    def test_loop_does_not_sleep_after_waiting_for_jobs(
+        self,
+        mock_fetch_job,
+        mock_check_running_jobs,
+        mock_sleep,
+        fetch_many_supported,
+        expected_sleeps,
+        worker_with_job: EdgeWorker,
+    ):
+        worker_with_job.fetch_many_supported = fetch_many_supported
+        worker_with_job.last_hb = datetime.now()
+        worker_with_job.worker_state_changed = False
+
+        worker_with_job.loop()
+
+        mock_fetch_job.assert_called_once()
+        assert mock_sleep.call_count == expected_sleeps
+
     def test_check_running_jobs_running(self, worker_with_job: EdgeWorker):
         assert worker_with_job.free_concurrency == worker_with_job.concurrency
         with conf_vars({("edge", "api_url"): "https://invalid-api-test-endpoint"}):
@@ -16,16 +16,23 @@
 # under the License.
 from __future__ import annotations
 
+import asyncio
+import json
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import select
 
 from airflow.providers.edge3.models.edge_job import EdgeJobModel
-from airflow.providers.edge3.worker_api.routes.jobs import state
+from airflow.providers.edge3.worker_api.datamodels import EdgeJobFetched, WorkerJobsFetchBody
+from airflow.providers.edge3.worker_api.routes.jobs import fetch_many, state
+from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import TaskInstanceState
 
+from tests_common.test_utils.version_compat import AIRFLOW_V_3_0_PLUS
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -36,6 +43,26 @@ DAG_ID = "my_dag"
 TASK_ID = "my_task"
 RUN_ID = "manual__2024-11-24T21:03:01+01:00"
 QUEUE = "test"
+MOCK_COMMAND = json.dumps(
+    {
+        "token": "mock",
+        "ti": {
+            "id": "4d828a62-a417-4936-a7a6-2b3fabacecab",
+            "task_id": TASK_ID,
+            "dag_id": DAG_ID,
+            "run_id": RUN_ID,
+            "try_number": 1,
+            "dag_version_id": "01234567-89ab-cdef-0123-456789abcdef",
+            "pool_slots": 1,
+            "queue": QUEUE,
+            "priority_weight": 1,
+            "map_index": -1,
+        },
+        "dag_rel_path": "mock.py",
+        "log_path": "mock.log",
+        "bundle_info": {"name": "hello", "version": "abc"},
+    }
+)
 
 
 class TestJobsApiRoutes:
@@ -94,3 +121,74 @@ class TestJobsApiRoutes:
             mock_stats_incr.call_count == 2
 
             assert session.query(EdgeJobModel).scalar().state == TaskInstanceState.SUCCESS
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Only served by the API server of Airflow 3")
+    @patch("airflow.stats.Stats.incr")
+    def test_fetch_many(self, mock_stats_incr, session: Session):
+        for i, (queue, concurrency_slots) in enumerate([(QUEUE, 1), ("other", 1), (QUEUE, 2), (QUEUE, 1)]):
+            session.add(
+                EdgeJobModel(
+                    dag_id=DAG_ID,
+                    task_id=f"{TASK_ID}_{i}",
+                    run_id=RUN_ID,
+                    try_number=1,
+                    map_index=-1,
+                    state=TaskInstanceState.QUEUED,
+                    queue=queue,
+                    concurrency_slots=concurrency_slots,
+                    command=MOCK_COMMAND,
+                    queued_dttm=timezone.datetime(2024, 11, 24, 21, i),
+                )
+            )
+        session.commit()
+
+        fetched = asyncio.run(
+            fetch_many(
+                "worker",
+                WorkerJobsFetchBody(queues=[QUEUE], free_concurrency=3, max_jobs=10, wait_seconds=0),
+            )
+        )
+
+        # The oldest jobs of the queue, as many as the 3 free slots can run
+        assert [job.task_id for job in fetched.jobs] == [f"{TASK_ID}_0", f"{TASK_ID}_2"]
+        session.expire_all()
+        jobs = {job.task_id: job for job in session.scalars(select(EdgeJobModel))}
+        assert {task_id: (job.state, job.edge_worker) for task_id, job in jobs.items()} == {
+            f"{TASK_ID}_0": (TaskInstanceState.RUNNING, "worker"),
+            f"{TASK_ID}_1": (TaskInstanceState.QUEUED, None),
+            f"{TASK_ID}_2": (TaskInstanceState.RUNNING, "worker"),
+            f"{TASK_ID}_3": (TaskInstanceState.QUEUED, None),
+        }
+        assert mock_stats_incr.call_count == 4
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Only served by the API server of Airflow 3")
+    @patch("airflow.providers.edge3.worker_api.routes.jobs.FETCH_WAIT_CHECK_INTERVAL", 0.01)
+    @patch("airflow.providers.edge3.worker_api.routes.jobs._claim_jobs")
+    def test_fetch_many_waits_for_jobs(self, mock_claim_jobs):
+        job = EdgeJobFetched(
+            dag_id=DAG_ID,
+            task_id=TASK_ID,
+            run_id=RUN_ID,
+            map_index=-1,
+            try_number=1,
+            command=json.loads(MOCK_COMMAND),
+            concurrency_slots=1,
+        )
+        mock_claim_jobs.side_effect = [[], [], [job]]
+        body = WorkerJobsFetchBody(queues=None, free_concurrency=1, wait_seconds=10)
+
+        fetched = asyncio.run(fetch_many("worker", body))
+
+        assert fetched.jobs == [job]
+        assert mock_claim_jobs.call_count == 3
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Only served by the API server of Airflow 3")
+    @patch("airflow.providers.edge3.worker_api.routes.jobs.FETCH_WAIT_CHECK_INTERVAL", 0.01)
+    @patch("airflow.providers.edge3.worker_api.routes.jobs._claim_jobs", return_value=[])
+    def test_fetch_many_gives_up_waiting(self, mock_claim_jobs):
+        body = WorkerJobsFetchBody(queues=None, free_concurrency=1, wait_seconds=0.05)
+
+        fetched = asyncio.run(fetch_many("worker", body))
+
+        assert fetched.jobs == []
+        assert mock_claim_jobs.call_count > 1
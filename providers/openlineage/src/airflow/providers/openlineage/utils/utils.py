@@ -832,8 +832,13 @@ class OpenLineageRedactor(SecretsMasker):
     @classmethod
     def from_masker(cls, other: SecretsMasker) -> OpenLineageRedactor:
         instance = cls()
-        instance.patterns = other.patterns
-        instance.replacer = other.replacer
+        if hasattr(other, "_matcher"):
+            # Share the secrets matcher, reading ``replacer`` would compile a regex of every secret
+            instance._patterns = other.patterns
+            instance._matcher = other._matcher
+        else:
+            instance.patterns = other.patterns
+            instance.replacer = other.replacer
         return instance
 
     def _redact(self, item: Redactable, name: str | None, depth: int, max_depth: int, **kwargs) -> Redacted:  # type: ignore[override]
@@ -241,6 +241,17 @@ def test_is_name_redactable():
     assert _is_name_redactable("transparent", Mixined())
 
 
+@pytest.mark.enable_redact
+def test_redactor_from_masker_shares_secrets_without_compiling_regex():
+    masker = _secrets_masker()
+    masker.add_mask("a-secret-value")
+    redactor = OpenLineageRedactor.from_masker(masker)
+
+    assert redactor.redact("it is a-secret-value") == "it is ***"
+    assert masker._replacer is None
+    assert redactor._replacer is None
+
+
 @pytest.mark.enable_redact
 def test_redact_with_exclusions(monkeypatch):
     redactor = OpenLineageRedactor.from_masker(_secrets_masker())
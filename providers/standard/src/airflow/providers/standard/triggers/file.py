@@ -46,6 +46,9 @@ class FileTrigger(BaseTrigger):
     :param poke_interval: Time that the job should wait in between each try
     """
 
+    # Tasks waiting for the same file can share one trigger in the triggerer
+    shareable = True
+
     def __init__(
         self,
         filepath: str,
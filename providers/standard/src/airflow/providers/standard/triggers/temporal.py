@@ -84,10 +84,21 @@ class DateTimeTrigger(BaseTrigger):
             await asyncio.sleep(1)
         if self.end_from_trigger:
             self.log.info("Sensor time condition reached; marking task successful and exiting")
-            yield TaskSuccessEvent()
         else:
             self.log.info("yielding event with payload %r", self.moment)
-            yield TriggerEvent(self.moment)
+        yield self._event()
+
+    def timer(self) -> tuple[datetime.datetime, TriggerEvent] | None:
+        """Fire from the timer service of the triggerer, rather than sleeping in ``run``."""
+        if type(self).run is not DateTimeTrigger.run:
+            # A subclass waiting on more than the clock, its ``run`` must be run
+            return None
+        return self.moment, self._event()
+
+    def _event(self) -> TriggerEvent:
+        if self.end_from_trigger:
+            return TaskSuccessEvent()
+        return TriggerEvent(self.moment)
 
 
 class TimeDeltaTrigger(DateTimeTrigger):
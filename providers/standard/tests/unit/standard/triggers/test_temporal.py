@@ -74,6 +74,26 @@ def test_timedelta_trigger_serialization():
     assert -2 < (kwargs["moment"] - expected_moment).total_seconds() < 2
 
 
+@pytest.mark.parametrize("end_from_trigger", [True, False])
+def test_datetime_trigger_timer(end_from_trigger):
+    moment = pendulum.datetime(2025, 1, 1, tz="UTC")
+    trigger = DateTimeTrigger(moment, end_from_trigger=end_from_trigger)
+
+    timer_moment, event = trigger.timer()
+
+    assert timer_moment == moment
+    assert event.payload == (TaskInstanceState.SUCCESS if end_from_trigger else moment)
+
+
+def test_datetime_trigger_subclass_overriding_run_has_no_timer():
+    class CustomTrigger(DateTimeTrigger):
+        async def run(self):
+            yield TriggerEvent("custom")
+
+    assert CustomTrigger(pendulum.datetime(2025, 1, 1, tz="UTC")).timer() is None
+    assert TimeDeltaTrigger(datetime.timedelta(seconds=10)).timer() is not None
+
+
 @pytest.mark.parametrize(
     "tz, end_from_trigger",
     [
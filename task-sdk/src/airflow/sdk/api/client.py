@@ -62,6 +62,8 @@ from airflow.sdk.api.datamodels._generated import (
     ValidationError as RemoteValidationError,
     VariablePostBody,
     VariableResponse,
+    XComBulkRequest,
+    XComBulkResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -563,6 +565,22 @@ class XComOperations:
         resp = self.client.get(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}/slice", params=params)
         return XComSequenceSliceResponse.model_validate_json(resp.read())
 
+    def get_bulk(
+        self,
+        dag_id: str,
+        run_id: str,
+        key: str,
+        task_ids: list[str],
+        map_indexes: list[int] | None = None,
+        include_prior_dates: bool = False,
+    ) -> XComBulkResponse:
+        """Get the XCom values of several tasks and map indexes in a single request to the API server."""
+        body = XComBulkRequest(
+            key=key, task_ids=task_ids, map_indexes=map_indexes, include_prior_dates=include_prior_dates
+        )
+        resp = self.client.post(f"xcoms/{dag_id}/{run_id}/bulk", content=body.model_dump_json())
+        return XComBulkResponse.model_validate_json(resp.read())
+
 
 class AssetOperations:
     __slots__ = ("client",)
@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2025-09-23"
+API_VERSION: Final[str] = "2025-10-10"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -391,6 +391,38 @@ class VariableResponse(BaseModel):
     value: Annotated[str | None, Field(title="Value")] = None
 
 
+class XComBulkItem(BaseModel):
+    """
+    A single XCom value returned by a bulk request.
+    """
+
+    task_id: Annotated[str, Field(title="Task Id")]
+    map_index: Annotated[int, Field(title="Map Index")]
+    value: JsonValue
+
+
+class XComBulkRequest(BaseModel):
+    """
+    Schema for fetching the XCom values of several tasks and map indexes in one request.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    key: Annotated[str, Field(title="Key")]
+    task_ids: Annotated[list[str], Field(title="Task Ids")]
+    map_indexes: Annotated[list[int] | None, Field(title="Map Indexes")] = None
+    include_prior_dates: Annotated[bool | None, Field(title="Include Prior Dates")] = False
+
+
+class XComBulkResponse(BaseModel):
+    """
+    XCom values found for a bulk request, ordered by requested task and then by map index.
+    """
+
+    xcoms: Annotated[list[XComBulkItem], Field(title="Xcoms")]
+
+
 class XComResponse(BaseModel):
     """
     XCom schema for responses with fields that are needed for Runtime.
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import collections
+from collections.abc import Iterable
 from typing import Any, Protocol
 
 import structlog
@@ -25,8 +26,10 @@ import structlog
 from airflow.sdk.execution_time.comms import (
     DeleteXCom,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceSlice,
     SetXCom,
+    XComBulkResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -36,6 +39,9 @@ _XComValueWrapper = collections.namedtuple("_XComValueWrapper", "value")
 
 log = structlog.get_logger(logger_name="task")
 
+# Maximum number of map indexes requested per bulk XCom fetch, to keep requests and DB queries bounded.
+XCOM_BULK_FETCH_BATCH_SIZE = 1000
+
 
 class TIKeyProtocol(Protocol):
     dag_id: str
@@ -322,6 +328,79 @@ class BaseXCom:
 
         return [cls.deserialize_value(_XComValueWrapper(value)) for value in msg.root]
 
+    @classmethod
+    def get_many(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        task_ids: Iterable[str],
+        run_id: str,
+        map_indexes: Iterable[int] | None = None,
+        include_prior_dates: bool = False,
+    ) -> list[tuple[str, int, Any]]:
+        """
+        Retrieve XCom values of several tasks and map indexes with as few requests as possible.
+
+        This method returns "full" XCom values (i.e. uses ``deserialize_value``
+        from the XCom backend).
+
+        :param key: A key for the XCom. Only XComs with this key will be returned.
+        :param dag_id: DAG ID to pull XComs from.
+        :param task_ids: Task IDs to pull XComs from.
+        :param run_id: DAG run ID for the tasks.
+        :param map_indexes: Only XComs from matching map indexes are pulled, and
+            at most one (the latest) value per task and map index is returned.
+            Pass *None* (default) to pull the values of all map indexes.
+        :param include_prior_dates: If *False* (default), only XComs from the
+            specified DAG run are returned. If *True*, XComs from previous runs
+            are returned as well.
+        :return: ``(task_id, map_index, value)`` tuples of the XComs found, ordered
+            by task (in the order requested) and then by map index. Missing
+            entries are not included.
+        """
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        task_ids = list(task_ids)
+        if map_indexes is None:
+            batches: list[list[int] | None] = [None]
+        else:
+            indexes = list(dict.fromkeys(map_indexes))
+            batches = [
+                indexes[i : i + XCOM_BULK_FETCH_BATCH_SIZE]
+                for i in range(0, len(indexes), XCOM_BULK_FETCH_BATCH_SIZE)
+            ]
+
+        results: list[tuple[str, int, Any]] = []
+        for batch in batches:
+            msg = SUPERVISOR_COMMS.send(
+                GetXComBulk(
+                    key=key,
+                    dag_id=dag_id,
+                    run_id=run_id,
+                    task_ids=task_ids,
+                    map_indexes=batch,
+                    include_prior_dates=include_prior_dates,
+                ),
+            )
+
+            if not isinstance(msg, XComBulkResult):
+                raise TypeError(f"Expected XComBulkResult, received: {type(msg)} {msg}")
+
+            results.extend(
+                (
+                    xcom.task_id,
+                    xcom.map_index,
+                    None if xcom.value is None else cls.deserialize_value(_XComValueWrapper(xcom.value)),
+                )
+                for xcom in msg.xcoms
+            )
+
+        if len(batches) > 1:
+            task_order = {task_id: i for i, task_id in enumerate(task_ids)}
+            results.sort(key=lambda result: (task_order[result[0]], result[1]))
+        return results
+
     @staticmethod
     def serialize_value(
         value: Any,
@@ -18,30 +18,148 @@
 from __future__ import annotations
 
 import datetime
-import multiprocessing
+import hashlib
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
 
-from airflow.configuration import conf
-from airflow.sdk import timezone
+import structlog
+
+from airflow.configuration import AIRFLOW_HOME, conf
+from airflow.stats import Stats
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+def _default_cache_path() -> str:
+    # Prefer a memory backed filesystem, so that cached secrets never hit the disk. Deployments with
+    # different AIRFLOW_HOMEs run by the same user must not share their secrets.
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    home = hashlib.sha256(os.path.realpath(AIRFLOW_HOME).encode()).hexdigest()[:16]
+    return os.path.join(base, f"airflow-secrets-cache-{os.geteuid()}", f"secrets_cache-{home}.db")
+
+
+class _SharedCacheStore:
+    """
+    Secret cache entries kept in a sqlite database, shared by every process on the host using the same file.
+
+    The database runs in WAL mode, so readers neither block each other nor the (rare) writers, and a read
+    is a single indexed lookup, without any proxy process in between. Each process opens its own
+    connection, lazily, as sqlite connections must not be used across a fork.
+
+    The file must be owned by, and only accessible to, the current user. With ``private_dir`` the same goes
+    for its directory, as it lives in a world writable one such as ``/dev/shm``. When more than
+    ``max_entries`` are stored, the oldest ones are evicted.
+
+    Errors are logged and otherwise treated as a cache miss: the cache must never be the reason a
+    Variable or Connection cannot be retrieved.
+    """
+
+    _TABLE = "secret_cache_v1"
+
+    def __init__(self, path: str, max_entries: int, private_dir: bool = False):
+        self.path = path
+        self.max_entries = max_entries
+        self.private_dir = private_dir
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if self.private_dir:
+            # Someone else could have created it first, to read or replace the cache
+            self._check_private(directory, os.lstat(directory), 0o700)
+        # Create the file with restrictive permissions before sqlite does, the -wal and -shm files
+        # sqlite creates next to it inherit them.
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            self._check_private(self.path, os.fstat(fd), 0o600)
+        finally:
+            os.close(fd)
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._TABLE} "
+            "(key TEXT PRIMARY KEY, value TEXT, stored_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {self._TABLE}_stored_at ON {self._TABLE} (stored_at)")
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    @staticmethod
+    def _check_private(path: str, st: os.stat_result, mode: int) -> None:
+        # A symbolic link, whose permissions are always 0o777, doesn't pass either
+        if st.st_uid != os.geteuid() or stat.S_IMODE(st.st_mode) & ~mode:
+            raise PermissionError(f"{path} must be owned by the current user and only accessible to them")
+
+    def get(self, key: str) -> tuple[str | None, float] | None:
+        """Return the value stored for the key and when it was stored, or None if it is not present."""
+        try:
+            with self._lock:
+                return (
+                    self._connect()
+                    .execute(f"SELECT value, stored_at FROM {self._TABLE} WHERE key = ?", (key,))
+                    .fetchone()
+                )
+        except (OSError, sqlite3.Error):
+            log.warning("Unable to read from the secrets cache", path=self.path, exc_info=True)
+            return None
+
+    def set(self, key: str, value: str | None) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {self._TABLE} (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                conn.execute(
+                    f"DELETE FROM {self._TABLE} WHERE key IN "
+                    f"(SELECT key FROM {self._TABLE} ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except (OSError, sqlite3.Error):
+            log.warning("Unable to write to the secrets cache", path=self.path, exc_info=True)
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._connect().execute(f"DELETE FROM {self._TABLE} WHERE key = ?", (key,))
+        except (OSError, sqlite3.Error):
+            log.warning("Unable to write to the secrets cache", path=self.path, exc_info=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = self._pid = None
 
 
 class SecretCache:
-    """A static class to manage the global secret cache."""
+    """
+    A static class to manage the global secret cache.
+
+    The cache is shared by all the processes on the host configured with the same ``[secrets] cache_path``
+    that initialized it. Only the DAG processor does, so that the Variables read by top level code are
+    cached across the files it parses.
+    """
 
-    __manager: multiprocessing.managers.SyncManager | None = None
-    _cache: dict[str, _CacheValue] | None = None
+    _cache: _SharedCacheStore | None = None
     _ttl: datetime.timedelta
+    _negative_ttl: datetime.timedelta
 
     class NotPresentException(Exception):
         """Raised when a key is not present in the cache."""
 
-    class _CacheValue:
-        def __init__(self, value: str | None) -> None:
-            self.value = value
-            self.date = timezone.utcnow()
-
-        def is_expired(self, ttl: datetime.timedelta) -> bool:
-            return timezone.utcnow() - self.date > ttl
-
     _VARIABLE_PREFIX = "__v_"
     _CONNECTION_PREFIX = "__c_"
 
@@ -57,17 +175,23 @@ class SecretCache:
         use_cache = conf.getboolean(section="secrets", key="use_cache", fallback=False)
         if not use_cache:
             return
-        if cls.__manager is None:
-            # it is not really necessary to save the manager, but doing so allows to reuse it between tests,
-            # making them run a lot faster because this operation takes ~300ms each time
-            cls.__manager = multiprocessing.Manager()
-        cls._cache = cls.__manager.dict()
+        path = conf.get(section="secrets", key="cache_path", fallback=None)
+        max_entries = conf.getint(section="secrets", key="cache_max_entries", fallback=10_000)
+        cls._cache = _SharedCacheStore(path or _default_cache_path(), max_entries, private_dir=not path)
         ttl_seconds = conf.getint(section="secrets", key="cache_ttl_seconds", fallback=15 * 60)
         cls._ttl = datetime.timedelta(seconds=ttl_seconds)
+        negative_ttl_seconds = conf.getint(section="secrets", key="negative_cache_ttl_seconds", fallback=60)
+        cls._negative_ttl = datetime.timedelta(seconds=min(negative_ttl_seconds, ttl_seconds))
 
     @classmethod
     def reset(cls):
-        """Use for test purposes only."""
+        """
+        Use for test purposes only.
+
+        Only closes this process' connection, the entries stay in the cache shared with other processes.
+        """
+        if cls._cache is not None:
+            cls._cache.close()
         cls._cache = None
 
     @classmethod
@@ -99,9 +223,16 @@ class SecretCache:
             # using an exception for misses allow to meaningfully cache None values
             raise cls.NotPresentException
 
-        val = cls._cache.get(f"{prefix}{key}")
-        if val and not val.is_expired(cls._ttl):
-            return val.value
+        kind = "variable" if prefix == cls._VARIABLE_PREFIX else "connection"
+        entry = cls._cache.get(f"{prefix}{key}")
+        if entry is not None:
+            value, stored_at = entry
+            # None values are cached to remember that the key doesn't exist, for a shorter time
+            ttl = cls._ttl if value is not None else cls._negative_ttl
+            if time.time() - stored_at < ttl.total_seconds():
+                Stats.incr("secrets.cache.hit", tags={"kind": kind})
+                return value
+        Stats.incr("secrets.cache.miss", tags={"kind": kind})
         raise cls.NotPresentException
 
     @classmethod
@@ -120,11 +251,10 @@ class SecretCache:
     @classmethod
     def _save(cls, key: str, value: str | None, prefix: str):
         if cls._cache is not None:
-            cls._cache[f"{prefix}{key}"] = cls._CacheValue(value)
+            cls._cache.set(f"{prefix}{key}", value)
 
     @classmethod
     def invalidate_variable(cls, key: str):
         """Invalidate (actually removes) the value stored in the cache for that Variable."""
         if cls._cache is not None:
-            # second arg ensures no exception if key is absent
-            cls._cache.pop(f"{cls._VARIABLE_PREFIX}{key}", None)
+            cls._cache.delete(f"{cls._VARIABLE_PREFIX}{key}")
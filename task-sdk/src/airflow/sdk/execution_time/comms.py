@@ -49,6 +49,7 @@ Execution API server is because:
 from __future__ import annotations
 
 import itertools
+import threading
 from collections.abc import Iterator
 from datetime import datetime
 from functools import cached_property
@@ -87,6 +88,7 @@ from airflow.sdk.api.datamodels._generated import (
     TriggerDAGRunPayload,
     UpdateHITLDetailPayload,
     VariableResponse,
+    XComBulkResponse,
     XComResponse,
     XComSequenceIndexResponse,
     XComSequenceSliceResponse,
@@ -184,27 +186,33 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
 
     err_decoder: TypeAdapter[ErrorResponse] = attrs.field(factory=lambda: TypeAdapter(ToTask), repr=False)
 
+    # Requests may be sent from helper threads (e.g. XCom read-ahead), so a request and its response
+    # must not interleave with another one on the socket.
+    _send_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False)
+
     def send(self, msg: SendMsgType) -> ReceiveMsgType | None:
         """Send a request to the parent and block until the response is received."""
-        frame = _RequestFrame(id=next(self.id_counter), body=msg.model_dump())
-        frame_bytes = frame.as_bytes()
-
-        self.socket.sendall(frame_bytes)
-        if isinstance(msg, ResendLoggingFD):
-            if recv_fds is None:
-                return None
-            # We need special handling here! The server can't send us the fd number, as the number on the
-            # supervisor will be different to in this process, so we have to mutate the message ourselves here.
-            frame, fds = self._read_frame(maxfds=1)
-            resp = self._from_frame(frame)
-            if TYPE_CHECKING:
-                assert isinstance(resp, SentFDs)
-            resp.fds = fds
-            # Since we know this is an expliclt SendFDs, and since this class is generic SendFDs might not
-            # always be in the return type union
-            return resp  # type: ignore[return-value]
-
-        return self._get_response()
+        body = msg.model_dump()
+
+        with self._send_lock:
+            frame = _RequestFrame(id=next(self.id_counter), body=body)
+            self.socket.sendall(frame.as_bytes())
+            if isinstance(msg, ResendLoggingFD):
+                if recv_fds is None:
+                    return None
+                # We need special handling here! The server can't send us the fd number, as the number on the
+                # supervisor will be different to in this process, so we have to mutate the message ourselves
+                # here.
+                frame, fds = self._read_frame(maxfds=1)
+                resp = self._from_frame(frame)
+                if TYPE_CHECKING:
+                    assert isinstance(resp, SentFDs)
+                resp.fds = fds
+                # Since we know this is an expliclt SendFDs, and since this class is generic SendFDs might not
+                # always be in the return type union
+                return resp  # type: ignore[return-value]
+
+            return self._get_response()
 
     @overload
     def _read_frame(self, maxfds: None = None) -> _ResponseFrame: ...
@@ -423,6 +431,16 @@ class XComResult(XComResponse):
         return cls(**xcom_response.model_dump(exclude_defaults=True), type="XComResult")
 
 
+class XComBulkResult(XComBulkResponse):
+    """Response to GetXComBulk request."""
+
+    type: Literal["XComBulkResult"] = "XComBulkResult"
+
+    @classmethod
+    def from_response(cls, response: XComBulkResponse) -> XComBulkResult:
+        return cls(xcoms=response.xcoms, type="XComBulkResult")
+
+
 class XComCountResponse(BaseModel):
     len: int
     type: Literal["XComLengthResponse"] = "XComLengthResponse"
@@ -595,6 +613,7 @@ ToTask = Annotated[
     | TICount
     | TaskStatesResult
     | VariableResult
+    | XComBulkResult
     | XComCountResponse
     | XComResult
     | XComSequenceIndexResult
@@ -680,6 +699,18 @@ class GetXCom(BaseModel):
     type: Literal["GetXCom"] = "GetXCom"
 
 
+class GetXComBulk(BaseModel):
+    """Get the XCom values of several tasks and map indexes in one request."""
+
+    key: str
+    dag_id: str
+    run_id: str
+    task_ids: list[str]
+    map_indexes: list[int] | None = None
+    include_prior_dates: bool = False
+    type: Literal["GetXComBulk"] = "GetXComBulk"
+
+
 class GetXComCount(BaseModel):
     """Get the number of (mapped) XCom values available."""
 
@@ -903,6 +934,7 @@ ToSupervisor = Annotated[
     | GetTaskStates
     | GetVariable
     | GetXCom
+    | GetXComBulk
     | GetXComCount
     | GetXComSequenceItem
     | GetXComSequenceSlice
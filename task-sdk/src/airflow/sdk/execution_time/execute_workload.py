@@ -94,6 +94,11 @@ def main():
         help="The JSON string itself containing the execution workload payload.",
         type=str,
     )
+    group.add_argument(
+        "--workload-string",
+        help="The execution workload payload, in either of the encodings of ``[core] workload_encoding``.",
+        type=str,
+    )
 
     args = parser.parse_args()
 
@@ -118,6 +123,15 @@ def main():
             log.error("Failed to parse input JSON string", error=str(e))
             sys.exit(1)
 
+    elif args.workload_string:
+        from airflow.executors.workload_codec import workload_from_str
+
+        try:
+            workload = workload_from_str(args.workload_string)
+        except Exception as e:
+            log.error("Failed to decode input workload string", error=str(e))
+            sys.exit(1)
+
     execute_workload(workload)
 
 
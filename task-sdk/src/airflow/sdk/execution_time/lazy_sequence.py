@@ -20,6 +20,7 @@ from __future__ import annotations
 import collections
 import itertools
 from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import attrs
@@ -38,27 +39,105 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 
 log = structlog.get_logger(logger_name=__name__)
 
+# Size of the first window fetched by an iterator. Windows double on each fetch, up to
+# ``[workers] xcom_sequence_window_size``, so short sequences don't over-fetch.
+_MIN_WINDOW_SIZE = 16
+
+_prefetch_executor: ThreadPoolExecutor | None = None
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        _prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xcom-prefetch")
+    return _prefetch_executor
+
+
+def _max_window_size() -> int:
+    from airflow.configuration import conf
+
+    return max(conf.getint("workers", "xcom_sequence_window_size", fallback=1024), 1)
+
+
+def _prefetch_enabled() -> bool:
+    from airflow.configuration import conf
+
+    return conf.getboolean("workers", "xcom_sequence_prefetch", fallback=False)
+
 
 @attrs.define
 class LazyXComIterator(Iterator[T]):
+    """
+    Iterate over a :class:`LazyXComSequence`, fetching values in windows.
+
+    Rather than requesting each item separately, values are fetched with slice
+    requests whose size grows up to ``[workers] xcom_sequence_window_size``. If
+    ``[workers] xcom_sequence_prefetch`` is enabled, the next window is fetched
+    in a background thread while the current one is consumed.
+    """
+
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
 
+    _buffer: collections.deque[T] = attrs.field(init=False, factory=collections.deque)
+    _fetch_index: int = attrs.field(init=False)
+    """Index of the next value that has not been requested yet."""
+    _max_window_size: int = attrs.field(init=False, factory=_max_window_size)
+    _window_size: int = attrs.field(init=False)
+    _prefetch: bool = attrs.field(init=False, factory=_prefetch_enabled)
+    _pending: Future[list[T]] | None = attrs.field(init=False, default=None)
+    _exhausted: bool = attrs.field(init=False, default=False)
+
+    @_fetch_index.default
+    def _default_fetch_index(self) -> int:
+        return self.index
+
+    @_window_size.default
+    def _default_window_size(self) -> int:
+        return min(_MIN_WINDOW_SIZE, self._max_window_size)
+
     def __next__(self) -> T:
-        if self.index < 0:
-            # When iterating backwards, avoid extra HTTP request
-            raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
+        if not self._buffer:
+            self._fill_buffer()
+            if not self._buffer:
+                raise StopIteration()
         self.index += self.dir
-        return val
+        return self._buffer.popleft()
 
     def __iter__(self) -> Iterator[T]:
         return self
 
+    def _fill_buffer(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._buffer.extend(pending.result())
+        elif not self._exhausted:
+            self._buffer.extend(self._fetch_window())
+
+        if self._prefetch and not self._exhausted:
+            self._pending = _get_prefetch_executor().submit(self._fetch_window)
+
+    def _fetch_window(self) -> list[T]:
+        if (start := self._fetch_index) < 0:
+            # When iterating backwards, avoid extra HTTP request
+            self._exhausted = True
+            return []
+
+        if self.dir > 0:
+            size = self._window_size
+            values = self.seq[start : start + size]
+        else:
+            size = min(self._window_size, start + 1)
+            stop = start - size
+            values = self.seq[start : stop if stop >= 0 else None : -1]
+
+        self._fetch_index += self.dir * len(values)
+        if len(values) < size or self._fetch_index < 0:
+            self._exhausted = True
+        self._window_size = min(self._window_size * 2, self._max_window_size)
+        return list(values)
+
 
 @attrs.define
 class LazyXComSequence(Sequence[T]):
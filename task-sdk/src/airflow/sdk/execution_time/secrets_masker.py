@@ -25,6 +25,7 @@ import inspect
 import logging
 import re
 import sys
+import threading
 from collections.abc import Callable, Generator, Iterable, Iterator
 from enum import Enum
 from functools import cache, cached_property
@@ -188,20 +189,204 @@ def _is_v1_env_var(v: Any) -> TypeGuard[_V1EnvVarLike]:
     return isinstance(v, _get_v1_env_var_type())
 
 
+_ESCAPED_CHAR = re.compile(r"\\(.)", re.DOTALL)
+
+
+def _unescape(pattern: str) -> str:
+    """Reverse :func:`re.escape`, which only ever prefixes special characters with a backslash."""
+    return _ESCAPED_CHAR.sub(r"\1", pattern)
+
+
+def _trie_regex(strings: Iterable[str]) -> str:
+    """
+    Build a regex matching any of ``strings``, nested by common prefix.
+
+    ``re`` tries the branches of a flat alternation one after the other at every position, nesting them
+    lets it discard most positions after looking at a single character.
+    """
+    children: dict[str, set[str]] = collections.defaultdict(set)
+    optional = False
+    for string in strings:
+        if string:
+            children[string[0]].add(string[1:])
+        else:
+            optional = True
+    branches = [re.escape(char) + _trie_regex(rest) for char, rest in sorted(children.items())]
+    if not branches:
+        return ""
+    regex = branches[0] if len(branches) == 1 and not optional else f"(?:{'|'.join(branches)})"
+    return f"{regex}?" if optional else regex
+
+
+class _SecretMatcher:
+    """
+    Multi-pattern literal matcher backed by an Aho–Corasick automaton.
+
+    Secrets are inserted into the trie as they are added; the failure links are (re)computed lazily on the
+    next search, so adding many secrets in a row only pays for a single rebuild. Matches are replaced
+    leftmost-longest, which never masks less than the regex alternation it replaces.
+
+    Most log lines contain none of the secrets, so a search first looks for any of the (at most
+    ``PREFIX_LENGTH`` characters long) secret prefixes with a regex, which runs in C. The automaton is only
+    walked from a candidate position, and as soon as it falls back to the root the search skips ahead to the
+    next candidate again.
+
+    Secrets can be added from any thread while others are redacting: searches use an immutable snapshot of
+    the automaton, which is swapped in whole once rebuilt.
+    """
+
+    __slots__ = ("_goto", "_terminal", "_prefixes", "_automaton", "_dirty", "_lock")
+
+    PREFIX_LENGTH = 3
+
+    def __init__(self, secrets: Iterable[str] = ()):
+        self._goto: list[dict[str, int]] = [{}]
+        self._terminal: list[int] = [0]
+        self._prefixes: set[str] = set()
+        # goto, fail and output functions, and the candidate prefixes regex, as of the last build
+        self._automaton: tuple[list[dict[str, int]], list[int], list[tuple[int, ...]], Pattern] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        for secret in secrets:
+            self.add(secret)
+
+    def __len__(self) -> int:
+        return sum(1 for length in self._terminal if length)
+
+    def __bool__(self) -> bool:
+        return bool(self._prefixes)
+
+    def add(self, secret: str) -> None:
+        if not secret:
+            return
+        with self._lock:
+            goto, terminal = self._goto, self._terminal
+            state = 0
+            for char in secret:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    terminal.append(0)
+                state = nxt
+            if not terminal[state]:
+                terminal[state] = len(secret)
+                self._prefixes.add(secret[: self.PREFIX_LENGTH])
+                self._dirty = True
+
+    def _build(self) -> None:
+        # Copy the goto function, so that secrets added from now on don't leak into the snapshot
+        goto, terminal = [dict(transitions) for transitions in self._goto], self._terminal
+        fail = [0] * len(goto)
+        out: list[tuple[int, ...]] = [()] * len(goto)
+        queue = collections.deque(goto[0].values())
+        for state in queue:
+            out[state] = (terminal[state],) if terminal[state] else ()
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                f = goto[f].get(char, 0)
+                fail[nxt] = f
+                own = (terminal[nxt],) if terminal[nxt] else ()
+                out[nxt] = own + out[f]
+        self._automaton = (goto, fail, out, re.compile(_trie_regex(self._prefixes)))
+        self._dirty = False
+
+    def sub(self, replacement: str, text: str) -> str:
+        """Replace every secret in ``text`` with ``replacement``."""
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._build()
+        if (automaton := self._automaton) is None:
+            return text
+        goto, fail, out, candidates = automaton
+        search = candidates.search
+        candidate = search(text)
+        if candidate is None:
+            return text
+
+        spans: list[tuple[int, int]] = []
+        state = 0
+        pos = candidate.start()
+        end = len(text)
+        while pos < end:
+            char = text[pos]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            pos += 1
+            if state:
+                if out[state]:
+                    spans.extend([(pos - length, pos) for length in out[state]])
+            else:
+                candidate = search(text, pos)
+                if candidate is None:
+                    break
+                pos = candidate.start()
+        if not spans:
+            return text
+
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        parts = []
+        last = 0
+        for start, stop in spans:
+            if start < last:
+                continue
+            parts.append(text[last:start])
+            parts.append(replacement)
+            last = stop
+        parts.append(text[last:])
+        return "".join(parts)
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
-    patterns: set[str]
-
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
     MAX_RECURSION_DEPTH = 5
     _has_warned_short_secret = False
 
+    _patterns: set[str]
+    _replacer: Pattern | None = None
+    _matcher: _SecretMatcher
+
     def __init__(self):
         super().__init__()
         self.patterns = set()
 
+    @property
+    def patterns(self) -> set[str]:
+        """The escaped secrets being masked."""
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns: set[str]) -> None:
+        self._patterns = patterns
+        self._replacer = None
+        self._matcher = _SecretMatcher(map(_unescape, patterns))
+
+    @property
+    def replacer(self) -> Pattern | None:
+        """
+        A single regex alternation of all patterns.
+
+        Masking itself goes through the multi-pattern matcher, this is only compiled (once) for callers
+        that still use it directly.
+        """
+        if self._replacer is None and self._patterns:
+            self._replacer = re.compile("|".join(self._patterns))
+        return self._replacer
+
+    @replacer.setter
+    def replacer(self, replacer: Pattern | None) -> None:
+        self._replacer = replacer
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -265,7 +450,7 @@ class SecretsMasker(logging.Filter):
             # "private" flag that stops us needing to process it more than once
             return True
 
-        if self.replacer:
+        if self._matcher:
             for k, v in record.__dict__.items():
                 if k not in self._record_attrs_to_ignore:
                     record.__dict__[k] = self.redact(v)
@@ -337,11 +522,11 @@ class SecretsMasker(logging.Filter):
                     )
                 return tmp
             if isinstance(item, str):
-                if self.replacer:
+                if self._matcher:
                     # We can't replace specific values, but the key-based redacting
                     # can still happen, so we can't short-circuit, we need to walk
                     # the structure.
-                    return self.replacer.sub(replacement, str(item))
+                    return self._matcher.sub(replacement, str(item))
                 return item
             if isinstance(item, (tuple, set)):
                 # Turn set in to tuple!
@@ -556,7 +741,6 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -567,10 +751,9 @@ class SecretsMasker(logging.Filter):
 
                     pattern = re.escape(s)
                     if pattern not in self.patterns and (not name or should_hide_value_for_key(name)):
-                        self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        self._patterns.add(pattern)
+                        self._matcher.add(s)
+                        self._replacer = None
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
@@ -27,10 +27,12 @@ import os
 import selectors
 import signal
 import sys
+import threading
 import time
 import weakref
 from collections import deque
 from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -90,6 +92,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComCount,
     GetXComSequenceItem,
     GetXComSequenceSlice,
@@ -111,6 +114,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBulkResult,
     XComCountResponse,
     XComResult,
     XComSequenceIndexResult,
@@ -443,6 +447,7 @@ class WatchedSubprocess:
     selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, repr=False)
 
     _frame_encoder: msgspec.msgpack.Encoder = attrs.field(factory=comms._new_encoder, repr=False)
+    _send_lock: threading.Lock = attrs.field(factory=threading.Lock, init=False, repr=False)
 
     process_log: FilteringBoundLogger = attrs.field(repr=False)
 
@@ -588,7 +593,8 @@ class WatchedSubprocess:
             err_resp = error.model_dump() if error else None
             frame = _ResponseFrame(id=request_id, error=err_resp)
 
-        self.stdin.sendall(frame.as_bytes())
+        with self._send_lock:
+            self.stdin.sendall(frame.as_bytes())
 
     def handle_requests(self, log: FilteringBoundLogger) -> Generator[None, _RequestFrame, None]:
         """Handle incoming requests from the task process, respond with the appropriate data."""
@@ -601,30 +607,37 @@ class WatchedSubprocess:
                 log.exception("Unable to decode message", body=request.body)
                 continue
 
-            try:
-                self._handle_request(msg, log, request.id)
-            except ServerResponseError as e:
-                error_details = e.response.json() if e.response else None
-                log.error(
-                    "API server error",
-                    status_code=e.response.status_code,
-                    detail=error_details,
-                    message=str(e),
-                )
+            self._dispatch_request(msg, log, request.id)
 
-                # Send error response back to task so that the error appears in the task logs
-                self.send_msg(
-                    msg=None,
-                    error=ErrorResponse(
-                        error=ErrorType.API_SERVER_ERROR,
-                        detail={
-                            "status_code": e.response.status_code,
-                            "message": str(e),
-                            "detail": error_details,
-                        },
-                    ),
-                    request_id=request.id,
-                )
+    def _dispatch_request(self, msg, log: FilteringBoundLogger, req_id: int) -> None:
+        """Handle a request from the task process, subclasses may do so outside of the selector loop."""
+        self._handle_request_and_report_errors(msg, log, req_id)
+
+    def _handle_request_and_report_errors(self, msg, log: FilteringBoundLogger, req_id: int) -> None:
+        try:
+            self._handle_request(msg, log, req_id)
+        except ServerResponseError as e:
+            error_details = e.response.json() if e.response else None
+            log.error(
+                "API server error",
+                status_code=e.response.status_code,
+                detail=error_details,
+                message=str(e),
+            )
+
+            # Send error response back to task so that the error appears in the task logs
+            self.send_msg(
+                msg=None,
+                error=ErrorResponse(
+                    error=ErrorType.API_SERVER_ERROR,
+                    detail={
+                        "status_code": e.response.status_code,
+                        "message": str(e),
+                        "detail": error_details,
+                    },
+                ),
+                request_id=req_id,
+            )
 
     def _handle_request(self, msg, log: FilteringBoundLogger, req_id: int) -> None:
         raise NotImplementedError()
@@ -833,6 +846,12 @@ class ActivitySubprocess(WatchedSubprocess):
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
 
+    # Requests which need the API server are handled on a background thread, so that the selector loop
+    # keeps forwarding logs and heartbeating while they are in flight. See `_dispatch_request`.
+    _request_executor: ThreadPoolExecutor | None = attrs.field(default=None, init=False, repr=False)
+    _pending_requests: list[Future] = attrs.field(factory=list, init=False, repr=False)
+    _requests_done: tuple[socket, socket] | None = attrs.field(default=None, init=False, repr=False)
+
     decoder: ClassVar[TypeAdapter[ToSupervisor]] = TypeAdapter(ToSupervisor)
 
     ti: RuntimeTI | None = None
@@ -893,7 +912,9 @@ class ActivitySubprocess(WatchedSubprocess):
 
         try:
             self._monitor_subprocess()
+            self._reap_requests(wait=True)
         finally:
+            self._shutdown_request_executor()
             self.selector.close()
 
         # self._monitor_subprocess() will set the exit code when the process has finished
@@ -1063,6 +1084,69 @@ class ActivitySubprocess(WatchedSubprocess):
             return SERVER_TERMINATED
         return TaskInstanceState.FAILED
 
+    def _dispatch_request(self, msg: ToSupervisor, log: FilteringBoundLogger, req_id: int) -> None:
+        """
+        Handle the request on a background thread, unless it is answered without calling the API server.
+
+        The task process waits for the response to each request before sending the next one, so a single
+        thread is enough, and keeps the requests handled in the order they were sent. The response is sent
+        as soon as it is ready, tagged with the request id as always.
+
+        Requests moving the task to a terminal state are still handled inline: a heartbeat sent while the
+        server applies them would be rejected with a conflict, and kill the task as if the server had.
+        """
+        if isinstance(msg, (TaskState, ResendLoggingFD, SucceedTask, RetryTask, DeferTask, RescheduleTask)):
+            super()._dispatch_request(msg, log, req_id)
+            return
+
+        if self._request_executor is None:
+            self._request_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"supervisor-requests-{self.pid}"
+            )
+            # Wakes the selector loop up when a request is done, to surface any error from it promptly
+            self._requests_done = read, write = socketpair()
+            read.setblocking(False)
+            self.selector.register(read, selectors.EVENT_READ, (self._on_requests_done, lambda sock: None))
+
+        self._pending_requests.append(
+            self._request_executor.submit(self._handle_request_in_background, msg, log, req_id)
+        )
+
+    def _handle_request_in_background(self, msg: ToSupervisor, log: FilteringBoundLogger, req_id: int):
+        try:
+            self._handle_request_and_report_errors(msg, log, req_id)
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug("Task process went away before receiving the response", msg=msg)
+        finally:
+            if self._requests_done:
+                with suppress(OSError):
+                    self._requests_done[1].send(b"\0")
+
+    def _on_requests_done(self, sock: socket) -> bool:
+        with suppress(BlockingIOError):
+            while sock.recv(4096):
+                pass
+        self._reap_requests()
+        return True
+
+    def _reap_requests(self, wait: bool = False) -> None:
+        """Re-raise the error of any request that failed in the background, optionally waiting for all."""
+        pending, self._pending_requests = self._pending_requests, []
+        for future in pending:
+            if wait or future.done():
+                future.result()
+            else:
+                self._pending_requests.append(future)
+
+    def _shutdown_request_executor(self) -> None:
+        if self._request_executor is not None:
+            self._request_executor.shutdown(wait=True)
+            self._request_executor = None
+        if self._requests_done is not None:
+            for sock in self._requests_done:
+                sock.close()
+            self._requests_done = None
+
     def _handle_request(self, msg: ToSupervisor, log: FilteringBoundLogger, req_id: int):
         log.debug("Received message from task runner", msg=msg)
         resp: BaseModel | None = None
@@ -1119,6 +1203,16 @@ class ActivitySubprocess(WatchedSubprocess):
             )
             xcom_result = XComResult.from_xcom_response(xcom)
             resp = xcom_result
+        elif isinstance(msg, GetXComBulk):
+            xcoms = self.client.xcoms.get_bulk(
+                msg.dag_id,
+                msg.run_id,
+                msg.key,
+                msg.task_ids,
+                msg.map_indexes,
+                msg.include_prior_dates,
+            )
+            resp = XComBulkResult.from_response(xcoms)
         elif isinstance(msg, GetXComCount):
             xcom_count = self.client.xcoms.head(msg.dag_id, msg.run_id, msg.task_id, msg.key)
             resp = XComCountResponse(len=xcom_count)
@@ -1300,7 +1394,8 @@ class ActivitySubprocess(WatchedSubprocess):
         # such as the task process and it's launched subprocess.
 
         frame = _ResponseFrame(id=req_id, body=SentFDs(fds=[child_logs.fileno()]).model_dump())
-        send_fds(self.stdin, [frame.as_bytes()], [child_logs.fileno()])
+        with self._send_lock:
+            send_fds(self.stdin, [frame.as_bytes()], [child_logs.fileno()])
         child_logs.close()  # Close this end now.
 
 
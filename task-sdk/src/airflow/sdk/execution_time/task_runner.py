@@ -112,6 +112,7 @@ if TYPE_CHECKING:
     from structlog.typing import FilteringBoundLogger as Logger
 
     from airflow.exceptions import DagRunTriggerException, TaskDeferred
+    from airflow.models.dagbag import DagBag
     from airflow.sdk.definitions._internal.abstractoperator import AbstractOperator
     from airflow.sdk.definitions.context import Context
     from airflow.sdk.types import OutletEventAccessorsProtocol
@@ -149,6 +150,10 @@ class RuntimeTaskInstance(TaskInstance):
 
     log_url: str | None = None
 
+    _xcom_prefetch: dict[tuple[str, bool, str], list[Any] | None] | None = None
+    """XComs of all map indexes, keyed by ``(key, include_prior_dates, task_id)``, fetched in bulk
+    for the templates being rendered."""
+
     def __rich_repr__(self):
         yield "id", self.id
         yield "task_id", self.task_id
@@ -283,10 +288,95 @@ class RuntimeTaskInstance(TaskInstance):
         # unmapped BaseOperator created by this function! This is because the
         # MappedOperator is useless for template rendering, and we need to be
         # able to access the unmapped task instead.
-        self.task.render_template_fields(context, jinja_env)
+        self._xcom_prefetch = self._prefetch_template_xcoms(jinja_env)
+        try:
+            self.task.render_template_fields(context, jinja_env)
+        finally:
+            self._xcom_prefetch = None
         self.is_mapped = original_task.is_mapped
         return original_task
 
+    def _prefetch_template_xcoms(
+        self, jinja_env: jinja2.Environment | None
+    ) -> dict[tuple[str, bool, str], list[Any] | None] | None:
+        """
+        Fetch the XComs that the task's templates pull from several tasks in bulk.
+
+        Only ``ti.xcom_pull`` calls with literal arguments pulling all map indexes
+        of tasks in the current DAG run are considered. Any other call is left to
+        be resolved while rendering.
+        """
+        if not isinstance(self.task, BaseOperator):
+            return None
+        try:
+            if jinja_env is None:
+                jinja_env = self.task.get_template_env()
+            pulls: dict[tuple[str, bool], dict[str, None]] = {}
+            for key, task_ids, include_prior_dates in _find_template_xcom_pulls(self.task, jinja_env):
+                pulls.setdefault((key, include_prior_dates), {}).update(dict.fromkeys(task_ids))
+            # A single XCom is a single request either way, nothing to gain.
+            if sum(len(task_ids) for task_ids in pulls.values()) < 2:
+                return None
+
+            prefetched: dict[tuple[str, bool, str], list[Any] | None] = {}
+            for (key, include_prior_dates), task_ids in pulls.items():
+                values_by_task = self._pull_all_map_indexes(
+                    list(task_ids),
+                    dag_id=self.dag_id,
+                    run_id=self.run_id,
+                    key=key,
+                    include_prior_dates=include_prior_dates,
+                )
+                for task_id, values in values_by_task.items():
+                    prefetched[(key, include_prior_dates, task_id)] = values
+            return prefetched
+        except Exception:
+            log = structlog.get_logger(logger_name="task")
+            log.debug("Unable to prefetch XComs for templates", exc_info=True)
+            return None
+
+    def _pull_all_map_indexes(
+        self,
+        task_ids: list[str],
+        *,
+        dag_id: str,
+        run_id: str,
+        key: str,
+        include_prior_dates: bool,
+    ) -> dict[str, list[Any] | None]:
+        """Get the XCom values of all map indexes for each task, or *None* for tasks without any."""
+        values_by_task: dict[str, list[Any] | None] = {}
+        prefetched = self._xcom_prefetch if (dag_id, run_id) == (self.dag_id, self.run_id) else None
+
+        missing: list[str] = []
+        for t_id in dict.fromkeys(task_ids):
+            if prefetched is not None and (key, include_prior_dates, t_id) in prefetched:
+                values_by_task[t_id] = prefetched[(key, include_prior_dates, t_id)]
+            else:
+                missing.append(t_id)
+
+        if len(missing) == 1:
+            values_by_task[missing[0]] = XCom.get_all(
+                run_id=run_id,
+                key=key,
+                task_id=missing[0],
+                dag_id=dag_id,
+                include_prior_dates=include_prior_dates,
+            )
+        elif missing:
+            fetched: dict[str, list[Any]] = {}
+            for t_id, _, value in XCom.get_many(
+                key=key,
+                dag_id=dag_id,
+                task_ids=missing,
+                run_id=run_id,
+                include_prior_dates=include_prior_dates,
+            ):
+                fetched.setdefault(t_id, []).append(value)
+            for t_id in missing:
+                values_by_task[t_id] = fetched.get(t_id)
+        return values_by_task
+
     def xcom_pull(
         self,
         task_ids: str | Iterable[str] | None = None,
@@ -352,18 +442,20 @@ class RuntimeTaskInstance(TaskInstance):
         elif isinstance(task_ids, str):
             task_ids = [task_ids]
 
+        task_ids = list(task_ids)
+
         # If map_indexes is not specified, pull xcoms from all map indexes for each task
         if isinstance(map_indexes, ArgNotSet):
+            values_by_task = self._pull_all_map_indexes(
+                task_ids,
+                dag_id=dag_id,
+                run_id=run_id,
+                key=key,
+                include_prior_dates=include_prior_dates,
+            )
             xcoms: list[Any] = []
             for t_id in task_ids:
-                values = XCom.get_all(
-                    run_id=run_id,
-                    key=key,
-                    task_id=t_id,
-                    dag_id=dag_id,
-                    include_prior_dates=include_prior_dates,
-                )
-
+                values = values_by_task[t_id]
                 if values is None:
                     xcoms.append(None)
                 else:
@@ -384,8 +476,29 @@ class RuntimeTaskInstance(TaskInstance):
                 f"Invalid type for map_indexes: expected int, iterable of ints, or None, got {type(map_indexes)}"
             )
 
+        pairs = list(product(task_ids, map_indexes_iterable))
+        if len(pairs) > 1:
+            # Fetch everything in bulk rather than making a round trip per task and map index.
+            # A map index of None is stored as -1.
+            found = {
+                (t_id, m_idx): value
+                for t_id, m_idx, value in XCom.get_many(
+                    key=key,
+                    dag_id=dag_id,
+                    task_ids=task_ids,
+                    run_id=run_id,
+                    map_indexes=[-1 if m_idx is None else m_idx for _, m_idx in pairs],
+                    include_prior_dates=include_prior_dates,
+                )
+            }
+            xcoms = []
+            for t_id, m_idx in pairs:
+                value = found.get((t_id, -1 if m_idx is None else m_idx))
+                xcoms.append(default if value is None else value)
+            return xcoms
+
         xcoms = []
-        for t_id, m_idx in product(task_ids, map_indexes_iterable):
+        for t_id, m_idx in pairs:
             value = XCom.get_one(
                 run_id=run_id,
                 key=key,
@@ -553,6 +666,89 @@ class RuntimeTaskInstance(TaskInstance):
         return response.state
 
 
+def _find_template_xcom_pulls(
+    task: BaseOperator, jinja_env: jinja2.Environment
+) -> Iterator[tuple[str, list[str], bool]]:
+    """
+    Find the ``ti.xcom_pull`` calls in the task's templates that can be resolved before rendering.
+
+    Yields ``(key, task_ids, include_prior_dates)`` for every call whose arguments
+    are all literals and which pulls all map indexes of tasks in the current DAG run.
+    """
+    import jinja2
+    from jinja2 import nodes
+
+    def template_sources(value: Any, seen: set[int]) -> Iterator[str]:
+        if id(value) in seen:
+            return
+        seen.add(id(value))
+        if isinstance(value, str):
+            if "xcom_pull" in value:
+                yield value
+            elif value.endswith(tuple(task.template_ext)) and jinja_env.loader is not None:
+                with suppress(jinja2.TemplateNotFound):
+                    source = jinja_env.loader.get_source(jinja_env, value)[0]
+                    if "xcom_pull" in source:
+                        yield source
+        elif isinstance(value, (list, tuple, set)):
+            for element in value:
+                yield from template_sources(element, seen)
+        elif isinstance(value, dict):
+            for element in value.values():
+                yield from template_sources(element, seen)
+
+    def literal(node: nodes.Node) -> Any:
+        if isinstance(node, nodes.Const):
+            return node.value
+        if isinstance(node, (nodes.List, nodes.Tuple)):
+            return [literal(item) for item in node.items]
+        raise ValueError("Not a literal")
+
+    arg_names = ("task_ids", "dag_id", "key", "include_prior_dates")
+    seen: set[int] = set()
+    for field in task.template_fields:
+        for source in template_sources(getattr(task, field, None), seen):
+            try:
+                ast = jinja_env.parse(source)
+            except jinja2.TemplateSyntaxError:
+                continue
+            for call in ast.find_all(nodes.Call):
+                target = call.node
+                if not (
+                    isinstance(target, nodes.Getattr)
+                    and target.attr == "xcom_pull"
+                    and isinstance(target.node, nodes.Name)
+                    and target.node.name in ("ti", "task_instance")
+                ):
+                    continue
+                if (
+                    call.dyn_args is not None
+                    or call.dyn_kwargs is not None
+                    or len(call.args) > len(arg_names)
+                ):
+                    continue
+                try:
+                    kwargs = dict(zip(arg_names, (literal(arg) for arg in call.args)))
+                    kwargs.update((kw.key, literal(kw.value)) for kw in call.kwargs)
+                except ValueError:
+                    continue
+                if not kwargs.keys() <= {*arg_names, "default"} or kwargs.get("dag_id") is not None:
+                    continue
+                task_ids = kwargs.get("task_ids")
+                if isinstance(task_ids, str):
+                    task_ids = [task_ids]
+                key = kwargs.get("key", BaseXCom.XCOM_RETURN_KEY)
+                include_prior_dates = kwargs.get("include_prior_dates", False)
+                if (
+                    isinstance(task_ids, list)
+                    and all(isinstance(t_id, str) for t_id in task_ids)
+                    and isinstance(key, str)
+                    and key
+                    and isinstance(include_prior_dates, bool)
+                ):
+                    yield key, task_ids, include_prior_dates
+
+
 def _xcom_push(ti: RuntimeTaskInstance, key: str, value: Any, mapped_length: int | None = None) -> None:
     """Push a XCom through XCom.set, which pushes to XCom Backend if configured."""
     # Private function, as we don't want to expose the ability to manually set `mapped_length` to SDK
@@ -598,6 +794,12 @@ def get_log_url_from_ti(ti: RuntimeTaskInstance) -> str:
     return _log_uri
 
 
+# DagBags already parsed by a long-lived process that forks task processes (such as a warm LocalExecutor
+# worker), keyed by bundle name, bundle version and the DAG file path within the bundle. A task process forked
+# from it finds the DagBag for its DAG file here instead of importing the file again.
+PREPARSED_DAG_BAGS: dict[tuple[str, str | None, str], DagBag] = {}
+
+
 def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     # TODO: Task-SDK:
     # Using DagBag here is about 98% wrong, but it'll do for now
@@ -616,13 +818,15 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
     if (bundle_root := os.fspath(bundle_instance.path)) not in sys.path:
         sys.path.append(bundle_root)
 
-    dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
-    bag = DagBag(
-        dag_folder=dag_absolute_path,
-        include_examples=False,
-        safe_mode=False,
-        load_op_links=False,
-    )
+    bag = PREPARSED_DAG_BAGS.get((bundle_info.name, bundle_info.version, os.fspath(what.dag_rel_path)))
+    if bag is None:
+        dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
+        bag = DagBag(
+            dag_folder=dag_absolute_path,
+            include_examples=False,
+            safe_mode=False,
+            load_op_links=False,
+        )
     if TYPE_CHECKING:
         assert what.ti.dag_id
 
@@ -39,6 +39,8 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunStateResponse,
     HITLDetailResponse,
     VariableResponse,
+    XComBulkItem,
+    XComBulkResponse,
     XComResponse,
 )
 from airflow.sdk.exceptions import ErrorType
@@ -847,6 +849,42 @@ class TestXCOMOperations:
         )
         assert result == OKResponse(ok=True)
 
+    def test_xcom_get_bulk(self):
+        # Simulate a successful response from the server when fetching many xcoms at once
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/xcoms/dag_id/run_id/bulk" and request.method == "POST":
+                assert json.loads(request.read()) == {
+                    "key": "key",
+                    "task_ids": ["task_a", "task_b"],
+                    "map_indexes": [0, 1],
+                    "include_prior_dates": False,
+                }
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "xcoms": [
+                            {"task_id": "task_a", "map_index": 0, "value": "value_a"},
+                            {"task_id": "task_b", "map_index": 1, "value": "value_b"},
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.xcoms.get_bulk(
+            dag_id="dag_id",
+            run_id="run_id",
+            key="key",
+            task_ids=["task_a", "task_b"],
+            map_indexes=[0, 1],
+        )
+        assert result == XComBulkResponse(
+            xcoms=[
+                XComBulkItem(task_id="task_a", map_index=0, value="value_a"),
+                XComBulkItem(task_id="task_b", map_index=1, value="value_b"),
+            ]
+        )
+
 
 class TestConnectionOperations:
     """
@@ -33,6 +33,7 @@ from airflow.models import Connection
 from airflow.sdk.execution_time.secrets_masker import (
     RedactedIO,
     SecretsMasker,
+    _SecretMatcher,
     mask_secret,
     merge,
     redact,
@@ -706,6 +707,61 @@ class TestEdgeCases:
         assert " and " in redacted
 
 
+class TestSecretMatcher:
+    @pytest.mark.parametrize(
+        ("secrets", "text", "expected"),
+        [
+            pytest.param(["secret"], "no candidates here", "no candidates here", id="no-match"),
+            pytest.param(["secret"], "secre secrets", "secre ***s", id="partial-prefix"),
+            pytest.param(["secret"], "secretsecret", "******", id="adjacent"),
+            pytest.param(["secret", "secret_token"], "a secret_token", "a ***", id="longest-wins"),
+            pytest.param(["abcd", "cdef"], "abcdef", "***ef", id="leftmost-wins"),
+            pytest.param(["bcd", "abcde"], "abcdx", "a***x", id="follows-failure-link"),
+            pytest.param(["abcd", "bc"], "abcx", "a***x", id="output-from-failure-link"),
+            pytest.param(["x", "xyz"], "axyzx", "a******", id="one-char"),
+            pytest.param(["p@ss(word)+"], "it is p@ss(word)+!", "it is ***!", id="regex-chars"),
+            pytest.param(["pässwörd"], "pässwörd€", "***€", id="unicode"),
+        ],
+    )
+    def test_sub(self, secrets, text, expected):
+        assert _SecretMatcher(secrets).sub("***", text) == expected
+
+    def test_add_after_sub(self):
+        matcher = _SecretMatcher(["abcdef"])
+        assert matcher.sub("***", "abcdef cde") == "*** cde"
+
+        matcher.add("cde")
+        assert matcher.sub("***", "abcdef cde xabcdex") == "*** *** xab***x"
+        assert len(matcher) == 2
+
+    def test_empty(self):
+        matcher = _SecretMatcher([""])
+
+        assert not matcher
+        assert matcher.sub("***", "anything") == "anything"
+
+    def test_patterns_assignment_rebuilds_matcher(self):
+        # Done by the OpenLineage redactor to copy another masker
+        source = SecretsMasker()
+        source.add_mask("copied.secret")
+
+        masker = SecretsMasker()
+        masker.patterns = source.patterns
+        masker.replacer = source.replacer
+
+        assert masker.redact("a copied.secret") == "a ***"
+        assert masker.redact("a copiedXsecret") == "a copiedXsecret"
+
+    def test_replacer_compiled_lazily(self):
+        masker = SecretsMasker()
+        assert masker.replacer is None
+
+        masker.add_mask("lazy_secret")
+        masker.add_mask("other_secret")
+
+        assert masker.replacer.sub("***", "lazy_secret other_secret") == "*** ***"
+
+
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
         secrets_masker = SecretsMasker()
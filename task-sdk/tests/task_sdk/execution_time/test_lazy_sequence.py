@@ -17,7 +17,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
@@ -33,7 +33,7 @@ from airflow.sdk.execution_time.comms import (
     XComSequenceIndexResult,
     XComSequenceSliceResult,
 )
-from airflow.sdk.execution_time.lazy_sequence import LazyXComSequence
+from airflow.sdk.execution_time.lazy_sequence import LazyXComIterator, LazyXComSequence
 from airflow.sdk.execution_time.xcom import resolve_xcom_backend
 
 from tests_common.test_utils.config import conf_vars
@@ -77,34 +77,70 @@ def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
     mock_supervisor_comms.send.side_effect = [
-        XComSequenceIndexResult(root="f"),
-        ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
+        XComSequenceSliceResult(root=["f"]),
     ]
     assert list(it) == ["f"]
-    mock_supervisor_comms.send.assert_has_calls(
-        [
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=0,
-                ),
-            ),
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=1,
-                ),
-            ),
-        ]
+    mock_supervisor_comms.send.assert_called_once_with(
+        GetXComSequenceSlice(
+            key=BaseXCom.XCOM_RETURN_KEY,
+            dag_id="dag",
+            task_id="task",
+            run_id="run",
+            start=0,
+            stop=16,
+            step=None,
+        ),
     )
 
 
+@conf_vars({("workers", "xcom_sequence_window_size"): "40"})
+def test_iter_grows_window(mock_supervisor_comms, lazy_sequence):
+    values = list(range(100))
+
+    def slice_values(msg):
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop : msg.step])
+
+    mock_supervisor_comms.send.side_effect = slice_values
+    assert list(iter(lazy_sequence)) == values
+    assert [(c.args[0].start, c.args[0].stop) for c in mock_supervisor_comms.send.call_args_list] == [
+        (0, 16),
+        (16, 48),
+        (48, 88),
+        (88, 128),
+    ]
+
+
+def test_iter_backwards(mock_supervisor_comms, lazy_sequence):
+    values = list(range(20))
+
+    def slice_values(msg):
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop : msg.step])
+
+    mock_supervisor_comms.send.side_effect = slice_values
+    it = LazyXComIterator(seq=lazy_sequence, index=19, dir=-1)
+    assert list(it) == values[::-1]
+    assert [
+        (c.args[0].start, c.args[0].stop, c.args[0].step) for c in mock_supervisor_comms.send.call_args_list
+    ] == [(19, 3, -1), (3, None, -1)]
+
+
+@conf_vars({("workers", "xcom_sequence_prefetch"): "True"})
+def test_iter_prefetch(mock_supervisor_comms, lazy_sequence):
+    values = list(range(20))
+
+    def slice_values(msg):
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop : msg.step])
+
+    mock_supervisor_comms.send.side_effect = slice_values
+    it = iter(lazy_sequence)
+    assert next(it) == 0
+    # The second window is requested in the background before the first one is consumed
+    it._pending.result()
+    assert mock_supervisor_comms.send.call_count == 2
+    assert list(it) == values[1:]
+    assert mock_supervisor_comms.send.call_count == 2
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
@@ -26,6 +26,7 @@ import selectors
 import signal
 import socket
 import sys
+import threading
 import time
 from contextlib import nullcontext
 from operator import attrgetter
@@ -56,6 +57,8 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunType,
     TaskInstance,
     TaskInstanceState,
+    VariableResponse,
+    XComBulkItem,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType
 from airflow.sdk.execution_time import task_runner
@@ -85,6 +88,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceItem,
     GetXComSequenceSlice,
     HITLDetailRequestResult,
@@ -107,6 +111,7 @@ from airflow.sdk.execution_time.comms import (
     TriggerDagRun,
     ValidateInletsAndOutlets,
     VariableResult,
+    XComBulkResult,
     XComResult,
     XComSequenceIndexResult,
     XComSequenceSliceResult,
@@ -1983,6 +1988,33 @@ class TestHandleRequest:
                 None,
                 id="get_xcom_seq_slice",
             ),
+            pytest.param(
+                GetXComBulk(
+                    key="test_key",
+                    dag_id="test_dag",
+                    run_id="test_run",
+                    task_ids=["task_a", "task_b"],
+                    map_indexes=[0, 1],
+                ),
+                {
+                    "xcoms": [
+                        {"task_id": "task_a", "map_index": 0, "value": "foo"},
+                        {"task_id": "task_b", "map_index": 1, "value": "bar"},
+                    ],
+                    "type": "XComBulkResult",
+                },
+                "xcoms.get_bulk",
+                ("test_dag", "test_run", "test_key", ["task_a", "task_b"], [0, 1], False),
+                {},
+                XComBulkResult(
+                    xcoms=[
+                        XComBulkItem(task_id="task_a", map_index=0, value="foo"),
+                        XComBulkItem(task_id="task_b", map_index=1, value="bar"),
+                    ]
+                ),
+                None,
+                id="get_xcom_bulk",
+            ),
             pytest.param(
                 CreateHITLDetailPayload(
                     ti_id=TI_ID,
@@ -2066,6 +2098,7 @@ class TestHandleRequest:
 
         req_frame = _RequestFrame(id=randint(1, 2**32 - 1), body=message.model_dump())
         generator.send(req_frame)
+        watched_subprocess._reap_requests(wait=True)
 
         if mask_secret_args:
             mock_mask_secret.assert_called_with(*mask_secret_args)
@@ -2118,6 +2151,7 @@ class TestHandleRequest:
         msg = SucceedTask(end_date=timezone.parse("2024-10-31T12:00:00Z"))
         req_frame = _RequestFrame(id=randint(1, 2**32 - 1), body=msg.model_dump())
         generator.send(req_frame)
+        watched_subprocess._reap_requests(wait=True)
 
         # Read response from the read end of the socket
         read_socket.settimeout(0.1)
@@ -2149,6 +2183,79 @@ class TestHandleRequest:
             "detail": error.response.json(),
         }
 
+    def test_handle_requests_does_not_block_on_api_server(self, watched_subprocess, mocker):
+        """Requests needing the API server are answered from a background thread."""
+        watched_subprocess, read_socket = watched_subprocess
+        mocker.patch("airflow.sdk.execution_time.supervisor.mask_secret")
+        release = threading.Event()
+
+        def slow_get(key):
+            release.wait(timeout=5)
+            return VariableResponse(key=key, value="value")
+
+        watched_subprocess.client.variables.get.side_effect = slow_get
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        req_frame = _RequestFrame(id=42, body=GetVariable(key="test_key").model_dump())
+        # Returns straight away, so that the selector loop can keep servicing the other sockets
+        generator.send(req_frame)
+
+        read_socket.setblocking(False)
+        with pytest.raises(BlockingIOError):
+            read_socket.recv(4)
+
+        release.set()
+        watched_subprocess._reap_requests(wait=True)
+
+        read_socket.setblocking(True)
+        read_socket.settimeout(1)
+        frame_len = int.from_bytes(read_socket.recv(4), "big")
+        frame = msgspec.msgpack.Decoder(_ResponseFrame).decode(read_socket.recv(frame_len))
+        assert frame.id == 42
+        assert frame.body == {"key": "test_key", "value": "value", "type": "VariableResult"}
+
+        # The background thread woke the selector up when it was done
+        events = watched_subprocess.selector.select(timeout=1)
+        assert [key.fileobj for key, _ in events] == [watched_subprocess._requests_done[0]]
+        watched_subprocess._shutdown_request_executor()
+
+    def test_handle_requests_background_error_is_raised(self, watched_subprocess, mocker):
+        watched_subprocess, _ = watched_subprocess
+        watched_subprocess.client.variables.get.side_effect = RuntimeError("boom")
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        generator.send(_RequestFrame(id=1, body=GetVariable(key="test_key").model_dump()))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            watched_subprocess._reap_requests(wait=True)
+        watched_subprocess._shutdown_request_executor()
+
+    def test_task_state_handled_inline(self, watched_subprocess, mocker):
+        watched_subprocess, _ = watched_subprocess
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        msg = TaskState(state=TaskInstanceState.FAILED, end_date=timezone.parse("2024-10-31T12:00:00Z"))
+        generator.send(_RequestFrame(id=1, body=msg.model_dump()))
+
+        assert watched_subprocess._terminal_state == TaskInstanceState.FAILED
+        assert watched_subprocess._request_executor is None
+
+    def test_terminal_state_requests_handled_inline(self, watched_subprocess, mocker):
+        """The API call is done before the selector loop can heartbeat again, and get a conflict."""
+        watched_subprocess, _ = watched_subprocess
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        msg = SucceedTask(end_date=timezone.parse("2024-10-31T12:00:00Z"))
+        generator.send(_RequestFrame(id=1, body=msg.model_dump()))
+
+        watched_subprocess.client.task_instances.succeed.assert_called_once()
+        assert watched_subprocess._terminal_state == TaskInstanceState.SUCCESS
+        assert watched_subprocess._request_executor is None
+
 
 class TestSetSupervisorComms:
     class DummyComms:
@@ -61,6 +61,7 @@ from airflow.sdk.api.datamodels._generated import (
     DagRunState,
     TaskInstance,
     TaskInstanceState,
+    XComBulkItem,
 )
 from airflow.sdk.bases.xcom import BaseXCom
 from airflow.sdk.definitions._internal.types import NOTSET, SET_DURING_EXECUTION, ArgNotSet
@@ -84,6 +85,7 @@ from airflow.sdk.execution_time.comms import (
     GetTICount,
     GetVariable,
     GetXCom,
+    GetXComBulk,
     GetXComSequenceSlice,
     OKResponse,
     PreviousDagRunResult,
@@ -99,6 +101,7 @@ from airflow.sdk.execution_time.comms import (
     TICount,
     TriggerDagRun,
     VariableResult,
+    XComBulkResult,
     XComResult,
     XComSequenceSliceResult,
 )
@@ -111,6 +114,7 @@ from airflow.sdk.execution_time.context import (
     VariableAccessor,
 )
 from airflow.sdk.execution_time.task_runner import (
+    PREPARSED_DAG_BAGS,
     RuntimeTaskInstance,
     TaskRunnerMarker,
     _push_xcom_if_needed,
@@ -183,6 +187,51 @@ def test_parse(test_dags_dir: Path, make_ti_context):
     assert isinstance(ti.task.dag, DAG)
 
 
+def test_parse_uses_preparsed_dag_bag(test_dags_dir: Path, make_ti_context):
+    """Test that a DagBag parsed by the parent process is used instead of parsing the file again."""
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="super_basic",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+        ),
+        dag_rel_path="super_basic.py",
+        bundle_info=BundleInfo(name="my-bundle", version=None),
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+    )
+    with DAG("super_basic") as dag:
+        task = BaseOperator(task_id="a")
+
+    with (
+        patch.dict(
+            os.environ,
+            {
+                "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST": json.dumps(
+                    [
+                        {
+                            "name": "my-bundle",
+                            "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                            "kwargs": {"path": str(test_dags_dir), "refresh_interval": 1},
+                        }
+                    ]
+                ),
+            },
+        ),
+        patch.dict(
+            PREPARSED_DAG_BAGS, {("my-bundle", None, "super_basic.py"): mock.Mock(dags={"super_basic": dag})}
+        ),
+        patch("airflow.models.dagbag.DagBag") as dag_bag,
+    ):
+        ti = parse(what, mock.Mock())
+
+    assert ti.task is task
+    dag_bag.assert_not_called()
+
+
 @pytest.mark.parametrize(
     ("dag_id", "task_id", "expected_error"),
     (
@@ -1418,6 +1467,14 @@ class TestRuntimeTaskInstance:
             print(f"{args=}, {kwargs=}, {msg=}")
             if isinstance(msg, GetXComSequenceSlice):
                 return XComSequenceSliceResult(root=[ser_value])
+            if isinstance(msg, GetXComBulk):
+                return XComBulkResult(
+                    xcoms=[
+                        XComBulkItem(task_id=task_id, map_index=map_index, value=ser_value)
+                        for task_id in msg.task_ids
+                        for map_index in msg.map_indexes or [-1]
+                    ]
+                )
             return XComResult(key="key", value=ser_value)
 
         mock_supervisor_comms.send.side_effect = mock_send_side_effect
@@ -1431,10 +1488,28 @@ class TestRuntimeTaskInstance:
         if not isinstance(map_indexes, Iterable):
             map_indexes = [map_indexes]
 
+        # Without task_ids (or None) expected behavior is to pull with calling task_id
+        task_ids = [
+            test_task_id if task_id is None or isinstance(task_id, ArgNotSet) else task_id
+            for task_id in task_ids
+        ]
+
+        if len(task_ids) * len(map_indexes) > 1:
+            # Pulling several XComs is done with a single bulk request
+            mock_supervisor_comms.send.assert_any_call(
+                GetXComBulk(
+                    key="key",
+                    dag_id="test_dag",
+                    run_id="test_run",
+                    task_ids=task_ids,
+                    map_indexes=None
+                    if map_indexes == [NOTSET]
+                    else [-1 if map_index is None else map_index for map_index in map_indexes],
+                ),
+            )
+            return
+
         for task_id in task_ids:
-            # Without task_ids (or None) expected behavior is to pull with calling task_id
-            if task_id is None or isinstance(task_id, ArgNotSet):
-                task_id = test_task_id
             for map_index in map_indexes:
                 if map_index == NOTSET:
                     mock_supervisor_comms.send.assert_any_call(
@@ -1506,7 +1581,11 @@ class TestRuntimeTaskInstance:
         task = CustomOperator(task_id=test_task_id)
         runtime_ti = create_runtime_ti(task=task)
 
-        with patch.object(XCom, "get_one") as mock_get_one, patch.object(XCom, "get_all") as mock_get_all:
+        with (
+            patch.object(XCom, "get_one") as mock_get_one,
+            patch.object(XCom, "get_all") as mock_get_all,
+            patch.object(XCom, "get_many") as mock_get_many,
+        ):
             if map_indexes == NOTSET:
                 # Use side_effect to return different values for different tasks
                 def mock_get_all_side_effect(task_id, **kwargs):
@@ -1515,6 +1594,10 @@ class TestRuntimeTaskInstance:
                     return [{"a": 1, "b": 2}]
 
                 mock_get_all.side_effect = mock_get_all_side_effect
+                mock_get_many.return_value = [
+                    ("task_a", 0, {"a": 1, "b": 2}),
+                    ("task_b", 0, {"c": 3, "d": 4}),
+                ]
                 mock_get_one.return_value = None
             else:
                 mock_get_one.return_value = {"a": 1, "b": 2}
@@ -1523,7 +1606,8 @@ class TestRuntimeTaskInstance:
             xcom = runtime_ti.xcom_pull(key="key", task_ids=task_ids, map_indexes=map_indexes)
             assert xcom == expected_value
             if map_indexes == NOTSET:
-                assert mock_get_all.called
+                # Several tasks are pulled in bulk, a single one through get_all
+                assert mock_get_all.called != mock_get_many.called
                 assert not mock_get_one.called
             else:
                 assert mock_get_one.called
@@ -1577,6 +1661,42 @@ class TestRuntimeTaskInstance:
             ),
         )
 
+    def test_render_templates_prefetches_xcom_pulls(self, create_runtime_ti, mock_supervisor_comms):
+        """XComs pulled by templates with literal arguments are fetched in one bulk request."""
+
+        class CustomOperator(BaseOperator):
+            template_fields = ("command",)
+
+            def __init__(self, command, **kwargs):
+                super().__init__(**kwargs)
+                self.command = command
+
+        task = CustomOperator(
+            task_id="pull_task",
+            command="{{ ti.xcom_pull(task_ids='task_a') }} {{ ti.xcom_pull(task_ids=['task_b', 'task_c']) }}",
+        )
+        runtime_ti = create_runtime_ti(task=task)
+
+        mock_supervisor_comms.send.return_value = XComBulkResult(
+            xcoms=[
+                XComBulkItem(task_id="task_a", map_index=-1, value=BaseXCom.serialize_value("a")),
+                XComBulkItem(task_id="task_b", map_index=-1, value=BaseXCom.serialize_value("b")),
+            ]
+        )
+
+        runtime_ti.render_templates()
+
+        assert runtime_ti.task.command == "a ['b', None]"
+        mock_supervisor_comms.send.assert_called_once_with(
+            GetXComBulk(
+                key="return_value",
+                dag_id=runtime_ti.dag_id,
+                run_id=runtime_ti.run_id,
+                task_ids=["task_a", "task_b", "task_c"],
+            ),
+        )
+        assert runtime_ti._xcom_prefetch is None
+
     def test_get_param_from_context(
         self, mocked_parse, make_ti_context, mock_supervisor_comms, create_runtime_ti
     ):